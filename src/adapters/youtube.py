@@ -11,12 +11,14 @@ allowing for future extensibility:
 
 import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
 
 from ..utils import get_logger
 
@@ -27,6 +29,12 @@ logger = get_logger(__name__)
 # - search.list: 100 units
 # - Default daily quota: 10,000 units
 
+# videos.list returns at most 50 items per page / per id batch
+_MAX_PAGE_SIZE = 50
+
+# Concurrent videos.list calls when fetching details for many ids
+_DETAIL_FETCH_WORKERS = 5
+
 
 @dataclass
 class VideoMetadata:
@@ -86,7 +94,7 @@ class YouTubeAdapter(ABC):
         Args:
             region_code: ISO 3166-1 alpha-2 country code
             category_id: YouTube video category ID (e.g., "28" for Science & Tech)
-            max_results: Maximum number of videos to return (max 50)
+            max_results: Maximum number of videos to return
 
         Returns:
             List of VideoMetadata objects
@@ -161,18 +169,28 @@ class YouTubeDataAPIAdapter(YouTubeAdapter):
     ) -> list[VideoMetadata]:
         """Fetch trending videos using videos.list with chart=mostPopular.
 
-        This is quota-efficient (1 unit) compared to search.list (100 units).
+        This is quota-efficient (1 unit per page) compared to search.list (100 units).
+        Results beyond 50 are paged via nextPageToken, which chains each page to
+        the previous response, so pages are necessarily fetched in order.
         """
         try:
-            request = self._youtube.videos().list(
-                part="snippet,statistics,contentDetails",
-                chart="mostPopular",
-                regionCode=region_code,
-                videoCategoryId=category_id,
-                maxResults=min(max_results, 50),
-            )
-            response = request.execute()
-            return self._parse_video_list_response(response)
+            videos: list[VideoMetadata] = []
+            page_token = None
+            while len(videos) < max_results:
+                request = self._youtube.videos().list(
+                    part="snippet,statistics,contentDetails",
+                    chart="mostPopular",
+                    regionCode=region_code,
+                    videoCategoryId=category_id,
+                    maxResults=min(max_results - len(videos), _MAX_PAGE_SIZE),
+                    pageToken=page_token,
+                )
+                response = request.execute()
+                videos.extend(self._parse_video_list_response(response))
+                page_token = response.get("nextPageToken")
+                if not page_token:
+                    break
+            return videos[:max_results]
 
         except HttpError as e:
             logger.error(f"YouTube API error fetching trending: {e}")
@@ -243,18 +261,20 @@ class YouTubeDataAPIAdapter(YouTubeAdapter):
             return []
 
         try:
-            # Batch video IDs (max 50 per request)
-            all_videos = []
-            for i in range(0, len(video_ids), 50):
-                batch = video_ids[i : i + 50]
-                request = self._youtube.videos().list(
-                    part="snippet,statistics,contentDetails",
-                    id=",".join(batch),
-                )
-                response = request.execute()
-                all_videos.extend(self._parse_video_list_response(response))
+            # Batch video IDs (max 50 per request); batches are independent, so
+            # fetch them concurrently and keep the original order
+            batches = [
+                video_ids[i : i + _MAX_PAGE_SIZE]
+                for i in range(0, len(video_ids), _MAX_PAGE_SIZE)
+            ]
+            if len(batches) == 1:
+                return self._fetch_video_batch(batches[0], http=None)
 
-            return all_videos
+            with ThreadPoolExecutor(max_workers=min(_DETAIL_FETCH_WORKERS, len(batches))) as pool:
+                # httplib2 connections aren't thread-safe; give each call its own
+                # (build_http applies the client library's default timeout)
+                results = pool.map(lambda b: self._fetch_video_batch(b, http=build_http()), batches)
+                return [video for batch in results for video in batch]
 
         except HttpError as e:
             logger.error(f"YouTube API error fetching video details: {e}")
@@ -263,6 +283,17 @@ class YouTubeDataAPIAdapter(YouTubeAdapter):
             logger.error(f"Unexpected error fetching video details: {e}")
             return []
 
+    def _fetch_video_batch(
+        self, video_ids: list[str], http: Optional[Any]
+    ) -> list[VideoMetadata]:
+        """Fetch one videos.list batch (up to 50 ids)."""
+        request = self._youtube.videos().list(
+            part="snippet,statistics,contentDetails",
+            id=",".join(video_ids),
+        )
+        response = request.execute(http=http) if http is not None else request.execute()
+        return self._parse_video_list_response(response)
+
     def get_trending_by_engagement_velocity(
         self,
         region_code: str = "US",
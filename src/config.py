@@ -40,6 +40,8 @@ class Settings(BaseSettings):
     video_height: int = Field(default=1080, alias="VIDEO_HEIGHT")
     max_duration_seconds: int = Field(default=300, alias="MAX_DURATION_SECONDS")
     background_color: str = Field(default="#1a1a2e", alias="BACKGROUND_COLOR")
+    x264_preset: str = Field(default="faster", alias="X264_PRESET")
+    video_encoder: str = Field(default="libx264", alias="VIDEO_ENCODER")
 
     # Subtitle Settings
     subtitle_font: str = Field(default="Montserrat-Bold", alias="SUBTITLE_FONT")
@@ -52,16 +54,22 @@ class Settings(BaseSettings):
 
     # Whisper Settings
     whisper_enabled: bool = Field(default=True, alias="WHISPER_ENABLED")
+    whisper_concurrency: int = Field(default=8, alias="WHISPER_CONCURRENCY")
 
     # Script Settings
     target_duration_seconds: int = Field(default=298, alias="TARGET_DURATION_SECONDS")
     target_word_count: int = Field(default=745, alias="TARGET_WORD_COUNT")
     llm_model: str = Field(default="gpt-4o", alias="LLM_MODEL")
+    ranker_concurrency: int = Field(default=10, alias="RANKER_CONCURRENCY")
+    llm_cache_ttl_days: int = Field(default=7, alias="LLM_CACHE_TTL_DAYS")
+    semantic_cache_threshold: float = Field(default=1.1, alias="SEMANTIC_CACHE_THRESHOLD")
 
     # RSS Feed Bundles Configuration
     rss_feed_bundles: Optional[str] = Field(default=None, alias="RSS_FEED_BUNDLES")
     rss_fetch_limit: int = Field(default=20, alias="RSS_FETCH_LIMIT")
     rss_cache_ttl_minutes: int = Field(default=30, alias="RSS_CACHE_TTL_MINUTES")
+    rss_fetch_concurrency: int = Field(default=8, alias="RSS_FETCH_CONCURRENCY")
+    rss_parse_processes: int = Field(default=0, alias="RSS_PARSE_PROCESSES")
 
     # arXiv Configuration
     arxiv_categories: list[str] = Field(
@@ -81,6 +89,8 @@ class Settings(BaseSettings):
     convergence_weight: float = Field(default=0.6, alias="CONVERGENCE_WEIGHT")
     convergence_cache_ttl_days: int = Field(default=30, alias="CONVERGENCE_CACHE_TTL_DAYS")
     embedding_model: str = Field(default="text-embedding-3-small", alias="EMBEDDING_MODEL")
+    lexicon_batch_api: bool = Field(default=False, alias="LEXICON_BATCH_API")
+    lexicon_batch_poll_seconds: int = Field(default=60, alias="LEXICON_BATCH_POLL_SECONDS")
 
     # Podcast branding
     podcast_name: str = Field(default="The Agentic Ledger", alias="PODCAST_NAME")
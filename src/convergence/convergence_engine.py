@@ -11,7 +11,7 @@ from openai import OpenAI
 from ..arxiv_client import ArxivClient, ArxivPaper
 from ..config import settings
 from ..news_ranker import RankedNewsItem
-from ..taxonomy import ArxivCategory, ArxivTaxonomyManager
+from ..taxonomy import ArxivCategory, ArxivTaxonomyManager, get_taxonomy_manager
 from ..utils import get_logger, openai_retry
 
 logger = get_logger(__name__)
@@ -95,9 +95,7 @@ class ConvergenceEngine:
             convergence_weight: Weight for convergence vs impact score
         """
         self.openai_client = openai_client or OpenAI(api_key=settings.openai_api_key)
-        self.taxonomy_manager = taxonomy_manager or ArxivTaxonomyManager(
-            openai_client=self.openai_client
-        )
+        self.taxonomy_manager = taxonomy_manager or get_taxonomy_manager(openai_client=openai_client)
         self.arxiv_client = arxiv_client or ArxivClient(
             openai_client=self.openai_client
         )
@@ -181,6 +179,12 @@ class ConvergenceEngine:
 
         logger.info(f"Analyzing {len(ranked_items)} news items for convergence...")
 
+        # Embed every story in one API call up front; the per-item category
+        # lookups below then hit the taxonomy's embedding cache
+        self.taxonomy_manager.get_embeddings(
+            [self._news_text(ranked_item) for ranked_item in ranked_items]
+        )
+
         # Analyze each news item
         results = []
         for ranked_item in ranked_items:
@@ -206,16 +210,9 @@ class ConvergenceEngine:
         ranked_item: RankedNewsItem,
     ) -> list[CategoryMatch]:
         """Find matching arXiv categories for a news item."""
-        item = ranked_item.item
-
-        # Combine title and summary for embedding
-        text = item.title
-        if item.summary:
-            text = f"{text}\n\n{item.summary}"
-
         # Find matching categories
         matches = self.taxonomy_manager.find_matching_categories(
-            text=text,
+            text=self._news_text(ranked_item),
             top_k=settings.convergence_categories_per_news,
             min_similarity=settings.convergence_min_similarity,
         )
@@ -225,6 +222,14 @@ class ConvergenceEngine:
             for cat, score in matches
         ]
 
+    @staticmethod
+    def _news_text(ranked_item: RankedNewsItem) -> str:
+        """Combine title and summary into the text embedded for category matching."""
+        item = ranked_item.item
+        if item.summary:
+            return f"{item.title}\n\n{item.summary}"
+        return item.title
+
     def _find_categories_with_hints(
         self,
         ranked_item: RankedNewsItem,
@@ -382,12 +387,10 @@ class ConvergenceEngine:
             return 0.5  # Default middle score
 
     def _cosine_similarity(self, a: np.ndarray, b: np.ndarray) -> float:
-        """Calculate cosine similarity between two vectors."""
-        norm_a = np.linalg.norm(a)
-        norm_b = np.linalg.norm(b)
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
-        return float(np.dot(a, b) / (norm_a * norm_b))
+        """Calculate cosine similarity between two vectors (0.0 if either is zero)."""
+        # A zero vector makes the dot product 0, so clamping the denominator
+        # yields 0.0 without a branch
+        return float(np.dot(a, b) / max(float(np.linalg.norm(a) * np.linalg.norm(b)), 1e-12))
 
     def _calculate_convergence_score(
         self,
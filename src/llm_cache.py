@@ -0,0 +1,168 @@
+"""Content-addressed on-disk cache for LLM completions."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from .config import settings
+from .utils import get_logger
+
+logger = get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS completions (
+    key TEXT PRIMARY KEY,
+    content TEXT NOT NULL,
+    expires_at INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS embeddings (
+    key TEXT PRIMARY KEY,
+    namespace TEXT NOT NULL,
+    vector BLOB NOT NULL,
+    expires_at INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_embeddings_namespace ON embeddings (namespace)
+"""
+
+
+class LLMCache:
+    """SQLite-backed cache mapping request parameters to completion text.
+
+    Keys are a SHA-256 of the request parameters (model, prompt, sampling
+    settings), so identical requests on re-runs skip the API call. Entries
+    can also carry an input embedding, letting near-duplicate inputs reuse a
+    completion via cosine similarity. Cache failures are logged and treated
+    as misses.
+    """
+
+    def __init__(self, path: Optional[Path] = None, ttl_days: Optional[int] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite database path (defaults to temp_dir/llm_cache.db)
+            ttl_days: Days before an entry expires (defaults to settings.llm_cache_ttl_days)
+        """
+        self.path = path or settings.temp_dir / "llm_cache.db"
+        self.ttl_seconds = (ttl_days if ttl_days is not None else settings.llm_cache_ttl_days) * 86400
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+
+    @staticmethod
+    def make_key(**params) -> str:
+        """Hash request parameters into a stable cache key."""
+        payload = json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use (caller holds the lock)."""
+        if self._db is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.executescript(_SCHEMA)
+            self._db.commit()
+        return self._db
+
+    def get(self, key: str) -> Optional[str]:
+        """Return cached completion text, or None on miss/expiry."""
+        if self.ttl_seconds <= 0:
+            return None
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT content FROM completions WHERE key = ? AND expires_at > ?",
+                    (key, int(time.time())),
+                ).fetchone()
+            return row[0] if row else None
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache read failed: {e}")
+            return None
+
+    def set(self, key: str, content: str) -> None:
+        """Store completion text under a key."""
+        if self.ttl_seconds <= 0:
+            return
+        try:
+            with self._lock:
+                db = self._connect()
+                with db:
+                    db.execute(
+                        "INSERT OR REPLACE INTO completions (key, content, expires_at) VALUES (?, ?, ?)",
+                        (key, content, int(time.time()) + self.ttl_seconds),
+                    )
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache write failed: {e}")
+
+    def set_embedding(self, key: str, vector: list[float], namespace: str) -> None:
+        """Attach an input embedding to a cached completion for similarity lookups."""
+        if self.ttl_seconds <= 0:
+            return
+        normalized = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(normalized)
+        if norm == 0:
+            return
+        normalized /= norm
+        try:
+            with self._lock:
+                db = self._connect()
+                with db:
+                    db.execute(
+                        "INSERT OR REPLACE INTO embeddings (key, namespace, vector, expires_at) VALUES (?, ?, ?, ?)",
+                        (key, namespace, normalized.tobytes(), int(time.time()) + self.ttl_seconds),
+                    )
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache embedding write failed: {e}")
+
+    def get_similar(self, vector: list[float], namespace: str, threshold: float) -> Optional[str]:
+        """
+        Return the completion whose input embedding is most similar to vector.
+
+        Args:
+            vector: Embedding of the new input
+            namespace: Embedding namespace (one per prompt type)
+            threshold: Minimum cosine similarity for a hit
+
+        Returns:
+            Cached completion text, or None if nothing is similar enough
+        """
+        if self.ttl_seconds <= 0:
+            return None
+        query = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            return None
+        now = int(time.time())
+        try:
+            with self._lock:
+                db = self._connect()
+                rows = db.execute(
+                    "SELECT key, vector FROM embeddings WHERE namespace = ? AND expires_at > ?",
+                    (namespace, now),
+                ).fetchall()
+                rows = [row for row in rows if len(row[1]) == query.nbytes]
+                if not rows:
+                    return None
+
+                matrix = np.frombuffer(b"".join(row[1] for row in rows), dtype=np.float32)
+                scores = matrix.reshape(len(rows), -1) @ (query / norm)
+                best = int(np.argmax(scores))
+                if scores[best] < threshold:
+                    return None
+
+                row = db.execute(
+                    "SELECT content FROM completions WHERE key = ? AND expires_at > ?",
+                    (rows[best][0], now),
+                ).fetchone()
+            if row:
+                logger.info(f"Semantic cache hit (similarity {scores[best]:.3f})")
+            return row[0] if row else None
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache similarity lookup failed: {e}")
+            return None
@@ -90,6 +90,11 @@ Workflow Phases:
         action="store_true",
         help="Generate category lexicons and output Google Alert phrases",
     )
+    parser.add_argument(
+        "--export-taxonomy",
+        action="store_true",
+        help="Embed the arXiv taxonomy and write it into the package as prebuilt data",
+    )
     parser.add_argument(
         "--lexicon-categories",
         type=str,
@@ -183,12 +188,14 @@ def run_pipeline(args: argparse.Namespace) -> int:
                 return 1
         else:
             logger.info(f"Fetching from {len(bundle_manager.bundles)} RSS bundles...")
-            rss_fetcher = RSSFetcher(
+            with RSSFetcher(
                 bundle_manager=bundle_manager,
                 cache_dir=settings.temp_dir,
                 cache_ttl_minutes=settings.rss_cache_ttl_minutes,
-            )
-            bundled_items = rss_fetcher.fetch_all_bundled(limit=settings.rss_fetch_limit)
+                max_workers=settings.rss_fetch_concurrency,
+                parse_processes=settings.rss_parse_processes,
+            ) as rss_fetcher:
+                bundled_items = rss_fetcher.fetch_all_bundled(limit=settings.rss_fetch_limit)
 
             # Save for potential re-use
             news_file = settings.temp_dir / "bundled_news.json"
@@ -403,8 +410,8 @@ def run_pipeline(args: argparse.Namespace) -> int:
 
                 logger.info("Transcribing audio segments via Whisper for karaoke subtitles...")
                 whisper = WhisperTranscriber()
-                transcriptions = whisper.transcribe_all(segment_infos)
-                logger.info(f"Whisper transcription complete: {len(transcriptions)} segments")
+                # Lazy: the subtitle writer consumes each segment as Whisper finishes it
+                transcriptions = whisper.iter_transcriptions(segment_infos)
             except Exception as e:
                 logger.warning(f"Whisper transcription failed: {e}, falling back to segment-level subtitles")
                 transcriptions = None
@@ -412,7 +419,14 @@ def run_pipeline(args: argparse.Namespace) -> int:
         # Step 5b: Generate subtitles
         logger.info("Generating subtitles...")
         subtitle_gen = SubtitleGenerator()
-        subtitle_path = subtitle_gen.generate(segment_infos, transcriptions=transcriptions)
+        try:
+            # Whisper actually runs here, as the generator consumes the iterator
+            subtitle_path = subtitle_gen.generate(segment_infos, transcriptions=transcriptions)
+        except Exception as e:
+            if transcriptions is None:
+                raise
+            logger.warning(f"Whisper transcription failed: {e}, falling back to segment-level subtitles")
+            subtitle_path = subtitle_gen.generate(segment_infos)
         logger.info(f"Subtitles generated: {subtitle_path}")
 
         # Step 5c: Plan and render scene cards (visual storyboard)
@@ -471,9 +485,9 @@ def run_pipeline(args: argparse.Namespace) -> int:
         # Build descriptive output filename: article_arxivpaper_timestamp.mp4
         article_slug = _slugify(top_news.title)
         paper_slug = _slugify(paper.arxiv_id if paper.arxiv_id != "placeholder" else paper.title)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_filename = f"{article_slug}_{paper_slug}_{timestamp}.mp4"
-        output_path = settings.output_dir / output_filename
+        # Stamp with the pipeline start time so the name is stable for the whole run
+        timestamp = start_time.strftime("%Y%m%d_%H%M%S")
+        output_path = settings.output_dir / f"{article_slug}_{paper_slug}_{timestamp}.mp4"
 
         output_video = video_renderer.render(
             audio_path,
@@ -636,6 +650,21 @@ def run_lexicon(args: argparse.Namespace) -> int:
         return 1
 
 
+def run_export_taxonomy(args: argparse.Namespace) -> int:
+    """Write prebuilt taxonomy embeddings for the configured embedding model."""
+    from .taxonomy import get_taxonomy_manager
+
+    settings.ensure_directories()
+
+    try:
+        path = get_taxonomy_manager().export_prebuilt()
+        print(f"Prebuilt taxonomy embeddings written to: {path}")
+        return 0
+    except Exception as e:
+        logger.exception(f"Taxonomy export failed: {e}")
+        return 1
+
+
 def main() -> int:
     """Main entry point."""
     args = parse_args()
@@ -648,6 +677,8 @@ def main() -> int:
 
     if args.lexicon:
         return run_lexicon(args)
+    elif args.export_taxonomy:
+        return run_export_taxonomy(args)
     elif args.sample:
         return run_sample(args)
     else:
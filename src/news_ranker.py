@@ -1,19 +1,23 @@
 """LLM-based news ranking by financial impact for The Agentic Ledger."""
 
+import hashlib
+import heapq
 import json
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Optional
 
 from openai import OpenAI
 
 from .config import settings
+from .llm_cache import LLMCache
 from .scraper import NewsItem
-from .utils import get_logger, openai_retry
+from .utils import get_logger, get_openai_client, openai_retry
 
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class RankedNewsItem:
     """A news item with its financial impact score and reasoning."""
 
@@ -72,31 +76,64 @@ Ask yourself: "Could an academic paper be written about the MECHANISM described
 - Distributed systems and consensus protocols
 - Optimization methods and quantitative techniques
 
-For each news item, provide:
+For the news item, provide:
 1. A score (1-10)
 2. Brief reasoning focusing on WHY it's structural or not
 
-OUTPUT FORMAT (JSON array):
-[
-  {"index": 0, "score": 9.0, "reasoning": "New consensus protocol with 40% latency improvement - structural"},
-  {"index": 1, "score": 2.0, "reasoning": "CEO commentary on AI future - business gossip, no technical content"}
-]
+OUTPUT FORMAT (JSON object):
+{"score": 9.0, "reasoning": "New consensus protocol with 40% latency improvement - structural"}
 """
 
+# Bump when RANKING_SYSTEM_PROMPT or the scoring format changes to invalidate cached rankings
+RANKING_PROMPT_VERSION = "2"
+
+# Reasoning attached to items whose score could not be parsed (never cached)
+UNPARSED_REASONING = "Unable to parse ranking for this item"
+
 
 class NewsRanker:
     """Ranks news items by financial impact using LLM analysis."""
 
-    def __init__(self, client: Optional[OpenAI] = None):
+    def __init__(self, client: Optional[OpenAI] = None, llm_cache: Optional[LLMCache] = None):
         """
         Initialize the news ranker.
 
         Args:
-            client: OpenAI client instance (creates one if not provided)
+            client: OpenAI client instance (uses the shared pooled client if not provided)
+            llm_cache: Cache for rankings of repeated candidate sets (creates one if not provided)
         """
-        self.client = client or OpenAI(api_key=settings.openai_api_key)
+        self.client = client or get_openai_client()
+        self.llm_cache = llm_cache or LLMCache()
+
+    @staticmethod
+    def _item_key(item: NewsItem) -> str:
+        """Stable identity for a news item within the ranking cache."""
+        return item.url or item.title
+
+    def _cache_key(self, items: list[NewsItem]) -> str:
+        """Content-address a candidate set, independent of input order."""
+        digest = hashlib.sha256(f"{RANKING_PROMPT_VERSION}:{settings.llm_model}".encode())
+        for key in sorted(self._item_key(item) for item in items):
+            digest.update(b"\n" + key.encode())
+        return digest.hexdigest()
+
+    def _rankings_from_cache(self, items: list[NewsItem], cache_key: str) -> Optional[list[RankedNewsItem]]:
+        """Rebuild rankings for items from a cached candidate set, if present."""
+        cached = self.llm_cache.get(cache_key)
+        if cached is None:
+            return None
+        try:
+            scores = json.loads(cached)
+        except json.JSONDecodeError:
+            return None
+        rankings = []
+        for item in items:
+            entry = scores.get(self._item_key(item))
+            if entry is None:
+                return None
+            rankings.append(RankedNewsItem(item=item, score=entry[0], reasoning=entry[1]))
+        return rankings
 
-    @openai_retry
     def rank_by_financial_impact(
         self,
         items: list[NewsItem],
@@ -105,6 +142,9 @@ class NewsRanker:
         """
         Rank news items by their financial impact.
 
+        Each item is scored independently (pointwise), so the LLM calls run
+        concurrently and wall-clock time tracks a single small request.
+
         Args:
             items: List of NewsItem objects to rank
             top_n: Number of top items to return
@@ -116,113 +156,129 @@ class NewsRanker:
             logger.warning("No items to rank")
             return []
 
+        cache_key = self._cache_key(items)
+        rankings = self._rankings_from_cache(items, cache_key)
+        if rankings is not None:
+            logger.info(f"Using cached ranking for {len(items)} news items")
+            return heapq.nlargest(top_n, rankings, key=lambda x: x.score)
+
         logger.info(f"Ranking {len(items)} news items by financial impact...")
 
-        # Format news items for the prompt
-        news_list = self._format_items_for_prompt(items)
+        workers = max(1, min(settings.ranker_concurrency, len(items)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(self._try_score_item, range(len(items)), items))
 
-        user_prompt = f"""Analyze and score these news items by financial market impact (1-10 scale):
+        entries = [entry for entry in results if entry is not None]
+        if not entries:
+            logger.error("Failed to rank news items: every scoring call failed")
+            # Fallback: return items in original order with default scores
+            return self._fallback_ranking(items, top_n)
 
-{news_list}
+        rankings = self._parse_rankings(entries, items)
 
-Return a JSON array with scores and brief reasoning for each item. Consider:
-- Direct market impact
-- Implications for AI/finance intersection
-- Regulatory significance
-- Innovation potential"""
+        # Only cache complete, fully parsed runs; failures should be retried next time
+        if len(entries) == len(items) and all(r.reasoning != UNPARSED_REASONING for r in rankings):
+            self.llm_cache.set(cache_key, json.dumps(
+                {self._item_key(r.item): [r.score, r.reasoning] for r in rankings},
+                separators=(",", ":"),
+            ))
 
-        try:
-            response = self.client.chat.completions.create(
-                model=settings.llm_model,
-                messages=[
-                    {"role": "system", "content": RANKING_SYSTEM_PROMPT},
-                    {"role": "user", "content": user_prompt},
-                ],
-                temperature=0.3,  # More deterministic for ranking
-                max_tokens=2000,
-                response_format={"type": "json_object"},
-            )
+        # Top N by score (highest first) without sorting the full list
+        top_items = heapq.nlargest(top_n, rankings, key=lambda x: x.score)
 
-            content = response.choices[0].message.content
-            rankings = self._parse_rankings(content, items)
+        logger.info(f"Top {len(top_items)} ranked items:")
+        for i, ranked in enumerate(top_items, 1):
+            logger.info(f"  {i}. [{ranked.score:.1f}] {ranked.item.title[:50]}...")
 
-            # Sort by score (highest first)
-            rankings.sort(key=lambda x: x.score, reverse=True)
+        return top_items
 
-            # Return top N
-            top_items = rankings[:top_n]
+    def _format_item_for_prompt(self, item: NewsItem) -> str:
+        """Format a single news item for the scoring prompt."""
+        line = f"[{item.source}] {item.title}"
+        if item.summary:
+            # Truncate long summaries
+            summary = item.summary[:300] + "..." if len(item.summary) > 300 else item.summary
+            line += f"\n{summary}"
+        return line
 
-            logger.info(f"Top {len(top_items)} ranked items:")
-            for i, ranked in enumerate(top_items, 1):
-                logger.info(f"  {i}. [{ranked.score:.1f}] {ranked.item.title[:50]}...")
+    def _try_score_item(self, index: int, item: NewsItem) -> Optional[dict]:
+        """Score one item, returning None once retries are exhausted."""
+        try:
+            return self._score_item(index, item)
+        except Exception as e:
+            logger.warning(f"Failed to score news item {index}: {e}")
+            return None
 
-            return top_items
+    @openai_retry
+    def _score_item(self, index: int, item: NewsItem) -> dict:
+        """
+        Score a single news item with the LLM.
 
-        except Exception as e:
-            logger.error(f"Failed to rank news items: {e}")
-            # Fallback: return items in original order with default scores
-            return self._fallback_ranking(items, top_n)
+        Args:
+            index: Position of the item in the candidate list
+            item: NewsItem to score
 
-    def _format_items_for_prompt(self, items: list[NewsItem]) -> str:
-        """Format news items as a numbered list for the prompt."""
-        lines = []
-        for i, item in enumerate(items):
-            line = f"{i}. [{item.source}] {item.title}"
-            if item.summary:
-                # Truncate long summaries
-                summary = item.summary[:200] + "..." if len(item.summary) > 200 else item.summary
-                line += f"\n   {summary}"
-            lines.append(line)
-        return "\n\n".join(lines)
+        Returns:
+            Ranking entry dict with index, score and reasoning
+        """
+        user_prompt = f"""Score this news item by financial market impact (1-10 scale):
+
+{self._format_item_for_prompt(item)}"""
+
+        response = self.client.chat.completions.create(
+            model=settings.llm_model,
+            messages=[
+                {"role": "system", "content": RANKING_SYSTEM_PROMPT},
+                {"role": "user", "content": user_prompt},
+            ],
+            temperature=0.3,  # More deterministic for ranking
+            max_tokens=150,
+            response_format={"type": "json_object"},
+        )
+
+        data = json.loads(response.choices[0].message.content)
+        return {
+            "index": index,
+            "score": data.get("score"),
+            "reasoning": data.get("reasoning", "No reasoning provided"),
+        }
 
     def _parse_rankings(
         self,
-        content: str,
+        ranking_list: list[dict],
         items: list[NewsItem],
     ) -> list[RankedNewsItem]:
-        """Parse LLM response into RankedNewsItem objects."""
+        """Turn per-item ranking entries into RankedNewsItem objects."""
         rankings = []
+        scored = [False] * len(items)
 
-        try:
-            data = json.loads(content)
-
-            # Handle both direct array and object with "rankings" key
-            if isinstance(data, list):
-                ranking_list = data
-            elif isinstance(data, dict):
-                ranking_list = data.get("rankings", data.get("items", data.get("scores", [])))
-            else:
-                raise ValueError(f"Unexpected response format: {type(data)}")
-
-            for entry in ranking_list:
+        for entry in ranking_list:
+            try:
                 idx = entry.get("index", 0)
                 score = float(entry.get("score", 5.0))
                 reasoning = entry.get("reasoning", "No reasoning provided")
+            except (TypeError, ValueError) as e:
+                logger.warning(f"Failed to parse ranking entry: {e}")
+                continue
 
-                # Clamp score to valid range
-                score = max(1.0, min(10.0, score))
+            # Clamp score to valid range
+            score = max(1.0, min(10.0, score))
 
-                if 0 <= idx < len(items):
-                    rankings.append(RankedNewsItem(
-                        item=items[idx],
-                        score=score,
-                        reasoning=reasoning,
-                    ))
-
-        except (json.JSONDecodeError, KeyError, TypeError) as e:
-            logger.warning(f"Failed to parse rankings: {e}")
-            # Try to extract scores from text if JSON parsing fails
-            rankings = self._fallback_ranking(items, len(items))
+            if 0 <= idx < len(items) and not scored[idx]:
+                scored[idx] = True
+                rankings.append(RankedNewsItem(
+                    item=items[idx],
+                    score=score,
+                    reasoning=reasoning,
+                ))
 
         # Ensure all items have a ranking
-        ranked_indices = {r.item.url or r.item.title for r in rankings}
-        for item in items:
-            key = item.url or item.title
-            if key not in ranked_indices:
+        for idx, was_scored in enumerate(scored):
+            if not was_scored:
                 rankings.append(RankedNewsItem(
-                    item=item,
+                    item=items[idx],
                     score=5.0,  # Default middle score
-                    reasoning="Unable to parse ranking for this item",
+                    reasoning=UNPARSED_REASONING,
                 ))
 
         return rankings
@@ -9,7 +9,7 @@ from ..utils import get_logger
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class RSSFeedBundle:
     """A collection of RSS feeds linked to arXiv categories."""
 
@@ -44,7 +44,7 @@ class RSSFeedBundle:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class BundledNewsItem:
     """NewsItem with bundle context for convergence hints."""
 
@@ -73,37 +73,44 @@ class BundleManager:
         """
         self.bundles = [b for b in bundles if b.enabled]
         self._code_to_bundles: dict[str, list[RSSFeedBundle]] = {}
+        self._url_to_bundle: dict[str, RSSFeedBundle] = {}
+        self._prioritized_bundles: list[RSSFeedBundle] = []
+        self._ordered_urls: list[str] = []
         self._build_index()
 
     def _build_index(self) -> None:
-        """Build reverse index from arxiv code to bundles."""
+        """Build reverse indexes (arxiv code -> bundles, url -> bundle) and priority order."""
         for bundle in self.bundles:
             for code in bundle.arxiv_codes:
                 if code not in self._code_to_bundles:
                     self._code_to_bundles[code] = []
                 self._code_to_bundles[code].append(bundle)
+            for url in bundle.feed_urls:
+                self._url_to_bundle.setdefault(url, bundle)
+
+        self._prioritized_bundles = sorted(self.bundles, key=lambda b: -b.priority)
+        seen = set()
+        for bundle in self._prioritized_bundles:
+            for url in bundle.feed_urls:
+                if url not in seen:
+                    self._ordered_urls.append(url)
+                    seen.add(url)
 
     def get_bundles_for_category(self, arxiv_code: str) -> list[RSSFeedBundle]:
         """Get all bundles aligned with an arXiv category."""
         return self._code_to_bundles.get(arxiv_code, [])
 
+    def get_prioritized_bundles(self) -> list[RSSFeedBundle]:
+        """Get bundles ordered by priority (highest first)."""
+        return self._prioritized_bundles
+
     def get_all_feed_urls(self) -> list[str]:
         """Get flat list of all feed URLs, prioritized by bundle priority."""
-        urls = []
-        seen = set()
-        for bundle in sorted(self.bundles, key=lambda b: -b.priority):
-            for url in bundle.feed_urls:
-                if url not in seen:
-                    urls.append(url)
-                    seen.add(url)
-        return urls
+        return list(self._ordered_urls)
 
     def get_bundle_for_url(self, url: str) -> Optional[RSSFeedBundle]:
         """Find which bundle a URL belongs to."""
-        for bundle in self.bundles:
-            if url in bundle.feed_urls:
-                return bundle
-        return None
+        return self._url_to_bundle.get(url)
 
     @classmethod
     def from_settings(cls, settings) -> "BundleManager":
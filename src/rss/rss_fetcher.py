@@ -1,16 +1,23 @@
 """RSS feed fetching with caching, bundle awareness, and hybrid fallback for The Agentic Ledger."""
 
-import hashlib
+import heapq
+import html
 import json
+import multiprocessing
 import re
+import sqlite3
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
-from urllib.parse import quote_plus
+from urllib.parse import quote_plus, urlsplit
 
 import feedparser
 import requests
+from requests.adapters import HTTPAdapter
 
 from ..scraper import NewsItem
 from ..utils import get_logger
@@ -29,8 +36,37 @@ USER_AGENT = (
 
 GOOGLE_NEWS_RSS_BASE = "https://news.google.com/rss/search"
 
+CACHE_DB_NAME = "cache.db"
 
-@dataclass
+SUMMARY_MAX_CHARS = 500
+
+# Sort key for undated items; all entry timestamps are normalized to aware UTC
+_OLDEST = datetime.min.replace(tzinfo=timezone.utc)
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
+_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS feeds (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    items BLOB,
+    fetched_at INTEGER
+)
+"""
+
+
+def _parse_feed_content(content: bytes) -> feedparser.FeedParserDict:
+    """Parse raw feed bytes (module-level so it can run in a worker process)."""
+    feed = feedparser.parse(content)
+    # Parser exceptions don't always pickle; callers only log them
+    if feed.get("bozo_exception") is not None:
+        feed["bozo_exception"] = str(feed["bozo_exception"])
+    return feed
+
+
+@dataclass(slots=True)
 class FeedCache:
     """Cache entry for an RSS feed."""
 
@@ -79,40 +115,113 @@ class RSSFetcher:
         bundle_manager: "BundleManager",
         cache_dir: Optional[Path] = None,
         cache_ttl_minutes: int = 30,
+        max_workers: int = 8,
+        parse_processes: int = 0,
     ):
         self.bundle_manager = bundle_manager
         self.feed_urls = bundle_manager.get_all_feed_urls()
         self.cache_dir = cache_dir or Path("temp")
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.cache_ttl_minutes = cache_ttl_minutes
+        self.max_workers = max(1, max_workers)
         self._seen_urls: set[str] = set()
         self._session = requests.Session()
         self._session.headers.update({"User-Agent": USER_AGENT})
-
-    def _get_cache_path(self, url: str) -> Path:
-        """Get the cache file path for a feed URL."""
-        url_hash = hashlib.md5(url.encode()).hexdigest()[:12]
-        return self.cache_dir / f"rss_cache_{url_hash}.json"
+        # Keep one keep-alive pool per feed host (most feeds share a few hosts) and
+        # size each pool so concurrent fetches don't discard connections
+        hosts = {urlsplit(url).netloc for url in self.feed_urls}
+        adapter = HTTPAdapter(
+            pool_connections=max(len(hosts), 1),
+            pool_maxsize=self.max_workers,
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        # feedparser is CPU-bound and holds the GIL; optionally parse in worker
+        # processes so concurrent fetches don't serialize on parsing
+        self.parse_processes = max(0, parse_processes)
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+
+        # All feeds share one SQLite cache; writes are serialized via a lock
+        # and, during fetch_all_bundled, batched into a single transaction
+        self._db_lock = threading.Lock()
+        self._pending_writes: Optional[list[tuple]] = None
+        self._db = sqlite3.connect(self.cache_dir / CACHE_DB_NAME, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(_CACHE_SCHEMA)
+        self._db.commit()
+
+    def close(self) -> None:
+        """Release pooled HTTP connections and the cache database."""
+        self._session.close()
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(wait=False, cancel_futures=True)
+            self._parse_pool = None
+        with self._db_lock:
+            self._db.close()
+
+    def __enter__(self) -> "RSSFetcher":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def _load_cache(self, url: str) -> Optional[FeedCache]:
         """Load cache entry for a feed URL."""
-        cache_path = self._get_cache_path(url)
-        if not cache_path.exists():
-            return None
         try:
-            data = json.loads(cache_path.read_text())
-            return FeedCache.from_dict(data)
-        except (json.JSONDecodeError, KeyError) as e:
+            with self._db_lock:
+                row = self._db.execute(
+                    "SELECT etag, last_modified, items, fetched_at FROM feeds WHERE url = ?",
+                    (url,),
+                ).fetchone()
+            if row is None:
+                return None
+            etag, last_modified, items, fetched_at = row
+            return FeedCache(
+                url=url,
+                etag=etag,
+                last_modified=last_modified,
+                items=json.loads(items) if items else [],
+                fetched_at=datetime.fromtimestamp(fetched_at) if fetched_at else None,
+            )
+        except (sqlite3.Error, json.JSONDecodeError) as e:
             logger.warning(f"Failed to load cache for {url}: {e}")
             return None
 
     def _save_cache(self, cache: FeedCache) -> None:
         """Save cache entry for a feed."""
-        cache_path = self._get_cache_path(cache.url)
+        row = (
+            cache.url,
+            cache.etag,
+            cache.last_modified,
+            json.dumps(cache.items, separators=(",", ":")).encode(),
+            int(cache.fetched_at.timestamp()) if cache.fetched_at else None,
+        )
+        with self._db_lock:
+            if self._pending_writes is not None:
+                self._pending_writes.append(row)
+                return
+            self._write_cache_rows([row])
+
+    def _write_cache_rows(self, rows: list[tuple]) -> None:
+        """Upsert cache rows in one transaction (caller holds the lock)."""
         try:
-            cache_path.write_text(json.dumps(cache.to_dict(), indent=2))
-        except Exception as e:
-            logger.warning(f"Failed to save cache for {cache.url}: {e}")
+            with self._db:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO feeds (url, etag, last_modified, items, fetched_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to save cache for {len(rows)} feed(s): {e}")
+
+    def _flush_cache_writes(self) -> None:
+        """Write any cache entries buffered during a batch fetch."""
+        with self._db_lock:
+            rows, self._pending_writes = self._pending_writes, None
+            if rows:
+                self._write_cache_rows(rows)
 
     def _http_get(self, url: str, etag: Optional[str] = None, modified: Optional[str] = None) -> requests.Response:
         """Fetch URL with requests, supporting conditional GET headers."""
@@ -125,7 +234,12 @@ class RSSFetcher:
 
     def _parse_feed_response(self, response: requests.Response) -> feedparser.FeedParserDict:
         """Parse HTTP response content with feedparser."""
-        return feedparser.parse(response.content)
+        if self._parse_pool is not None:
+            try:
+                return self._parse_pool.submit(_parse_feed_content, response.content).result()
+            except Exception as e:
+                logger.warning(f"Feed parse in worker failed, parsing in-process: {e}")
+        return _parse_feed_content(response.content)
 
     def _extract_query_from_alert_feed(self, feed: feedparser.FeedParserDict) -> Optional[str]:
         """Extract the search query from a Google Alert feed title.
@@ -143,24 +257,13 @@ class RSSFetcher:
         """Build a Google News RSS search URL from a query string."""
         return f"{GOOGLE_NEWS_RSS_BASE}?q={quote_plus(query)}&hl=en-US&gl=US&ceid=US:en"
 
-    def _entries_to_items(self, entries: list) -> tuple[list[NewsItem], list[dict]]:
-        """Convert feedparser entries to NewsItem list and cache dicts."""
+    def _entries_to_items(self, entries: list) -> list[NewsItem]:
+        """Convert feedparser entries to a NewsItem list."""
         items = []
-        cache_items = []
 
         for entry in entries:
             link = entry.get("link", "")
-            if link and link in self._seen_urls:
-                continue
-            if link:
-                self._seen_urls.add(link)
-
-            timestamp = None
-            if entry.get("published_parsed"):
-                try:
-                    timestamp = datetime(*entry.published_parsed[:6])
-                except Exception:
-                    pass
+            timestamp = self._entry_timestamp(entry)
 
             # Determine source from feed entry
             source = entry.get("source", {}).get("title", "RSS") if isinstance(entry.get("source"), dict) else "RSS"
@@ -173,15 +276,8 @@ class RSSFetcher:
                 timestamp=timestamp,
             )
             items.append(item)
-            cache_items.append({
-                "title": item.title,
-                "source": item.source,
-                "summary": item.summary,
-                "url": item.url,
-                "timestamp": item.timestamp.isoformat() if item.timestamp else None,
-            })
 
-        return items, cache_items
+        return items
 
     def fetch_feed(self, url: str) -> list[NewsItem]:
         """
@@ -221,7 +317,7 @@ class RSSFetcher:
                     return self._items_from_cache(cache)
                 return []
 
-            items, cache_items = self._entries_to_items(feed.entries)
+            items = self._entries_to_items(feed.entries)
 
             # --- Hybrid Fallback ---
             # If Google Alert feed returned 0 entries, try Google News RSS
@@ -229,10 +325,9 @@ class RSSFetcher:
                 query = self._extract_query_from_alert_feed(feed)
                 if query:
                     logger.info(f"Alert feed empty, falling back to Google News RSS for: {query[:60]}...")
-                    fallback_items, fallback_cache = self._fetch_google_news_fallback(query)
+                    fallback_items = self._fetch_google_news_fallback(query)
                     if fallback_items:
                         items = fallback_items
-                        cache_items = fallback_cache
                         logger.info(f"Google News fallback returned {len(items)} items")
 
             # Update cache
@@ -240,7 +335,7 @@ class RSSFetcher:
                 url=url,
                 etag=response.headers.get("ETag"),
                 last_modified=response.headers.get("Last-Modified"),
-                items=cache_items,
+                items=[item.to_dict() for item in items],
                 fetched_at=datetime.now(),
             )
             self._save_cache(new_cache)
@@ -264,7 +359,7 @@ class RSSFetcher:
         """Check if a URL is a Google Alerts RSS feed."""
         return "google.com/alerts/feeds/" in url
 
-    def _fetch_google_news_fallback(self, query: str) -> tuple[list[NewsItem], list[dict]]:
+    def _fetch_google_news_fallback(self, query: str) -> list[NewsItem]:
         """Fetch from Google News RSS as a fallback for empty Alert feeds."""
         fallback_url = self._build_google_news_url(query)
         try:
@@ -273,26 +368,23 @@ class RSSFetcher:
             feed = self._parse_feed_response(response)
             if feed.bozo and not feed.entries:
                 logger.warning(f"Google News fallback also failed: {feed.bozo_exception}")
-                return [], []
+                return []
             return self._entries_to_items(feed.entries)
         except Exception as e:
             logger.warning(f"Google News fallback error: {e}")
-            return [], []
+            return []
 
     def _items_from_cache(self, cache: FeedCache) -> list[NewsItem]:
         """Convert cached items to NewsItem objects."""
         items = []
         for item_data in cache.items:
             url = item_data.get("url", "")
-            if url and url in self._seen_urls:
-                continue
-            if url:
-                self._seen_urls.add(url)
-
             timestamp = None
             if item_data.get("timestamp"):
                 try:
                     timestamp = datetime.fromisoformat(item_data["timestamp"])
+                    if timestamp.tzinfo is None:
+                        timestamp = timestamp.replace(tzinfo=timezone.utc)
                 except Exception:
                     pass
 
@@ -305,19 +397,55 @@ class RSSFetcher:
             ))
         return items
 
+    def _entry_timestamp(self, entry: feedparser.FeedParserDict) -> Optional[datetime]:
+        """Get a timezone-aware publish time for a feed entry."""
+        published = entry.get("published")
+        if published:
+            try:
+                timestamp = parsedate_to_datetime(published)
+                # RFC 822 "-0000" means UTC with unknown local offset
+                if timestamp.tzinfo is None:
+                    timestamp = timestamp.replace(tzinfo=timezone.utc)
+                return timestamp
+            except (TypeError, ValueError):
+                pass
+        # Non-RFC 822 dates (e.g. Atom ISO 8601): feedparser's parse is in UTC
+        if entry.get("published_parsed"):
+            try:
+                return datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
+            except (TypeError, ValueError):
+                pass
+        return None
+
+    def _mark_seen(self, url: Optional[str]) -> bool:
+        """Record a news URL, returning False if it was already seen this run."""
+        if not url:
+            return True
+        if url in self._seen_urls:
+            return False
+        self._seen_urls.add(url)
+        return True
+
     def _clean_summary(self, summary: str) -> str:
         """Clean HTML and truncate summary."""
         if not summary:
             return ""
-        clean = re.sub(r"<[^>]+>", "", summary)
-        clean = clean.replace("&nbsp;", " ")
-        clean = clean.replace("&amp;", "&")
-        clean = clean.replace("&lt;", "<")
-        clean = clean.replace("&gt;", ">")
-        clean = clean.replace("&quot;", '"')
-        clean = re.sub(r"\s+", " ", clean).strip()
-        if len(clean) > 500:
-            clean = clean[:497] + "..."
+        # Fast path: most Google News/Alert bodies are already plain text
+        if "<" not in summary and "&" not in summary:
+            return self._truncate_summary(_WS_RE.sub(" ", summary).strip())
+
+        clean = _TAG_RE.sub("", summary) if "<" in summary else summary
+        if "&" in clean:
+            # Covers numeric and named entities (&#8217;, &rsquo;, &mdash;); &nbsp;
+            # becomes U+00A0, which the whitespace pass below normalizes
+            clean = html.unescape(clean)
+        return self._truncate_summary(_WS_RE.sub(" ", clean).strip())
+
+    @staticmethod
+    def _truncate_summary(clean: str) -> str:
+        """Cap a cleaned summary at SUMMARY_MAX_CHARS, marking the cut with an ellipsis."""
+        if len(clean) > SUMMARY_MAX_CHARS:
+            return clean[:SUMMARY_MAX_CHARS - 3] + "..."
         return clean
 
     def fetch_all_bundled(self, limit: int = 20) -> list["BundledNewsItem"]:
@@ -331,35 +459,51 @@ class RSSFetcher:
         logger.info(f"Fetching {len(self.feed_urls)} RSS feeds from {len(self.bundle_manager.bundles)} bundles...")
         self._seen_urls.clear()
 
+        # Fetch each unique feed concurrently (network-bound), then merge in
+        # bundle priority order so URL dedup stays deterministic
+        workers = min(self.max_workers, len(self.feed_urls)) or 1
+        if self.parse_processes and self._parse_pool is None and len(self.feed_urls) > 1:
+            # spawn, not fork: the pool starts while fetch threads are running
+            self._parse_pool = ProcessPoolExecutor(
+                max_workers=min(self.parse_processes, len(self.feed_urls)),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        with self._db_lock:
+            self._pending_writes = []
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                feed_items = dict(zip(self.feed_urls, pool.map(self.fetch_feed, self.feed_urls)))
+        finally:
+            self._flush_cache_writes()
+
         bundled_items: list[BundledNewsItem] = []
 
-        for bundle in sorted(self.bundle_manager.bundles, key=lambda b: -b.priority):
+        for bundle in self.bundle_manager.get_prioritized_bundles():
             for url in bundle.feed_urls:
-                items = self.fetch_feed(url)
-                for item in items:
+                for item in feed_items.get(url, []):
+                    if not self._mark_seen(item.url):
+                        continue
                     bundled_items.append(BundledNewsItem(
                         item=item,
                         bundle_name=bundle.name,
                         bundle_arxiv_codes=bundle.arxiv_codes,
                     ))
 
-        # Sort by timestamp (newest first) if available
-        bundled_items.sort(
-            key=lambda x: x.item.timestamp or datetime.min,
-            reverse=True,
+        # Newest `limit` items first (undated items sort last)
+        bundled_items = heapq.nlargest(
+            limit,
+            bundled_items,
+            key=lambda x: x.item.timestamp or _OLDEST,
         )
 
-        if len(bundled_items) > limit:
-            bundled_items = bundled_items[:limit]
-
         logger.info(f"Total RSS items fetched: {len(bundled_items)}")
         return bundled_items
 
     def clear_cache(self) -> None:
         """Remove all cached feed data."""
         logger.info("Clearing RSS cache...")
-        for cache_file in self.cache_dir.glob("rss_cache_*.json"):
-            try:
-                cache_file.unlink()
-            except Exception as e:
-                logger.warning(f"Failed to delete cache file {cache_file}: {e}")
+        try:
+            with self._db_lock, self._db:
+                self._db.execute("DELETE FROM feeds")
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to clear RSS cache: {e}")
@@ -4,18 +4,32 @@ Generates a timeline of 9 scene cards from script metadata,
 using one cheap LLM call (gpt-4o-mini) to extract visual copy.
 """
 
+from __future__ import annotations
+
+import hashlib
 import json
+import re
+import time
 from dataclasses import dataclass, field
+from datetime import date
 from enum import Enum
-from typing import Optional
+from itertools import islice
+from typing import TYPE_CHECKING, Callable, Optional
 
-from openai import OpenAI
+import numpy as np
 
-from .arxiv_client import ArxivPaper
 from .config import settings
-from .convergence.convergence_engine import ConvergenceResult
+from .llm_cache import LLMCache
 from .scraper import NewsItem
-from .utils import get_logger, openai_retry
+from .utils import get_logger, get_openai_client, openai_retry
+
+if TYPE_CHECKING:
+    # Annotation-only: importing these at runtime would pull in the
+    # convergence engine (taxonomy) and arXiv client on every import
+    from openai import OpenAI
+
+    from .arxiv_client import ArxivPaper
+    from .convergence.convergence_engine import ConvergenceResult
 
 logger = get_logger(__name__)
 
@@ -47,6 +61,58 @@ SCENE_TIMING = [
     (CardType.SUMMARY, 0.92, 1.00),
 ]
 
+# (start, end) fractions as one (9, 2) array, scaled by the audio duration in a single multiply
+_SCENE_FRACS = np.array([(start, end) for _card_type, start, end in SCENE_TIMING])
+
+# Fields the visual copy prompt asks for
+_VISUAL_COPY_FIELDS = """- "episode_topic": A concise 5-8 word topic line (e.g., "AI Trading Bots Beat Wall Street")
+- "headline_bullets": Array of exactly 3 key points from the news segment (each 8-15 words)
+- "bridge_insight": One sentence explaining the hidden mechanism connecting the news to the research (15-25 words)
+- "alpha_bullets": Array of exactly 3 actionable takeaways (each 8-15 words, start with a verb)
+- "key_takeaway": One memorable sentence summarizing the episode (10-20 words)
+- "context_stat": A single dramatic statistic from the story (e.g., "47% of hedge funds now use AI")
+- "context_explanation": Why that statistic matters (10-20 words)
+- "key_number": A single impactful number from the research (e.g., "$4.2B", "0.87", "3.2x")
+- "key_number_context": What that number represents (8-15 words)
+- "key_quote": One impactful sentence from the discussion worth highlighting (15-25 words)
+- "quote_attribution": Who said it or where it comes from (e.g., "QUANT", "Fed Research")
+- "news_one_liner": Single sentence summarizing the news story (10-15 words)"""
+
+# Static instructions live in the system message so every request shares an
+# identical prefix (eligible for OpenAI prompt caching); scripts go last
+VISUAL_COPY_SYSTEM_PROMPT = f"""You extract concise visual copy for podcast video cards. Return only valid JSON. Be specific and actionable.
+
+Analyze the podcast script and extract visual copy for on-screen cards. Return JSON with exactly these fields:
+{_VISUAL_COPY_FIELDS}"""
+
+# Embedding namespace for semantic visual copy cache entries
+_VISUAL_COPY_NAMESPACE = "visual_copy"
+
+# Scripts whose visual copy extraction exhausted retries skip the LLM for a
+# while (sha256 -> expiry); bounded so a long-lived process can't grow it
+_FAILED_SCRIPT_TTL_S = 3600.0
+_FAILED_SCRIPT_MAX = 1024
+_failed_scripts: dict[str, float] = {}
+
+# Sentence boundary: whitespace after terminal punctuation, or a line break
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+|\n+")
+
+
+def _first_sentences(text: str, n: int) -> list[str]:
+    """Return up to n non-empty sentences from text in a single split pass."""
+    sentences = (s.strip().rstrip(".") for s in _SENTENCE_SPLIT_RE.split(text))
+    return list(islice(filter(None, sentences), n))
+
+
+def _remember_failed_script(script_hash: str, now: float) -> None:
+    """Record a failed extraction, evicting expired (then oldest) entries when full."""
+    if len(_failed_scripts) >= _FAILED_SCRIPT_MAX:
+        for key in [k for k, expiry in _failed_scripts.items() if expiry <= now]:
+            del _failed_scripts[key]
+        while len(_failed_scripts) >= _FAILED_SCRIPT_MAX:
+            del _failed_scripts[next(iter(_failed_scripts))]
+    _failed_scripts[script_hash] = now + _FAILED_SCRIPT_TTL_S
+
 
 @dataclass
 class VisualCopy:
@@ -90,11 +156,117 @@ class SceneTimeline:
     visual_copy: VisualCopy
 
 
+def _title_content(visual_copy: VisualCopy, top_news: NewsItem, paper: ArxivPaper, today: str) -> dict:
+    """Title card: brand, episode topic and date."""
+    return {
+        "brand": settings.podcast_name,
+        "topic": visual_copy.episode_topic,
+        "date": today,
+    }
+
+
+def _context_content(visual_copy: VisualCopy, top_news: NewsItem, paper: ArxivPaper, today: str) -> dict:
+    """Context card: why-this-matters stat, explanation and news one-liner."""
+    return {
+        "section_label": "WHY THIS MATTERS",
+        "stat": visual_copy.context_stat or "Emerging trend",
+        "explanation": visual_copy.context_explanation or "A shift in how markets operate",
+        "one_liner": visual_copy.news_one_liner or top_news.title[:80],
+    }
+
+
+def _headline_content(visual_copy: VisualCopy, top_news: NewsItem, paper: ArxivPaper, today: str) -> dict:
+    """Headline card: news title, source and bullets."""
+    return {
+        "section_label": "THE NEWS",
+        "title": top_news.title,
+        "source": top_news.source,
+        "bullets": visual_copy.headline_bullets,
+    }
+
+
+def _key_stat_content(visual_copy: VisualCopy, top_news: NewsItem, paper: ArxivPaper, today: str) -> dict:
+    """Key-stat card: headline number and its context."""
+    return {
+        "number": visual_copy.key_number or "N/A",
+        "context": visual_copy.key_number_context or "Key metric from the research",
+    }
+
+
+def _bridge_content(visual_copy: VisualCopy, top_news: NewsItem, paper: ArxivPaper, today: str) -> dict:
+    """Bridge card: how the news connects to the paper."""
+    return {
+        "section_label": "THE CONNECTION",
+        "news_title": top_news.title,
+        "bridge_insight": visual_copy.bridge_insight,
+        "playbook_hint": visual_copy.alpha_bullets[0] if visual_copy.alpha_bullets else "",
+    }
+
+
+def _paper_content(visual_copy: VisualCopy, top_news: NewsItem, paper: ArxivPaper, today: str) -> dict:
+    """Paper card: title, abbreviated authors, key finding and arXiv ID."""
+    # Abbreviate authors: "Smith, J. et al."
+    authors = paper.authors[:3]
+    if len(paper.authors) > 3:
+        author_str = ", ".join(authors[:2]) + " et al."
+    else:
+        author_str = ", ".join(authors)
+
+    return {
+        "section_label": "THE PAPER",
+        "title": paper.title,
+        "authors": author_str,
+        "key_finding": paper.key_finding or "See abstract for details",
+        "arxiv_id": paper.arxiv_id,
+    }
+
+
+def _quote_content(visual_copy: VisualCopy, top_news: NewsItem, paper: ArxivPaper, today: str) -> dict:
+    """Quote card: key quote (or takeaway) and attribution."""
+    return {
+        "quote": visual_copy.key_quote or visual_copy.key_takeaway,
+        "attribution": visual_copy.quote_attribution or "THE AGENTIC LEDGER",
+    }
+
+
+def _alpha_content(visual_copy: VisualCopy, top_news: NewsItem, paper: ArxivPaper, today: str) -> dict:
+    """Alpha card: actionable insight bullets."""
+    return {
+        "section_label": "THE ALPHA",
+        "header": "ACTIONABLE INSIGHTS",
+        "bullets": visual_copy.alpha_bullets,
+    }
+
+
+def _summary_content(visual_copy: VisualCopy, top_news: NewsItem, paper: ArxivPaper, today: str) -> dict:
+    """Summary card: brand, topic and key takeaway."""
+    return {
+        "brand": settings.podcast_name,
+        "topic": visual_copy.episode_topic,
+        "key_takeaway": visual_copy.key_takeaway,
+    }
+
+
+# Card type -> content builder (visual_copy, top_news, paper, today) -> dict
+_CARD_BUILDERS: dict[CardType, Callable[[VisualCopy, NewsItem, ArxivPaper, str], dict]] = {
+    CardType.TITLE: _title_content,
+    CardType.CONTEXT: _context_content,
+    CardType.HEADLINE: _headline_content,
+    CardType.KEY_STAT: _key_stat_content,
+    CardType.BRIDGE: _bridge_content,
+    CardType.PAPER: _paper_content,
+    CardType.QUOTE: _quote_content,
+    CardType.ALPHA: _alpha_content,
+    CardType.SUMMARY: _summary_content,
+}
+
+
 class ScenePlanner:
     """Plans scene cards from script + metadata using one LLM call."""
 
-    def __init__(self, openai_client: Optional[OpenAI] = None):
-        self.openai_client = openai_client or OpenAI(api_key=settings.openai_api_key)
+    def __init__(self, openai_client: Optional[OpenAI] = None, llm_cache: Optional[LLMCache] = None):
+        self.openai_client = openai_client or get_openai_client()
+        self.llm_cache = llm_cache or LLMCache()
 
     def plan(
         self,
@@ -119,12 +291,20 @@ class ScenePlanner:
         """
         logger.info("Planning visual storyboard...")
 
-        # Extract visual copy via LLM (with fallback)
-        try:
-            visual_copy = self._extract_visual_copy(script)
-        except Exception as e:
-            logger.warning(f"LLM visual copy extraction failed: {e}, using fallback")
+        # Extract visual copy via LLM (with fallback); scripts that recently
+        # failed go straight to the fallback rather than failing again
+        script_hash = hashlib.sha256(script.encode()).hexdigest()
+        now = time.monotonic()
+        if _failed_scripts.get(script_hash, 0.0) > now:
+            logger.info("Visual copy extraction recently failed for this script, using fallback")
             visual_copy = self._fallback_visual_copy(top_news, paper)
+        else:
+            try:
+                visual_copy = self._extract_visual_copy(script, episode=(top_news.url, paper.arxiv_id))
+            except Exception as e:
+                logger.warning(f"LLM visual copy extraction failed: {e}, using fallback")
+                visual_copy = self._fallback_visual_copy(top_news, paper)
+                _remember_failed_script(script_hash, now)
 
         # Build timeline from visual copy + metadata
         cards = self._build_timeline(visual_copy, top_news, paper, audio_duration_s)
@@ -138,46 +318,98 @@ class ScenePlanner:
         logger.info(f"Storyboard planned: {len(cards)} scenes over {audio_duration_s:.1f}s")
         return timeline
 
-    @openai_retry
-    def _extract_visual_copy(self, script: str) -> VisualCopy:
-        """Extract visual copy from script using gpt-4o-mini."""
-        logger.info("Extracting visual copy via LLM...")
-
-        prompt = f"""Analyze this podcast script and extract visual copy for on-screen cards.
+    def _extract_visual_copy(
+        self,
+        script: str,
+        episode: Optional[tuple[Optional[str], str]] = None,
+    ) -> VisualCopy:
+        """
+        Extract visual copy from script using gpt-4o-mini (cached by prompt).
 
-SCRIPT:
-{script[:3000]}
+        Args:
+            script: Podcast script text
+            episode: (news URL, arXiv ID) the script covers; semantic cache
+                hits are only taken from scripts about the same story and paper
+        """
+        request = self._single_visual_copy_request(script)
+
+        cache_key = LLMCache.make_key(**request)
+        content = self.llm_cache.get(cache_key)
+        if content is not None:
+            logger.info("Using cached visual copy")
+            return self._parse_visual_copy(content)
+
+        # Near-duplicate scripts (small rewording on regeneration) reuse the
+        # closest cached visual copy instead of a fresh completion. Scoped to
+        # the same news item + paper: shared intro/outro boilerplate makes
+        # scripts about different stories look similar, and their copy
+        # carries story-specific headlines, numbers and quotes
+        namespace = None
+        embedding = None
+        if episode is not None and episode[0]:
+            namespace = f"{_VISUAL_COPY_NAMESPACE}:{LLMCache.make_key(news_url=episode[0], arxiv_id=episode[1])}"
+            embedding = self._embed_script(script)
+        if embedding is not None:
+            content = self.llm_cache.get_similar(
+                embedding, namespace, settings.semantic_cache_threshold
+            )
+            if content is not None:
+                logger.info("Using semantically cached visual copy")
+                return self._parse_visual_copy(content)
 
-Return JSON with exactly these fields:
-- "episode_topic": A concise 5-8 word topic line (e.g., "AI Trading Bots Beat Wall Street")
-- "headline_bullets": Array of exactly 3 key points from the news segment (each 8-15 words)
-- "bridge_insight": One sentence explaining the hidden mechanism connecting the news to the research (15-25 words)
-- "alpha_bullets": Array of exactly 3 actionable takeaways (each 8-15 words, start with a verb)
-- "key_takeaway": One memorable sentence summarizing the episode (10-20 words)
-- "context_stat": A single dramatic statistic from the story (e.g., "47% of hedge funds now use AI")
-- "context_explanation": Why that statistic matters (10-20 words)
-- "key_number": A single impactful number from the research (e.g., "$4.2B", "0.87", "3.2x")
-- "key_number_context": What that number represents (8-15 words)
-- "key_quote": One impactful sentence from the discussion worth highlighting (15-25 words)
-- "quote_attribution": Who said it or where it comes from (e.g., "QUANT", "Fed Research")
-- "news_one_liner": Single sentence summarizing the news story (10-15 words)"""
+        logger.info("Extracting visual copy via LLM...")
+        content = self._request_visual_copy(request)
+        visual_copy = self._parse_visual_copy(content)
+        self.llm_cache.set(cache_key, content)
+        if embedding is not None:
+            self.llm_cache.set_embedding(cache_key, embedding, namespace)
+        return visual_copy
+
+    def _embed_script(self, script: str) -> Optional[list[float]]:
+        """Embed a script for semantic cache lookups (None if disabled or failed)."""
+        if settings.semantic_cache_threshold > 1:
+            return None
+        try:
+            return self._request_script_embedding(script)
+        except Exception as e:
+            logger.warning(f"Script embedding failed, skipping semantic cache: {e}")
+            return None
 
-        response = self.openai_client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You extract concise visual copy for podcast video cards. "
-                    "Return only valid JSON. Be specific and actionable.",
-                },
-                {"role": "user", "content": prompt},
-            ],
-            response_format={"type": "json_object"},
-            temperature=0.3,
-            max_tokens=800,
+    @openai_retry
+    def _request_script_embedding(self, script: str) -> list[float]:
+        """Embed the start of a script (same truncation as the visual copy prompt)."""
+        response = self.openai_client.embeddings.create(
+            model=settings.embedding_model,
+            input=script[:3000],
         )
+        return response.data[0].embedding
+
+    def _single_visual_copy_request(self, script: str) -> dict:
+        """Build the chat completion request for one script."""
+        return self._visual_copy_request("SCRIPT:\n" + script[:3000], max_tokens=800)
+
+    def _visual_copy_request(self, user_content: str, max_tokens: int) -> dict:
+        """Wrap user content in the shared visual-copy request parameters."""
+        return {
+            "model": "gpt-4o-mini",
+            "messages": [
+                {"role": "system", "content": VISUAL_COPY_SYSTEM_PROMPT},
+                {"role": "user", "content": user_content},
+            ],
+            "response_format": {"type": "json_object"},
+            "temperature": 0.3,
+            "max_tokens": max_tokens,
+        }
 
-        data = json.loads(response.choices[0].message.content)
+    @openai_retry
+    def _request_visual_copy(self, request: dict) -> str:
+        """Call the LLM for visual copy and return the raw JSON text."""
+        response = self.openai_client.chat.completions.create(**request)
+        return response.choices[0].message.content
+
+    def _parse_visual_copy(self, content: str) -> VisualCopy:
+        """Validate LLM JSON output into a VisualCopy."""
+        data = json.loads(content)
 
         # Validate and coerce
         headline_bullets = data.get("headline_bullets", [])[:3]
@@ -212,8 +444,8 @@ Return JSON with exactly these fields:
 
         # Build bullets from summary
         summary = top_news.summary or ""
-        sentences = [s.strip() for s in summary.replace("\n", ". ").split(".") if s.strip()]
-        headline_bullets = sentences[:3]
+        sentences = _first_sentences(summary, 3)
+        headline_bullets = list(sentences)
         while len(headline_bullets) < 3:
             headline_bullets.append("Breaking developments in financial AI")
 
@@ -221,7 +453,7 @@ Return JSON with exactly these fields:
         bridge = paper.key_finding[:200] if paper.key_finding else "Research connects market patterns to underlying mechanisms"
 
         # Alpha bullets from paper abstract
-        abstract_sentences = [s.strip() for s in paper.abstract.split(".") if s.strip()][:3]
+        abstract_sentences = _first_sentences(paper.abstract, 3)
         alpha_bullets = [f"Apply: {s[:60]}" for s in abstract_sentences]
         while len(alpha_bullets) < 3:
             alpha_bullets.append("Monitor this research area for developments")
@@ -255,76 +487,11 @@ Return JSON with exactly these fields:
     ) -> list[SceneCard]:
         """Build scene cards with proportional timing."""
         cards = []
-        today = __import__("datetime").date.today().strftime("%B %d, %Y")
-
-        for card_type, start_frac, end_frac in SCENE_TIMING:
-            start_s = audio_duration_s * start_frac
-            end_s = audio_duration_s * end_frac
-
-            if card_type == CardType.TITLE:
-                content = {
-                    "brand": settings.podcast_name,
-                    "topic": visual_copy.episode_topic,
-                    "date": today,
-                }
-            elif card_type == CardType.CONTEXT:
-                content = {
-                    "section_label": "WHY THIS MATTERS",
-                    "stat": visual_copy.context_stat or "Emerging trend",
-                    "explanation": visual_copy.context_explanation or "A shift in how markets operate",
-                    "one_liner": visual_copy.news_one_liner or top_news.title[:80],
-                }
-            elif card_type == CardType.HEADLINE:
-                content = {
-                    "section_label": "THE NEWS",
-                    "title": top_news.title,
-                    "source": top_news.source,
-                    "bullets": visual_copy.headline_bullets,
-                }
-            elif card_type == CardType.KEY_STAT:
-                content = {
-                    "number": visual_copy.key_number or "N/A",
-                    "context": visual_copy.key_number_context or "Key metric from the research",
-                }
-            elif card_type == CardType.BRIDGE:
-                content = {
-                    "section_label": "THE CONNECTION",
-                    "news_title": top_news.title,
-                    "bridge_insight": visual_copy.bridge_insight,
-                    "playbook_hint": visual_copy.alpha_bullets[0] if visual_copy.alpha_bullets else "",
-                }
-            elif card_type == CardType.PAPER:
-                # Abbreviate authors: "Smith, J. et al."
-                authors = paper.authors[:3]
-                if len(paper.authors) > 3:
-                    author_str = ", ".join(authors[:2]) + " et al."
-                else:
-                    author_str = ", ".join(authors)
-
-                content = {
-                    "section_label": "THE PAPER",
-                    "title": paper.title,
-                    "authors": author_str,
-                    "key_finding": paper.key_finding or "See abstract for details",
-                    "arxiv_id": paper.arxiv_id,
-                }
-            elif card_type == CardType.QUOTE:
-                content = {
-                    "quote": visual_copy.key_quote or visual_copy.key_takeaway,
-                    "attribution": visual_copy.quote_attribution or "THE AGENTIC LEDGER",
-                }
-            elif card_type == CardType.ALPHA:
-                content = {
-                    "section_label": "THE ALPHA",
-                    "header": "ACTIONABLE INSIGHTS",
-                    "bullets": visual_copy.alpha_bullets,
-                }
-            elif card_type == CardType.SUMMARY:
-                content = {
-                    "brand": settings.podcast_name,
-                    "topic": visual_copy.episode_topic,
-                    "key_takeaway": visual_copy.key_takeaway,
-                }
+        today = date.today().strftime("%B %d, %Y")
+
+        times = (_SCENE_FRACS * audio_duration_s).tolist()
+        for (card_type, _start_frac, _end_frac), (start_s, end_s) in zip(SCENE_TIMING, times):
+            content = _CARD_BUILDERS[card_type](visual_copy, top_news, paper, today)
 
             cards.append(SceneCard(
                 card_type=card_type,
@@ -3,6 +3,7 @@
 import json
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -35,6 +36,29 @@ class NewsItem:
         }
 
 
+_YOUTUBE_SOURCE = "YouTube"
+
+
+def _video_summary(video: VideoMetadata) -> Optional[str]:
+    """Create a summary from video metadata and a description preview."""
+    views_per_hour = video.views_per_hour
+    parts = (
+        f"{video.view_count:,} views" if video.view_count else None,
+        f"{views_per_hour:,.0f} views/hour" if views_per_hour else None,
+        f"by {video.channel_title}" if video.channel_title else None,
+    )
+    summary = " | ".join(part for part in parts if part) or None
+
+    if video.description:
+        # Truncate description and append
+        desc_preview = video.description[:200]
+        if len(video.description) > 200:
+            desc_preview += "..."
+        summary = f"{summary}\n{desc_preview}" if summary else desc_preview
+
+    return summary
+
+
 class NewsScraper:
     """Scrapes news from X (via Grok) and YouTube trending."""
 
@@ -85,23 +109,32 @@ class NewsScraper:
         logger.info(f"Scraping X news with query: {query}")
         output_file = self.output_dir / "x_news.json"
 
+        # Stream stdout to a temp file next to the debug file; it only replaces
+        # the previous good x_news.json once the run succeeded with valid JSON
+        tmp_file = output_file.with_name(output_file.name + ".tmp")
         try:
-            result = subprocess.run(
-                ["openclaw", "skills", "run", "grok-search", "--query", query],
-                capture_output=True,
-                text=True,
-                timeout=120,
-            )
+            with open(tmp_file, "wb") as stdout_file:
+                result = subprocess.run(
+                    ["openclaw", "skills", "run", "grok-search", "--query", query],
+                    stdout=stdout_file,
+                    stderr=subprocess.PIPE,
+                    timeout=120,
+                )
 
             if result.returncode != 0:
-                logger.error(f"Grok search failed: {result.stderr}")
+                logger.error(f"Grok search failed: {result.stderr.decode(errors='replace')}")
                 return []
 
-            # Write raw output for debugging
-            output_file.write_text(result.stdout)
+            output = tmp_file.read_bytes()
+            try:
+                json.loads(output)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                logger.warning(f"Grok output is not valid JSON, keeping previous {output_file.name}")
+            else:
+                os.replace(tmp_file, output_file)
 
             # Parse the output
-            return self._parse_grok_output(result.stdout)
+            return self._parse_grok_output(output)
 
         except subprocess.TimeoutExpired:
             logger.error("Grok search timed out")
@@ -112,6 +145,8 @@ class NewsScraper:
         except Exception as e:
             logger.error(f"Error scraping X news: {e}")
             return []
+        finally:
+            tmp_file.unlink(missing_ok=True)
 
     def scrape_youtube_trending(
         self,
@@ -183,38 +218,19 @@ class NewsScraper:
         self, videos: list[VideoMetadata]
     ) -> list[NewsItem]:
         """Convert VideoMetadata objects to NewsItem objects."""
-        items = []
-        for video in videos:
-            # Create a summary from video metadata
-            summary_parts = []
-            if video.view_count:
-                summary_parts.append(f"{video.view_count:,} views")
-            if video.views_per_hour:
-                summary_parts.append(f"{video.views_per_hour:,.0f} views/hour")
-            if video.channel_title:
-                summary_parts.append(f"by {video.channel_title}")
-
-            summary = " | ".join(summary_parts) if summary_parts else None
-            if video.description:
-                # Truncate description and append
-                desc_preview = video.description[:200]
-                if len(video.description) > 200:
-                    desc_preview += "..."
-                summary = f"{summary}\n{desc_preview}" if summary else desc_preview
-
-            items.append(
-                NewsItem(
-                    title=video.title,
-                    source="YouTube",
-                    summary=summary,
-                    url=video.url,
-                    timestamp=video.published_at,
-                )
+        return [
+            NewsItem(
+                title=video.title,
+                source=_YOUTUBE_SOURCE,
+                summary=_video_summary(video),
+                url=video.url,
+                timestamp=video.published_at,
             )
-        return items
+            for video in videos
+        ]
 
-    def _parse_grok_output(self, output: str) -> list[NewsItem]:
-        """Parse Grok search output into NewsItem objects."""
+    def _parse_grok_output(self, output: bytes) -> list[NewsItem]:
+        """Parse raw Grok search output into NewsItem objects."""
         items = []
         try:
             data = json.loads(output)
@@ -240,14 +256,15 @@ class NewsScraper:
                             url=item.get("url"),
                         )
                     )
-        except json.JSONDecodeError:
+        except (json.JSONDecodeError, UnicodeDecodeError):
             # Try to parse as plain text
             logger.warning("Could not parse Grok output as JSON, treating as text")
+            text = output[:4000].decode("utf-8", errors="replace")
             items.append(
                 NewsItem(
                     title="Raw news from X",
                     source="X/Grok",
-                    summary=output[:1000] if output else None,
+                    summary=text[:1000] if text else None,
                 )
             )
         return items
@@ -261,21 +278,26 @@ class NewsScraper:
         """
         logger.info("Starting full news scrape...")
 
-        all_news = []
-        all_news.extend(self.scrape_x_news())
-        # Fetch Science & Technology trending videos (category_id="28")
-        all_news.extend(
-            self.scrape_youtube_trending(
-                category_id=YouTubeDataAPIAdapter.CATEGORY_SCIENCE_TECH
+        # Both sources are independent and I/O-bound (subprocess + HTTP API),
+        # so run them concurrently: wall time is the slower of the two
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            x_future = pool.submit(self.scrape_x_news)
+            # Fetch Science & Technology trending videos (category_id="28")
+            youtube_future = pool.submit(
+                self.scrape_youtube_trending,
+                category_id=YouTubeDataAPIAdapter.CATEGORY_SCIENCE_TECH,
             )
-        )
+
+        all_news = []
+        all_news.extend(x_future.result())
+        all_news.extend(youtube_future.result())
 
         logger.info(f"Scraped {len(all_news)} news items total")
 
         # Save combined results
         combined_file = self.output_dir / "raw_news.json"
         combined_data = [item.to_dict() for item in all_news]
-        combined_file.write_text(json.dumps(combined_data, indent=2))
+        combined_file.write_text(json.dumps(combined_data, separators=(",", ":")))
 
         return all_news
 
@@ -290,18 +312,17 @@ class NewsScraper:
             List of NewsItem objects
         """
         try:
-            data = json.loads(filepath.read_text())
-            items = []
-            for item in data:
-                items.append(
-                    NewsItem(
-                        title=item.get("title", ""),
-                        source=item.get("source", "Unknown"),
-                        summary=item.get("summary"),
-                        url=item.get("url"),
-                    )
+            # json.loads decodes UTF-8 bytes itself; no intermediate str
+            data = json.loads(filepath.read_bytes())
+            return [
+                NewsItem(
+                    title=item.get("title", ""),
+                    source=item.get("source", "Unknown"),
+                    summary=item.get("summary"),
+                    url=item.get("url"),
                 )
-            return items
+                for item in data
+            ]
         except Exception as e:
             logger.error(f"Error loading news from file: {e}")
             return []
@@ -1,7 +1,14 @@
 """Webpage screenshot capture using Playwright for video backgrounds."""
 
+import asyncio
+import bisect
+import hashlib
+import importlib.util
 import ipaddress
+import shutil
 import socket
+import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
@@ -28,6 +35,59 @@ _BLOCKED_NETWORKS = [
 ]
 
 
+def _build_ranges(networks, version: int) -> tuple[list[int], list[int]]:
+    """
+    Flatten networks of one IP version into sorted, disjoint (starts, ends) arrays.
+
+    Overlapping, nested and adjacent networks are merged, so the single
+    range found by bisection is the only one that can contain an address.
+    """
+    starts: list[int] = []
+    ends: list[int] = []
+    for lo, hi in sorted(
+        (int(n.network_address), int(n.broadcast_address))
+        for n in networks
+        if n.version == version
+    ):
+        if ends and lo <= ends[-1] + 1:
+            ends[-1] = max(ends[-1], hi)
+        else:
+            starts.append(lo)
+            ends.append(hi)
+    return starts, ends
+
+
+def _in_ranges(ranges: tuple[list[int], list[int]], value: int) -> bool:
+    """Check whether value falls inside one of the (starts, ends) ranges."""
+    starts, ends = ranges
+    i = bisect.bisect_right(starts, value) - 1
+    return i >= 0 and value <= ends[i]
+
+
+# Precomputed per-family interval arrays for O(log n) membership checks
+_BLOCKED_RANGES = {4: _build_ranges(_BLOCKED_NETWORKS, 4), 6: _build_ranges(_BLOCKED_NETWORKS, 6)}
+
+
+def _is_blocked_ip(ip: ipaddress.IPv4Address | ipaddress.IPv6Address) -> bool:
+    """Check whether an IP falls inside any blocked network."""
+    # Check IPv4-mapped IPv6 (::ffff:a.b.c.d) against the IPv4 ranges
+    if ip.version == 6 and ip.ipv4_mapped is not None:
+        ip = ip.ipv4_mapped
+    return _in_ranges(_BLOCKED_RANGES[ip.version], int(ip))
+
+
+# Video URLs aborted during capture (a still frame never needs them)
+_MEDIA_URL_GLOB = "**/*.{mp4,webm,m3u8,ts}"
+
+# Re-runs within this window reuse the previous render of the same URL
+SCREENSHOT_CACHE_TTL_S = 24 * 3600
+
+# Hostname -> (expires_at, is_safe); short TTL so DNS changes are picked up
+_HOST_VERDICT_TTL_S = 300.0
+_host_verdicts: dict[str, tuple[float, bool]] = {}
+_host_verdicts_lock = threading.Lock()
+
+
 def _is_safe_url(url: str) -> bool:
     """Validate that a URL is safe to fetch (SSRF protection).
 
@@ -46,6 +106,25 @@ def _is_safe_url(url: str) -> bool:
     if not hostname:
         return False
 
+    return _is_safe_hostname(hostname)
+
+
+def _is_safe_hostname(hostname: str) -> bool:
+    """Check that a hostname resolves only to public IPs, memoized for a short TTL."""
+    now = time.monotonic()
+    with _host_verdicts_lock:
+        cached = _host_verdicts.get(hostname)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
+    verdict = _resolve_is_public(hostname)
+    with _host_verdicts_lock:
+        _host_verdicts[hostname] = (now + _HOST_VERDICT_TTL_S, verdict)
+    return verdict
+
+
+def _resolve_is_public(hostname: str) -> bool:
+    """Resolve a hostname and reject it if any address is in a blocked range."""
     try:
         resolved_ips = socket.getaddrinfo(hostname, None, socket.AF_UNSPEC, socket.SOCK_STREAM)
     except socket.gaierror:
@@ -54,10 +133,9 @@ def _is_safe_url(url: str) -> bool:
 
     for _family, _type, _proto, _canonname, sockaddr in resolved_ips:
         ip = ipaddress.ip_address(sockaddr[0])
-        for network in _BLOCKED_NETWORKS:
-            if ip in network:
-                logger.warning(f"Blocked URL resolving to private IP: {hostname} -> {ip}")
-                return False
+        if _is_blocked_ip(ip):
+            logger.warning(f"Blocked URL resolving to private IP: {hostname} -> {ip}")
+            return False
 
     return True
 
@@ -73,9 +151,41 @@ class ScreenshotPair:
 class ScreenshotCapture:
     """Captures webpage screenshots using Playwright headless Chromium."""
 
-    def __init__(self, viewport_width: int = 1920, viewport_height: int = 1080):
+    def __init__(
+        self,
+        viewport_width: int = 1920,
+        viewport_height: int = 1080,
+        cache_dir: Optional[Path] = None,
+    ):
         self.viewport_width = viewport_width
         self.viewport_height = viewport_height
+        self.cache_dir = cache_dir or settings.temp_dir / "screenshots"
+
+    def _cache_path(self, url: str) -> Path:
+        """Content-address a screenshot by URL and viewport."""
+        key = f"{self.viewport_width}x{self.viewport_height}:{url}"
+        return self.cache_dir / f"{hashlib.sha256(key.encode()).hexdigest()[:16]}.png"
+
+    def _load_cached(self, url: str, output_path: Path) -> bool:
+        """Copy a fresh cached screenshot to output_path, if one exists."""
+        cache_path = self._cache_path(url)
+        try:
+            if time.time() - cache_path.stat().st_mtime > SCREENSHOT_CACHE_TTL_S:
+                return False
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(cache_path, output_path)
+        except OSError:
+            return False
+        logger.info(f"Using cached screenshot for {url}")
+        return True
+
+    def _store_cached(self, url: str, output_path: Path) -> None:
+        """Save a fresh capture into the screenshot cache."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(output_path, self._cache_path(url))
+        except OSError as e:
+            logger.warning(f"Failed to cache screenshot for {url}: {e}")
 
     def capture_webpage(self, url: str, output_path: Path, timeout_ms: int = 30000) -> bool:
         """
@@ -89,29 +199,96 @@ class ScreenshotCapture:
         Returns:
             True if capture succeeded, False otherwise
         """
-        if not _is_safe_url(url):
-            logger.error(f"URL blocked by SSRF protection: {url}")
-            return False
+        return self._capture_batch([(url, output_path)], timeout_ms=timeout_ms)[0]
 
-        try:
-            from playwright.sync_api import sync_playwright
-        except ImportError:
+    def _capture_batch(self, targets: list[tuple[str, Path]], timeout_ms: int = 30000) -> list[bool]:
+        """
+        Capture screenshots for several URLs with a single Chromium launch.
+
+        Cache misses are rendered concurrently, one page each, so wall time
+        tracks the slowest page rather than the sum.
+
+        Args:
+            targets: (url, output_path) pairs to capture
+            timeout_ms: Page load timeout in milliseconds, per URL
+
+        Returns:
+            Success flag per target, in input order
+        """
+        results = [False] * len(targets)
+
+        safe_indices = []
+        for i, (url, output_path) in enumerate(targets):
+            if not _is_safe_url(url):
+                logger.error(f"URL blocked by SSRF protection: {url}")
+            elif self._load_cached(url, output_path):
+                results[i] = True
+            else:
+                safe_indices.append(i)
+        if not safe_indices:
+            return results
+
+        if importlib.util.find_spec("playwright") is None:
             logger.error("Playwright not installed. Run: pip install playwright && playwright install chromium")
-            return False
+            return results
 
+        try:
+            captured = asyncio.run(self._capture_pages([targets[i] for i in safe_indices], timeout_ms))
+        except Exception as e:
+            logger.error(f"Screenshot browser failed: {e}")
+            return results
+
+        for i, ok in zip(safe_indices, captured):
+            results[i] = ok
+            if ok:
+                url, output_path = targets[i]
+                self._store_cached(url, output_path)
+
+        return results
+
+    async def _capture_pages(self, targets: list[tuple[str, Path]], timeout_ms: int) -> list[bool]:
+        """Launch one browser and capture all targets concurrently, one page each."""
+        from playwright.async_api import async_playwright
+
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True)
+            try:
+                return list(await asyncio.gather(*(
+                    self._capture_page(browser, url, output_path, timeout_ms)
+                    for url, output_path in targets
+                )))
+            finally:
+                await browser.close()
+
+    async def _capture_page(self, browser, url: str, output_path: Path, timeout_ms: int) -> bool:
+        """Capture one URL in a fresh page of an already-running browser."""
         logger.info(f"Capturing screenshot: {url}")
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page(
-                    viewport={"width": self.viewport_width, "height": self.viewport_height},
-                )
-                page.goto(url, wait_until="networkidle", timeout=timeout_ms)
-                page.screenshot(path=str(output_path), full_page=False)
-                browser.close()
+        async def _skip_media(route) -> None:
+            # Video never contributes to a still frame; skip downloading it
+            await route.abort()
 
+        page = None
+        try:
+            page = await browser.new_page(
+                viewport={"width": self.viewport_width, "height": self.viewport_height},
+            )
+            # Only media URLs are intercepted, so other requests keep the HTTP
+            # cache and never round-trip through Python
+            await page.route(_MEDIA_URL_GLOB, _skip_media)
+            # networkidle rarely settles on tracker-heavy news sites, so wait for
+            # the DOM, then give the load event and main content a short grace
+            await page.goto(url, wait_until="domcontentloaded", timeout=timeout_ms)
+            try:
+                await page.wait_for_load_state("load", timeout=5000)
+            except Exception:
+                logger.debug(f"Load event did not fire within 5s for {url}, capturing anyway")
+            try:
+                await page.wait_for_selector("main, article", timeout=2000)
+            except Exception:
+                logger.debug(f"No main/article element within 2s for {url}, capturing anyway")
+            await page.screenshot(path=str(output_path), full_page=False)
             logger.info(f"Screenshot saved: {output_path}")
             return True
 
@@ -119,6 +296,10 @@ class ScreenshotCapture:
             logger.error(f"Screenshot capture failed for {url}: {e}")
             return False
 
+        finally:
+            if page is not None:
+                await page.close()
+
     def capture_news_and_paper(
         self,
         news_url: Optional[str],
@@ -138,15 +319,24 @@ class ScreenshotCapture:
         temp_dir = settings.temp_dir
         temp_dir.mkdir(parents=True, exist_ok=True)
 
-        if news_url:
-            news_path = temp_dir / "news_screenshot.png"
-            if self.capture_webpage(news_url, news_path):
-                pair.news_screenshot = news_path
+        news_path = temp_dir / "news_screenshot.png"
+        paper_path = temp_dir / "paper_screenshot.png"
 
+        targets = []
+        if news_url:
+            targets.append((news_url, news_path))
         if arxiv_id:
-            paper_url = f"https://arxiv.org/abs/{arxiv_id}"
-            paper_path = temp_dir / "paper_screenshot.png"
-            if self.capture_webpage(paper_url, paper_path):
-                pair.paper_screenshot = paper_path
+            targets.append((f"https://arxiv.org/abs/{arxiv_id}", paper_path))
+        if not targets:
+            return pair
+
+        # One browser launch for both pages instead of one per URL
+        for (_url, path), ok in zip(targets, self._capture_batch(targets)):
+            if not ok:
+                continue
+            if path == news_path:
+                pair.news_screenshot = path
+            else:
+                pair.paper_screenshot = path
 
         return pair
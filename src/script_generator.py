@@ -1,9 +1,14 @@
 """LLM-based podcast script generation for The Agentic Ledger."""
 
+from collections.abc import Iterator
+from functools import lru_cache
+
 from openai import OpenAI
 
 from .config import settings
+from .llm_cache import LLMCache
 from .scraper import NewsItem
+from .script_parser import SPEAKER_TAG_PATTERN
 from .utils import get_logger, openai_retry
 
 logger = get_logger(__name__)
@@ -93,17 +98,60 @@ Target: {target_duration} seconds (~{target_words} words)
 Format: [SPEAKER:mood] dialogue"""
 
 
+def _max_script_tokens(target_words: int) -> int:
+    """Output token cap for a script of target_words.
+
+    ~1.3 tokens per English word plus a [SPEAKER:mood] tag (~6 tokens) every
+    dozen or so words gives ~1.8 tokens/word; 2x plus headroom leaves room
+    for the validator's upper bound while stopping runaway generations early.
+    """
+    return target_words * 2 + 200
+
+
+# Fixed cap used to retry a script that ran into _max_script_tokens
+SCRIPT_MAX_TOKENS_FALLBACK = 2500
+
+
+class ScriptTruncatedError(RuntimeError):
+    """The model stopped at max_tokens, so the script ends mid-line."""
+
+
+# Abstract budget in the user prompt
+ABSTRACT_MAX_CHARS = 500
+
+
+def _shorten_abstract(abstract: str) -> str:
+    """Trim an abstract to ABSTRACT_MAX_CHARS at a word boundary."""
+    if len(abstract) <= ABSTRACT_MAX_CHARS:
+        return abstract
+    cut = abstract[:ABSTRACT_MAX_CHARS].rsplit(" ", 1)[0]
+    return cut.rstrip(",;:") + "..."
+
+
+@lru_cache(maxsize=8)
+def _build_system_prompt(target_duration: int, target_words: int) -> str:
+    """Format SYSTEM_PROMPT once per settings combination.
+
+    The result is byte-identical across episodes, which keeps the large
+    shared prefix eligible for OpenAI prompt caching; per-episode values
+    belong in the user prompt only.
+    """
+    return SYSTEM_PROMPT.format(target_duration=target_duration, target_words=target_words)
+
+
 class ScriptGenerator:
     """Generates podcast scripts using OpenAI's LLM."""
 
-    def __init__(self, client: OpenAI | None = None):
+    def __init__(self, client: OpenAI | None = None, llm_cache: LLMCache | None = None):
         """
         Initialize the script generator.
 
         Args:
             client: OpenAI client instance (creates one if not provided)
+            llm_cache: Completion cache for repeated prompts (creates one if not provided)
         """
         self.client = client or OpenAI(api_key=settings.openai_api_key)
+        self.llm_cache = llm_cache or LLMCache()
 
     @openai_retry
     def generate(
@@ -112,59 +160,140 @@ class ScriptGenerator:
         paper_title: str,
         paper_abstract: str,
         paper_finding: str,
+        cache: bool = True,
     ) -> str:
         """
         Generate a podcast script from news and paper.
 
+        Identical prompts (same news, paper, model and sampling settings)
+        are served from the LLM cache unless cache is False.
+
         Args:
             top_news: The top-ranked news item for the episode
             paper_title: Title of the related arXiv paper
             paper_abstract: Abstract of the paper
             paper_finding: Key finding extracted from the paper
+            cache: Set False to force a fresh script (e.g. regeneration)
 
         Returns:
             Generated script with [SPEAKER:mood] tags
         """
+        cache_key = LLMCache.make_key(
+            **self._script_request(top_news, paper_title, paper_abstract, paper_finding)
+        )
+        if cache:
+            script = self.llm_cache.get(cache_key)
+            if script is not None:
+                logger.info(f"Using cached script for: {top_news.title[:50]}...")
+                return script
+
+        try:
+            script = "".join(self.stream_generate(top_news, paper_title, paper_abstract, paper_finding))
+        except ScriptTruncatedError:
+            # Never cache a cut-off script; retry once with the fixed cap
+            logger.warning(f"Script hit max_tokens, retrying with max_tokens={SCRIPT_MAX_TOKENS_FALLBACK}")
+            request = self._script_request(top_news, paper_title, paper_abstract, paper_finding)
+            request["max_tokens"] = SCRIPT_MAX_TOKENS_FALLBACK
+            script = "".join(self._stream_script(request))
+        logger.info(f"Generated script: {len(script)} characters")
+
+        # Validate the script
+        self._validate_script(script)
+
+        self.llm_cache.set(cache_key, script)
+        return script
+
+    def stream_generate(
+        self,
+        top_news: NewsItem,
+        paper_title: str,
+        paper_abstract: str,
+        paper_finding: str,
+    ) -> Iterator[str]:
+        """
+        Stream a podcast script line by line as the LLM produces it.
+
+        Each yielded string is one complete line including its trailing
+        newline (the last line may lack one), so downstream stages can start
+        on finished [SPEAKER:mood] lines before the whole script exists.
+        Joining the lines reproduces the full script. Not retried or
+        validated; use generate() when the complete script is needed.
+        Raises ScriptTruncatedError after the last line if the model
+        stopped at max_tokens.
+
+        Args:
+            top_news: The top-ranked news item for the episode
+            paper_title: Title of the related arXiv paper
+            paper_abstract: Abstract of the paper
+            paper_finding: Key finding extracted from the paper
+
+        Yields:
+            Script lines with [SPEAKER:mood] tags
+        """
         logger.info(f"Generating script for: {top_news.title[:50]}...")
         logger.info(f"Related paper: {paper_title[:50]}...")
 
-        # Build prompts with settings
-        system_prompt = SYSTEM_PROMPT.format(
-            target_duration=settings.target_duration_seconds,
-            target_words=settings.target_word_count,
-        )
+        request = self._script_request(top_news, paper_title, paper_abstract, paper_finding)
+
+        logger.debug(f"System prompt: {request['messages'][0]['content'][:200]}...")
+        logger.debug(f"User prompt: {request['messages'][1]['content'][:200]}...")
+
+        yield from self._stream_script(request)
+
+    def _stream_script(self, request: dict) -> Iterator[str]:
+        """Stream a chat completion as complete lines, raising if it hit max_tokens."""
+        response = self.client.chat.completions.create(**request, stream=True)
+
+        pending = ""
+        finish_reason = None
+        for chunk in response:
+            if not chunk.choices:
+                continue
+            choice = chunk.choices[0]
+            finish_reason = choice.finish_reason or finish_reason
+            delta = choice.delta.content
+            if not delta:
+                continue
+            pending += delta
+            if "\n" in pending:
+                *lines, pending = pending.split("\n")
+                for line in lines:
+                    yield line + "\n"
+        if pending:
+            yield pending
+        if finish_reason == "length":
+            raise ScriptTruncatedError(f"Script truncated at max_tokens={request['max_tokens']}")
+
+    def _script_request(
+        self,
+        top_news: NewsItem,
+        paper_title: str,
+        paper_abstract: str,
+        paper_finding: str,
+    ) -> dict:
+        """Build the chat completion parameters for a script (also the cache key input)."""
+        system_prompt = _build_system_prompt(settings.target_duration_seconds, settings.target_word_count)
 
         user_prompt = USER_PROMPT_TEMPLATE.format(
             news_title=top_news.title,
             news_summary=top_news.summary or "No summary available",
             news_source=top_news.source,
             paper_title=paper_title,
-            paper_abstract=paper_abstract[:500] + "..." if len(paper_abstract) > 500 else paper_abstract,
+            paper_abstract=_shorten_abstract(paper_abstract),
             paper_finding=paper_finding,
             target_duration=settings.target_duration_seconds,
             target_words=settings.target_word_count,
         )
 
-        logger.debug(f"System prompt: {system_prompt[:200]}...")
-        logger.debug(f"User prompt: {user_prompt[:200]}...")
-
-        response = self.client.chat.completions.create(
-            model=settings.llm_model,
-            messages=[
+        return {
+            "model": settings.llm_model,
+            "messages": [
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt},
             ],
-            temperature=0.8,  # Slightly creative but coherent
-            max_tokens=2500,  # Longer for 5-minute format
-        )
-
-        script = response.choices[0].message.content
-        logger.info(f"Generated script: {len(script)} characters")
-
-        # Validate the script
-        self._validate_script(script)
-
-        return script
+            "temperature": 0.8,  # Slightly creative but coherent
+            "max_tokens": _max_script_tokens(settings.target_word_count),
+        }
 
     def _validate_script(self, script: str) -> None:
         """
@@ -179,8 +308,9 @@ class ScriptGenerator:
         if not script:
             raise ValueError("Generated script is empty")
 
-        # Check for speaker tags
-        if "[QUANT" not in script and "[HUSTLER" not in script:
+        # Check for speaker tags (the same pattern the parser splits on, so a
+        # script that passes here is guaranteed to parse)
+        if not SPEAKER_TAG_PATTERN.search(script):
             raise ValueError("Script missing speaker tags")
 
         # Estimate word count
@@ -193,7 +323,7 @@ class ScriptGenerator:
             logger.warning(f"Script might be too long: {word_count} words (target: {settings.target_word_count})")
 
     @openai_retry
-    def generate_from_news_items(self, news_items: list[NewsItem]) -> str:
+    def generate_from_news_items(self, news_items: list[NewsItem], cache: bool = True) -> str:
         """
         Generate a script from a list of news items (legacy interface).
 
@@ -202,6 +332,7 @@ class ScriptGenerator:
 
         Args:
             news_items: List of NewsItem objects
+            cache: Set False to bypass the LLM cache
 
         Returns:
             Generated script with [SPEAKER:mood] tags
@@ -217,6 +348,7 @@ class ScriptGenerator:
             paper_title="Market Analysis Framework",
             paper_abstract="A general framework for analyzing market movements and their implications.",
             paper_finding="Systematic analysis of market signals can identify actionable opportunities.",
+            cache=cache,
         )
 
     def generate_from_text(self, raw_text: str) -> str:
@@ -1,19 +1,19 @@
 """Parser for podcast scripts with speaker tags."""
 
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Literal
 
 from .utils import get_logger
 
 logger = get_logger(__name__)
 
-# Pattern to match [SPEAKER:mood] or [SPEAKER] followed by text
-# Captures: (speaker, optional_mood, dialogue_text)
-DIALOGUE_PATTERN = re.compile(
-    r"\[(QUANT|HUSTLER)(?::(\w+))?\]\s*(.+?)(?=\[(?:QUANT|HUSTLER)|$)",
-    re.DOTALL | re.IGNORECASE,
-)
+# Pattern to match a [SPEAKER:mood] or [SPEAKER] tag; dialogue text is the
+# span between one tag's end and the next tag's start (single linear scan)
+# Captures: (speaker, optional_mood)
+SPEAKER_TAG_PATTERN = re.compile(r"\[(QUANT|HUSTLER)(?::(\w+))?\]", re.IGNORECASE)
+
+_WS_RE = re.compile(r"\s+")
 
 # Valid moods for TTS instructions
 VALID_MOODS = {
@@ -50,6 +50,7 @@ class DialogueLine:
     text: str
     mood: str
     estimated_duration_seconds: float = 0.0
+    word_count: int = field(default=0, init=False)
 
     def __post_init__(self):
         """Validate and normalize the dialogue line."""
@@ -62,9 +63,11 @@ class DialogueLine:
             logger.warning(f"Unknown mood '{self.mood}', using default")
             self.mood = DEFAULT_MOODS.get(self.speaker, "neutral")
 
+        # Count words once so downstream phases don't re-split the text
+        self.word_count = len(self.text.split())
+
         # Estimate duration (rough: ~150 words per minute = 2.5 words per second)
-        word_count = len(self.text.split())
-        self.estimated_duration_seconds = word_count / 2.5
+        self.estimated_duration_seconds = self.word_count / 2.5
 
 
 class ScriptParser:
@@ -86,16 +89,19 @@ class ScriptParser:
         logger.info("Parsing script...")
 
         lines = []
-        matches = DIALOGUE_PATTERN.findall(script)
+        tags = list(SPEAKER_TAG_PATTERN.finditer(script))
 
-        if not matches:
+        if not tags:
             logger.error("No dialogue patterns found in script")
             raise ValueError("Script does not contain valid [SPEAKER:mood] tags")
 
-        for speaker, mood, text in matches:
+        ends = [tag.start() for tag in tags[1:]]
+        ends.append(len(script))
+
+        for tag, end in zip(tags, ends):
+            speaker, mood = tag.groups()
             # Clean up the text
-            text = text.strip()
-            text = re.sub(r"\s+", " ", text)  # Normalize whitespace
+            text = _WS_RE.sub(" ", script[tag.end():end]).strip()  # Normalize whitespace
 
             if not text:
                 continue
@@ -114,10 +120,15 @@ class ScriptParser:
 
     def _log_summary(self, lines: list[DialogueLine]) -> None:
         """Log a summary of the parsed script."""
-        quant_count = sum(1 for line in lines if line.speaker == "QUANT")
-        hustler_count = sum(1 for line in lines if line.speaker == "HUSTLER")
-        total_duration = sum(line.estimated_duration_seconds for line in lines)
-        total_words = sum(len(line.text.split()) for line in lines)
+        quant_count = hustler_count = total_words = 0
+        total_duration = 0.0
+        for line in lines:
+            if line.speaker == "QUANT":
+                quant_count += 1
+            elif line.speaker == "HUSTLER":
+                hustler_count += 1
+            total_words += line.word_count
+            total_duration += line.estimated_duration_seconds
 
         logger.info(
             f"Script summary: QUANT={quant_count} lines, HUSTLER={hustler_count} lines, "
@@ -161,7 +172,7 @@ class ScriptParser:
 
     def get_word_count(self, lines: list[DialogueLine]) -> int:
         """Get total word count of all dialogue lines."""
-        return sum(len(line.text.split()) for line in lines)
+        return sum(line.word_count for line in lines)
 
     def format_for_display(self, lines: list[DialogueLine]) -> str:
         """Format dialogue lines for human-readable display."""
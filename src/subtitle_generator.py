@@ -1,6 +1,11 @@
 """ASS subtitle generation with karaoke word-by-word highlighting."""
 
+import os
 import re
+import textwrap
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 from typing import Optional
 
@@ -33,19 +38,58 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 # Max visible characters per line before wrapping
 MAX_VISIBLE_CHARS_PER_LINE = 50
 
-
+# Greedy word wrap for segment-level text; long words stay whole
+_LINE_WRAPPER = textwrap.TextWrapper(
+    width=MAX_VISIBLE_CHARS_PER_LINE,
+    break_long_words=False,
+    break_on_hyphens=False,
+)
+
+# Karaoke fill tag, e.g. {\\kf42}
+_KF_TAG_RE = re.compile(r"\{\\kf\d+\}")
+
+# Backslash and braces are ASS override syntax; escaped in a single pass
+_ASS_ESCAPE = str.maketrans({"\\": "\\\\", "{": "\\{", "}": "\\}"})
+
+
+# Fixed segments for generate_sample (read-only)
+_SAMPLE_FILE = Path("sample.mp3")
+_SAMPLE_SEGMENTS: tuple[AudioSegmentInfo, ...] = (
+    AudioSegmentInfo(
+        speaker="QUANT",
+        text="The correlation between Fed announcements and crypto volatility just hit 0.87.",
+        mood="analytical",
+        start_ms=0,
+        end_ms=4000,
+        duration_ms=4000,
+        file_path=_SAMPLE_FILE,
+    ),
+    AudioSegmentInfo(
+        speaker="HUSTLER",
+        text="In English - when Powell talks, Bitcoin moves. And I've got a trade for that.",
+        mood="confident",
+        start_ms=3800,
+        end_ms=7500,
+        duration_ms=3700,
+        file_path=_SAMPLE_FILE,
+    ),
+)
+
+
+@lru_cache(maxsize=4096)
 def ms_to_ass_time(ms: int) -> str:
     """Convert milliseconds to ASS timestamp format (H:MM:SS.cc)."""
-    total_seconds = ms / 1000
-    hours = int(total_seconds // 3600)
-    minutes = int((total_seconds % 3600) // 60)
-    seconds = total_seconds % 60
-    return f"{hours}:{minutes:02d}:{seconds:05.2f}"
+    # Integer arithmetic, rounded to the nearest centisecond; carries into
+    # seconds/minutes instead of printing e.g. "59.999" as "60.00"
+    seconds, centis = divmod((ms + 5) // 10, 100)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}.{centis:02d}"
 
 
 def _strip_kf_tags(text: str) -> str:
     """Remove {\\kf...} tags to get visible text only."""
-    return re.sub(r"\{\\kf\d+\}", "", text)
+    return _KF_TAG_RE.sub("", text)
 
 
 class SubtitleGenerator:
@@ -66,7 +110,7 @@ class SubtitleGenerator:
         self,
         segment_infos: list[AudioSegmentInfo],
         output_path: Path | None = None,
-        transcriptions: Optional[list] = None,
+        transcriptions: Optional[Iterable] = None,
     ) -> Path:
         """
         Generate ASS subtitle file.
@@ -74,11 +118,14 @@ class SubtitleGenerator:
         If transcriptions are provided, generates karaoke subtitles with
         word-by-word \\kf highlighting. Otherwise falls back to segment-level
         subtitles (still uses the new smaller font and bottom positioning).
+        Transcriptions may be a lazy iterator (e.g. from
+        WhisperTranscriber.iter_transcriptions); events are written as each
+        one arrives.
 
         Args:
             segment_infos: List of AudioSegmentInfo with timing data
             output_path: Path to save the subtitle file
-            transcriptions: Optional list of SegmentTranscription from Whisper
+            transcriptions: Optional iterable of SegmentTranscription from Whisper
 
         Returns:
             Path to generated subtitle file
@@ -100,15 +147,35 @@ class SubtitleGenerator:
             margin_v=self.margin_v,
         )
 
-        if transcriptions:
-            events = self._generate_karaoke_events(transcriptions, segment_infos)
-            logger.info(f"Generated karaoke subtitles ({len(events)} events)")
+        # Pull the first transcription up front so an empty iterator still
+        # falls back to segment-level subtitles
+        pending = iter(transcriptions or ())
+        first = next(pending, None)
+
+        if first is not None:
+            events = self._generate_karaoke_events(chain((first,), pending), segment_infos)
+            kind = "karaoke"
         else:
             events = self._generate_segment_events(segment_infos)
-            logger.info(f"Generated segment-level subtitles ({len(events)} events)")
-
-        content = header + "\n".join(events) + "\n"
-        output_path.write_text(content)
+            kind = "segment-level"
+
+        # Stream events to disk as they are produced rather than building the
+        # whole file in memory; written to a temp file and renamed, so a
+        # transcription failure mid-stream never leaves a partial .ass behind
+        event_count = 0
+        tmp_path = output_path.with_name(output_path.name + ".tmp")
+        try:
+            with tmp_path.open("w", encoding="utf-8") as f:
+                f.write(header)
+                for event in events:
+                    f.write(event)
+                    f.write("\n")
+                    event_count += 1
+            os.replace(tmp_path, output_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+        logger.info(f"Generated {kind} subtitles ({event_count} events)")
 
         logger.info(f"Generated subtitles: {output_path}")
         return output_path
@@ -119,12 +186,10 @@ class SubtitleGenerator:
 
     def _generate_karaoke_events(
         self,
-        transcriptions: list,
+        transcriptions: Iterable,
         segment_infos: list[AudioSegmentInfo],
-    ) -> list[str]:
-        """Generate karaoke dialogue events from Whisper transcriptions."""
-        events = []
-
+    ) -> Iterator[str]:
+        """Yield karaoke dialogue events from Whisper transcriptions."""
         for trans in transcriptions:
             if not trans.words:
                 continue
@@ -151,11 +216,7 @@ class SubtitleGenerator:
             end_time = ms_to_ass_time(last_word_end_ms)
 
             text = "\\N".join(lines)
-            events.append(
-                f"Dialogue: 0,{start_time},{end_time},{style},,0,0,0,,{text}"
-            )
-
-        return events
+            yield f"Dialogue: 0,{start_time},{end_time},{style},,0,0,0,,{text}"
 
     def _wrap_karaoke_words(
         self, kf_words: list[tuple[int, str]]
@@ -172,26 +233,27 @@ class SubtitleGenerator:
         Returns:
             List of line strings with {\\kf} tags and space separators
         """
+        tagged = [f"{{\\kf{duration_cs}}}{word_text}" for duration_cs, word_text in kf_words]
+
+        # Decide line breaks on visible lengths alone, then join tagged slices
         lines = []
-        current_line_parts: list[str] = []
+        line_start = 0
         current_visible_len = 0
 
-        for duration_cs, word_text in kf_words:
+        for i, (_, word_text) in enumerate(kf_words):
             word_visible_len = len(word_text)
             # +1 for the space between words (if not first word on line)
-            needed = word_visible_len + (1 if current_line_parts else 0)
-
-            if current_visible_len + needed > MAX_VISIBLE_CHARS_PER_LINE and current_line_parts:
-                lines.append(" ".join(current_line_parts))
-                current_line_parts = []
-                current_visible_len = 0
+            needed = word_visible_len + (1 if i > line_start else 0)
 
-            tagged = f"{{\\kf{duration_cs}}}{word_text}"
-            current_line_parts.append(tagged)
-            current_visible_len += word_visible_len + (1 if len(current_line_parts) > 1 else 0)
+            if current_visible_len + needed > MAX_VISIBLE_CHARS_PER_LINE and i > line_start:
+                lines.append(" ".join(tagged[line_start:i]))
+                line_start = i
+                current_visible_len = word_visible_len
+            else:
+                current_visible_len += needed
 
-        if current_line_parts:
-            lines.append(" ".join(current_line_parts))
+        if line_start < len(tagged):
+            lines.append(" ".join(tagged[line_start:]))
 
         return lines
 
@@ -201,18 +263,14 @@ class SubtitleGenerator:
 
     def _generate_segment_events(
         self, segment_infos: list[AudioSegmentInfo]
-    ) -> list[str]:
-        """Generate segment-level dialogue events (no word highlighting)."""
-        events = []
+    ) -> Iterator[str]:
+        """Yield segment-level dialogue events (no word highlighting)."""
         for segment in segment_infos:
             start_time = ms_to_ass_time(segment.start_ms)
             end_time = ms_to_ass_time(segment.end_ms)
             style = "Quant" if segment.speaker == "QUANT" else "Hustler"
             text = self._format_text(segment.text)
-            events.append(
-                f"Dialogue: 0,{start_time},{end_time},{style},,0,0,0,,{text}"
-            )
-        return events
+            yield f"Dialogue: 0,{start_time},{end_time},{style},,0,0,0,,{text}"
 
     # ------------------------------------------------------------------
     # Text helpers
@@ -220,34 +278,14 @@ class SubtitleGenerator:
 
     def _escape_ass(self, text: str) -> str:
         """Escape special ASS characters in text."""
-        text = text.replace("\\", "\\\\")
-        text = text.replace("{", "\\{")
-        text = text.replace("}", "\\}")
-        return text
+        return text.translate(_ASS_ESCAPE)
 
     def _format_text(self, text: str) -> str:
         """Format and word-wrap plain text for ASS display."""
         text = self._escape_ass(text)
         text = text.replace("\n", "\\N")
 
-        words = text.split()
-        lines = []
-        current_line: list[str] = []
-        current_length = 0
-
-        for word in words:
-            if current_length + len(word) + 1 > MAX_VISIBLE_CHARS_PER_LINE and current_line:
-                lines.append(" ".join(current_line))
-                current_line = [word]
-                current_length = len(word)
-            else:
-                current_line.append(word)
-                current_length += len(word) + 1
-
-        if current_line:
-            lines.append(" ".join(current_line))
-
-        return "\\N".join(lines)
+        return "\\N".join(_LINE_WRAPPER.wrap(text))
 
     # ------------------------------------------------------------------
     # Sample / testing
@@ -255,26 +293,5 @@ class SubtitleGenerator:
 
     def generate_sample(self, output_path: Path | None = None) -> Path:
         """Generate sample subtitles for testing."""
-        sample_segments = [
-            AudioSegmentInfo(
-                speaker="QUANT",
-                text="The correlation between Fed announcements and crypto volatility just hit 0.87.",
-                mood="analytical",
-                start_ms=0,
-                end_ms=4000,
-                duration_ms=4000,
-                file_path=Path("sample.mp3"),
-            ),
-            AudioSegmentInfo(
-                speaker="HUSTLER",
-                text="In English - when Powell talks, Bitcoin moves. And I've got a trade for that.",
-                mood="confident",
-                start_ms=3800,
-                end_ms=7500,
-                duration_ms=3700,
-                file_path=Path("sample.mp3"),
-            ),
-        ]
-
         output_path = output_path or settings.output_dir / "sample_subtitles.ass"
-        return self.generate(sample_segments, output_path)
+        return self.generate(list(_SAMPLE_SEGMENTS), output_path)
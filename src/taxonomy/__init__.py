@@ -1,6 +1,6 @@
 """arXiv taxonomy management module."""
 
-from .arxiv_taxonomy import ArxivCategory, ArxivTaxonomyManager, TaxonomyCache
+from .arxiv_taxonomy import ArxivCategory, ArxivTaxonomyManager, TaxonomyCache, get_taxonomy_manager
 from .category_lexicon import (
     CategoryLexicon,
     CategoryLexiconGenerator,
@@ -12,6 +12,7 @@ __all__ = [
     "ArxivCategory",
     "ArxivTaxonomyManager",
     "TaxonomyCache",
+    "get_taxonomy_manager",
     "CategoryLexicon",
     "CategoryLexiconGenerator",
     "LexiconCache",
@@ -1,9 +1,16 @@
 """arXiv category taxonomy manager with cached embeddings."""
 
+import base64
 import hashlib
+import io
 import json
+import os
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -11,19 +18,26 @@ import numpy as np
 from openai import OpenAI
 
 from ..config import settings
+from ..llm_cache import LLMCache
 from ..utils import get_logger, openai_retry
 
 logger = get_logger(__name__)
 
+# In-process LRU bound for query embeddings (each ~6 KB as float32)
+EMBEDDING_CACHE_SIZE = 4096
 
-@dataclass
+
+@dataclass(slots=True)
 class ArxivCategory:
-    """Represents an arXiv category with its embedding."""
+    """Represents an arXiv category.
+
+    Embeddings are not stored per category: the taxonomy manager keeps them
+    as rows of one (N, D) matrix (see ArxivTaxonomyManager.category_embedding).
+    """
 
     code: str
     name: str
     description: str
-    embedding: Optional[list[float]] = None
 
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
@@ -31,7 +45,6 @@ class ArxivCategory:
             "code": self.code,
             "name": self.name,
             "description": self.description,
-            "embedding": self.embedding,
         }
 
     @classmethod
@@ -41,43 +54,62 @@ class ArxivCategory:
             code=data["code"],
             name=data["name"],
             description=data["description"],
-            embedding=data.get("embedding"),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TaxonomyCache:
     """Cache container with TTL expiration for taxonomy data."""
 
     categories: list[ArxivCategory]
-    created_at: datetime
+    # Unix timestamp, so validity checks need no datetime parsing
+    expires_at: float
     ttl_days: int
+    # ISO timestamp kept for humans reading the cache file; never parsed
+    created_at: str = ""
+
+    @classmethod
+    def create(cls, categories: list[ArxivCategory], ttl_days: int) -> "TaxonomyCache":
+        """Create a cache entry expiring ttl_days from now."""
+        now = datetime.now()
+        return cls(
+            categories=categories,
+            expires_at=(now + timedelta(days=ttl_days)).timestamp(),
+            ttl_days=ttl_days,
+            created_at=now.isoformat(),
+        )
 
     def is_valid(self) -> bool:
         """Check if the cache is still valid."""
-        expiry = self.created_at + timedelta(days=self.ttl_days)
-        return datetime.now() < expiry
+        return time.time() < self.expires_at
 
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
         return {
             "categories": [cat.to_dict() for cat in self.categories],
-            "created_at": self.created_at.isoformat(),
+            "expires_at": self.expires_at,
+            "created_at": self.created_at,
             "ttl_days": self.ttl_days,
         }
 
     @classmethod
     def from_dict(cls, data: dict) -> "TaxonomyCache":
         """Create from dictionary."""
+        expires_at = data.get("expires_at")
+        if expires_at is None:
+            # Caches written before expires_at existed
+            created_at = datetime.fromisoformat(data["created_at"])
+            expires_at = (created_at + timedelta(days=data["ttl_days"])).timestamp()
         return cls(
             categories=[ArxivCategory.from_dict(c) for c in data["categories"]],
-            created_at=datetime.fromisoformat(data["created_at"]),
+            expires_at=expires_at,
             ttl_days=data["ttl_days"],
+            created_at=data.get("created_at", ""),
         )
 
 
 # Hardcoded arXiv categories relevant for finance/AI intersection
-ARXIV_CATEGORIES = [
+ARXIV_CATEGORIES = (
     # Computer Science - AI/ML
     ArxivCategory(
         code="cs.AI",
@@ -239,7 +271,69 @@ ARXIV_CATEGORIES = [
         description="Statistical theory, estimation, testing, asymptotic theory, "
                    "mathematical foundations of machine learning.",
     ),
-]
+)
+
+# Cache-key component for the category set, computed once at import
+_CODES_SIGNATURE = ",".join(sorted(cat.code for cat in ARXIV_CATEGORIES))
+
+# Packaged per-model embedding matrices (see ArxivTaxonomyManager.export_prebuilt)
+PREBUILT_DIR = Path(__file__).parent / "prebuilt"
+
+
+@lru_cache(maxsize=None)
+def _taxonomy_cache_hash(embedding_model: str) -> str:
+    """Short hash identifying a (model, category set) taxonomy cache."""
+    hash_input = f"{embedding_model}:{_CODES_SIGNATURE}"
+    return hashlib.blake2b(hash_input.encode(), digest_size=6).hexdigest()
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalize matrix rows in place (float32); zero rows stay zero."""
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0  # zero vectors score 0 against everything
+    matrix /= norms
+    return matrix
+
+
+def _decode_embedding(data: str) -> np.ndarray:
+    """Decode a base64 embedding (packed little-endian float32) into a read-only array."""
+    return np.frombuffer(base64.b64decode(data), dtype="<f4")
+
+
+def _embeddings_npz(codes: list[str], matrix: np.ndarray) -> bytes:
+    """Serialize category embeddings as an .npz of codes + float16 (N, D) matrix.
+
+    float16 keeps ~3 significant digits, ample for ranking ~27 categories,
+    at a quarter of the float64 size and no float parsing on load.
+    """
+    buf = io.BytesIO()
+    np.savez(
+        buf,
+        codes=np.array(codes),
+        embeddings=matrix.astype(np.float16),
+    )
+    return buf.getvalue()
+
+
+def _read_embeddings(path: Path) -> dict[str, np.ndarray]:
+    """Read an embeddings .npz into code -> float32 row."""
+    with np.load(path) as stored:
+        return dict(zip(stored["codes"].tolist(), stored["embeddings"].astype(np.float32)))
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write bytes durably: one write to a temp file, fsync, then rename over path."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
 
 
 class ArxivTaxonomyManager:
@@ -251,6 +345,7 @@ class ArxivTaxonomyManager:
         ttl_days: Optional[int] = None,
         openai_client: Optional[OpenAI] = None,
         embedding_model: Optional[str] = None,
+        llm_cache: Optional[LLMCache] = None,
     ):
         """
         Initialize the taxonomy manager.
@@ -260,48 +355,103 @@ class ArxivTaxonomyManager:
             ttl_days: Time-to-live for cache in days
             openai_client: OpenAI client for generating embeddings
             embedding_model: Model to use for embeddings
+            llm_cache: Persistent cache for query embeddings across runs
         """
         self.cache_dir = cache_dir or settings.temp_dir
         self.ttl_days = ttl_days or settings.convergence_cache_ttl_days
         self.openai_client = openai_client or OpenAI(api_key=settings.openai_api_key)
         self.embedding_model = embedding_model or settings.embedding_model
+        self.llm_cache = llm_cache or LLMCache()
+        # Query embeddings keyed by a digest of the text (deterministic per model)
+        self._embedding_cache: OrderedDict[bytes, np.ndarray] = OrderedDict()
 
         self._categories: Optional[list[ArxivCategory]] = None
+        self._load_lock = threading.Lock()
+        # L2-normalized (N, D) float32 embedding matrix and its row -> category map
+        self._cat_matrix: Optional[np.ndarray] = None
+        self._matrix_categories: list[ArxivCategory] = []
+        self._row_by_code: dict[str, int] = {}
         self._cache_path = self._get_cache_path()
+        # Embeddings live in a float16 sidecar; the JSON holds metadata only
+        self._embeddings_path = self._cache_path.with_suffix(".npz")
 
     def _get_cache_path(self) -> Path:
         """Generate cache file path based on category codes."""
-        codes = sorted(cat.code for cat in ARXIV_CATEGORIES)
-        hash_input = f"{self.embedding_model}:{','.join(codes)}"
-        cache_hash = hashlib.md5(hash_input.encode()).hexdigest()[:12]
-        return self.cache_dir / f"arxiv_taxonomy_{cache_hash}.json"
+        return self.cache_dir / f"arxiv_taxonomy_{_taxonomy_cache_hash(self.embedding_model)}.json"
 
     def load_taxonomy(self) -> list[ArxivCategory]:
         """
         Load taxonomy with embeddings (from cache or generate new).
 
         Returns:
-            List of ArxivCategory objects with embeddings
+            List of ArxivCategory objects (embeddings via category_embedding)
         """
         if self._categories is not None:
             return self._categories
 
+        # Shared instances (get_taxonomy_manager) may be first used from several threads
+        with self._load_lock:
+            if self._categories is None:
+                self._load_taxonomy()
+        return self._categories
+
+    def _load_taxonomy(self) -> None:
+        """Populate categories and the embedding matrix (caller holds the lock)."""
+        # Embeddings shipped with the package need neither the network nor a TTL
+        prebuilt = self._load_prebuilt()
+        if prebuilt is not None:
+            logger.info(f"Loaded prebuilt taxonomy embeddings: {self._prebuilt_path}")
+            self._categories = list(ARXIV_CATEGORIES)
+            self._build_matrix(prebuilt)
+            return
+
         # Try loading from cache
         cached = self._load_cache()
         if cached and cached.is_valid():
-            logger.info(f"Loaded taxonomy from cache: {self._cache_path}")
-            self._categories = cached.categories
-            return self._categories
+            rows = self._load_cached_embeddings()
+            if rows:
+                logger.info(f"Loaded taxonomy from cache: {self._cache_path}")
+                self._categories = cached.categories
+                self._build_matrix(rows)
+                return
+            logger.warning("Taxonomy cache has no embeddings, regenerating")
 
         # Generate embeddings for all categories
         logger.info("Generating embeddings for taxonomy categories...")
-        self._categories = self._generate_embeddings(ARXIV_CATEGORIES.copy())
+        self._categories = list(ARXIV_CATEGORIES)
+        self._build_matrix(self._generate_embeddings(self._categories))
 
         # Save to cache
         self._save_cache(self._categories)
-        logger.info(f"Saved taxonomy cache to: {self._cache_path}")
 
-        return self._categories
+    def _build_matrix(self, rows: dict[str, np.ndarray]) -> None:
+        """Stack category embeddings into one L2-normalized matrix for matmul scoring.
+
+        Args:
+            rows: Embedding per category code; categories without one are
+                left out of the matrix
+        """
+        self._matrix_categories = [cat for cat in self._categories if cat.code in rows]
+        self._row_by_code = {cat.code: i for i, cat in enumerate(self._matrix_categories)}
+        if not self._matrix_categories:
+            self._cat_matrix = None
+            return
+
+        self._cat_matrix = _normalize_rows(np.stack([rows[cat.code] for cat in self._matrix_categories]))
+
+    def category_embedding(self, code: str) -> Optional[np.ndarray]:
+        """
+        Get the L2-normalized embedding of a category.
+
+        Args:
+            code: arXiv category code
+
+        Returns:
+            float32 row of the category matrix, or None if the category has no embedding
+        """
+        self.load_taxonomy()
+        row = self._row_by_code.get(code)
+        return None if row is None else self._cat_matrix[row]
 
     def _load_cache(self) -> Optional[TaxonomyCache]:
         """Load taxonomy cache from disk."""
@@ -309,25 +459,92 @@ class ArxivTaxonomyManager:
             return None
 
         try:
-            data = json.loads(self._cache_path.read_text())
+            data = json.loads(self._cache_path.read_bytes())
             return TaxonomyCache.from_dict(data)
-        except (json.JSONDecodeError, KeyError, ValueError) as e:
+        except (json.JSONDecodeError, KeyError, ValueError, OSError) as e:
             logger.warning(f"Failed to load taxonomy cache: {e}")
             return None
 
+    def _load_cached_embeddings(self) -> dict[str, np.ndarray]:
+        """Load the cache's float16 embedding sidecar (empty if missing or unreadable)."""
+        if not self._embeddings_path.exists():
+            return {}
+
+        try:
+            return _read_embeddings(self._embeddings_path)
+        except (KeyError, ValueError, OSError) as e:
+            logger.warning(f"Failed to load taxonomy embeddings: {e}")
+            return {}
+
+    @property
+    def _prebuilt_path(self) -> Path:
+        return PREBUILT_DIR / f"arxiv_taxonomy_{self.embedding_model}.npz"
+
+    def _load_prebuilt(self) -> Optional[dict[str, np.ndarray]]:
+        """Load packaged embeddings for this model if they cover the current categories."""
+        if not self._prebuilt_path.exists():
+            return None
+
+        try:
+            rows = _read_embeddings(self._prebuilt_path)
+        except (KeyError, ValueError, OSError) as e:
+            logger.warning(f"Failed to load prebuilt taxonomy embeddings: {e}")
+            return None
+
+        if rows.keys() != {cat.code for cat in ARXIV_CATEGORIES}:
+            logger.info("Prebuilt taxonomy embeddings don't match current categories, ignoring")
+            return None
+
+        return rows
+
+    def export_prebuilt(self) -> Path:
+        """
+        Write this model's category embeddings into the package (build step).
+
+        Returns:
+            Path of the written .npz
+
+        Raises:
+            ValueError: If any category is missing an embedding
+        """
+        categories = self.load_taxonomy()
+        if len(self._matrix_categories) != len(categories):
+            raise ValueError("Cannot export taxonomy: some categories have no embedding")
+
+        PREBUILT_DIR.mkdir(parents=True, exist_ok=True)
+        _write_atomic(self._prebuilt_path, self._matrix_npz())
+        logger.info(f"Exported prebuilt taxonomy embeddings to: {self._prebuilt_path}")
+        return self._prebuilt_path
+
     def _save_cache(self, categories: list[ArxivCategory]) -> None:
-        """Save taxonomy cache to disk."""
+        """Save taxonomy cache to disk (float16 embedding sidecar + JSON metadata)."""
+        # A cache without (all) embeddings would pin degraded matching for the
+        # whole TTL; leave it unwritten so the next run tries again
+        if self._cat_matrix is None or len(self._matrix_categories) != len(categories):
+            logger.warning("Taxonomy embeddings incomplete, not caching taxonomy")
+            return
+
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        cache = TaxonomyCache(
-            categories=categories,
-            created_at=datetime.now(),
-            ttl_days=self.ttl_days,
-        )
-        self._cache_path.write_text(json.dumps(cache.to_dict(), indent=2))
+        cache = TaxonomyCache.create(categories, self.ttl_days)
+
+        try:
+            _write_atomic(self._embeddings_path, self._matrix_npz())
+
+            # Metadata last: a JSON file on disk implies its sidecar is complete
+            metadata = json.dumps(cache.to_dict(), indent=2)
+            _write_atomic(self._cache_path, metadata.encode())
+        except OSError as e:
+            logger.warning(f"Failed to save taxonomy cache: {e}")
+            return
+        logger.info(f"Saved taxonomy cache to: {self._cache_path}")
+
+    def _matrix_npz(self) -> bytes:
+        """Serialize the category matrix with its row codes."""
+        return _embeddings_npz([cat.code for cat in self._matrix_categories], self._cat_matrix)
 
     @openai_retry
-    def _generate_embeddings(self, categories: list[ArxivCategory]) -> list[ArxivCategory]:
-        """Generate embeddings for all categories in a single batch."""
+    def _generate_embeddings(self, categories: list[ArxivCategory]) -> dict[str, np.ndarray]:
+        """Generate embeddings for all categories in a single batch (code -> row)."""
         # Prepare texts for embedding
         texts = [
             f"{cat.name}: {cat.description}"
@@ -335,43 +552,116 @@ class ArxivTaxonomyManager:
         ]
 
         try:
+            # base64 payloads decode straight to float32, skipping per-element
+            # Python floats
             response = self.openai_client.embeddings.create(
                 model=self.embedding_model,
                 input=texts,
+                encoding_format="base64",
             )
 
-            # Assign embeddings to categories
-            for i, cat in enumerate(categories):
-                cat.embedding = response.data[i].embedding
+            # Fill one preallocated float32 matrix straight from the response
+            rows = [_decode_embedding(item.embedding) for item in response.data]
+            matrix = np.empty((len(rows), len(rows[0])), dtype=np.float32)
+            for i, row in enumerate(rows):
+                matrix[i] = row
 
             logger.info(f"Generated embeddings for {len(categories)} categories")
-            return categories
+            return dict(zip((cat.code for cat in categories), matrix))
 
         except Exception as e:
             logger.error(f"Failed to generate embeddings: {e}")
-            # Return categories without embeddings as fallback
-            return categories
+            # No embeddings as fallback; matching uses default categories
+            return {}
 
-    @openai_retry
-    def get_embedding(self, text: str) -> Optional[list[float]]:
+    def get_embedding(self, text: str) -> Optional[np.ndarray]:
         """
         Get embedding for a single text.
 
+        Embeddings are deterministic per model, so repeated texts are served
+        from an in-process LRU, then from the persistent LLM cache, before
+        falling back to the API.
+
         Args:
             text: Text to embed
 
         Returns:
-            Embedding vector or None on failure
+            float32 embedding vector or None on failure
+        """
+        return self.get_embeddings([text])[0]
+
+    def get_embeddings(self, texts: list[str]) -> list[Optional[np.ndarray]]:
         """
+        Get embeddings for several texts, fetching all cache misses in one API call.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            float32 embedding vector (or None on failure) per text, in input order
+        """
+        results: list[Optional[np.ndarray]] = [None] * len(texts)
+        missing: dict[str, list[int]] = {}
+        for i, text in enumerate(texts):
+            embedding = self._cached_embedding(text)
+            if embedding is not None:
+                results[i] = embedding
+            else:
+                missing.setdefault(text, []).append(i)
+
+        if not missing:
+            return results
+
         try:
-            response = self.openai_client.embeddings.create(
-                model=self.embedding_model,
-                input=text,
-            )
-            return response.data[0].embedding
+            embeddings = self._request_embeddings(list(missing))
         except Exception as e:
             logger.error(f"Failed to get embedding: {e}")
+            return results
+
+        for (text, indices), encoded in zip(missing.items(), embeddings):
+            embedding = _decode_embedding(encoded)
+            self._remember_embedding(text, embedding, encoded)
+            for i in indices:
+                results[i] = embedding
+        return results
+
+    def _cached_embedding(self, text: str) -> Optional[np.ndarray]:
+        """Look a text up in the in-process LRU, then the persistent LLM cache."""
+        digest = hashlib.blake2b(text.encode(), digest_size=16).digest()
+        embedding = self._embedding_cache.get(digest)
+        if embedding is not None:
+            self._embedding_cache.move_to_end(digest)
+            return embedding
+
+        stored = self.llm_cache.get(self._embedding_key(text))
+        if stored is None:
             return None
+        embedding = _decode_embedding(stored)
+        self._remember_embedding(text, embedding)
+        return embedding
+
+    def _remember_embedding(self, text: str, embedding: np.ndarray, encoded: Optional[str] = None) -> None:
+        """Store an embedding in the LRU, and its base64 form in the persistent cache if given."""
+        digest = hashlib.blake2b(text.encode(), digest_size=16).digest()
+        self._embedding_cache[digest] = embedding
+        if len(self._embedding_cache) > EMBEDDING_CACHE_SIZE:
+            self._embedding_cache.popitem(last=False)
+        if encoded is not None:
+            self.llm_cache.set(self._embedding_key(text), encoded)
+
+    def _embedding_key(self, text: str) -> str:
+        """Persistent cache key for a text's base64 embedding."""
+        return LLMCache.make_key(model=self.embedding_model, input=text, encoding_format="base64")
+
+    @openai_retry
+    def _request_embeddings(self, texts: list[str]) -> list[str]:
+        """Call the embeddings API for a batch of texts (base64-encoded float32 vectors)."""
+        response = self.openai_client.embeddings.create(
+            model=self.embedding_model,
+            input=texts,
+            encoding_format="base64",
+        )
+        return [item.embedding for item in response.data]
 
     def find_matching_categories(
         self,
@@ -390,52 +680,85 @@ class ArxivTaxonomyManager:
         Returns:
             List of (category, similarity_score) tuples, sorted by score
         """
-        min_similarity = min_similarity or settings.convergence_min_similarity
-        categories = self.load_taxonomy()
+        return self.find_matching_categories_batch([text], top_k, min_similarity)[0]
 
-        # Get embedding for the input text
-        text_embedding = self.get_embedding(text)
-        if text_embedding is None:
-            logger.warning("Failed to embed text, falling back to default categories")
-            return self._fallback_categories(top_k)
+    def find_matching_categories_batch(
+        self,
+        texts: list[str],
+        top_k: int = 5,
+        min_similarity: Optional[float] = None,
+    ) -> list[list[tuple[ArxivCategory, float]]]:
+        """
+        Find matching categories for several texts at once.
 
-        text_embedding_np = np.array(text_embedding)
+        Embeds all texts in one API call and scores them against every
+        category with a single matrix product; results match calling
+        find_matching_categories per text.
 
-        # Calculate cosine similarity with each category
-        similarities = []
-        for cat in categories:
-            if cat.embedding is None:
-                continue
-
-            cat_embedding = np.array(cat.embedding)
-            similarity = self._cosine_similarity(text_embedding_np, cat_embedding)
-            similarities.append((cat, similarity))
+        Args:
+            texts: Texts to match against categories
+            top_k: Number of top matches to return per text
+            min_similarity: Minimum similarity threshold
 
-        # Sort by similarity (descending)
-        similarities.sort(key=lambda x: x[1], reverse=True)
+        Returns:
+            Per text, a list of (category, similarity_score) tuples sorted by score
+        """
+        min_similarity = min_similarity or settings.convergence_min_similarity
+        self.load_taxonomy()
+
+        embeddings = self.get_embeddings(texts)
+        results: list[list[tuple[ArxivCategory, float]]] = [[] for _ in texts]
+
+        embedded = []
+        for i, embedding in enumerate(embeddings):
+            if embedding is None:
+                logger.warning("Failed to embed text, falling back to default categories")
+                results[i] = self._fallback_categories(top_k)
+            else:
+                embedded.append(i)
+
+        if not embedded or self._cat_matrix is None or top_k <= 0:
+            return results
+
+        # Cosine similarity of every query against every category: one (B, N) product
+        queries = _normalize_rows(np.asarray([embeddings[i] for i in embedded], dtype=np.float32))
+        scores = queries @ self._cat_matrix.T
+
+        # Partial selection of the top K per row, then sort only those
+        k = min(top_k, scores.shape[1])
+        top = np.argpartition(scores, -k, axis=1)[:, -k:]
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        order = np.argsort(-top_scores, axis=1)
+        top = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+        for i, row, row_scores in zip(embedded, top, top_scores):
+            similarities = [
+                (self._matrix_categories[j], float(score))
+                for j, score in zip(row.tolist(), row_scores.tolist())
+            ]
+            results[i] = self._filter_matches(similarities, min_similarity)
+        return results
 
-        # Filter by minimum similarity and take top K
+    def _filter_matches(
+        self,
+        similarities: list[tuple[ArxivCategory, float]],
+        min_similarity: float,
+    ) -> list[tuple[ArxivCategory, float]]:
+        """Keep top-K matches above the threshold, or all of them if none qualify."""
         results = [
-            (cat, score) for cat, score in similarities[:top_k]
+            (cat, score) for cat, score in similarities
             if score >= min_similarity
         ]
 
         if not results:
             logger.warning(f"No categories matched above threshold {min_similarity}")
             # Return top matches anyway if nothing meets threshold
-            return similarities[:top_k]
+            return similarities
 
         logger.debug(f"Found {len(results)} matching categories for text")
         return results
 
-    def _cosine_similarity(self, a: np.ndarray, b: np.ndarray) -> float:
-        """Calculate cosine similarity between two vectors."""
-        norm_a = np.linalg.norm(a)
-        norm_b = np.linalg.norm(b)
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
-        return float(np.dot(a, b) / (norm_a * norm_b))
-
     def _fallback_categories(self, top_k: int) -> list[tuple[ArxivCategory, float]]:
         """Return default categories when embedding fails."""
         default_codes = ["cs.AI", "cs.LG", "q-fin.TR", "cs.CR", "q-fin.RM"]
@@ -449,3 +772,31 @@ class ArxivTaxonomyManager:
     def get_category_codes(self, categories: list[tuple[ArxivCategory, float]]) -> list[str]:
         """Extract category codes from category-score tuples."""
         return [cat.code for cat, _ in categories]
+
+
+@lru_cache(maxsize=8)
+def get_taxonomy_manager(
+    cache_dir: Optional[Path] = None,
+    ttl_days: Optional[int] = None,
+    embedding_model: Optional[str] = None,
+    openai_client: Optional[OpenAI] = None,
+) -> ArxivTaxonomyManager:
+    """
+    Get a shared taxonomy manager, so the taxonomy is loaded once per process.
+
+    Args:
+        cache_dir: Directory for caching taxonomy embeddings
+        ttl_days: Time-to-live for cache in days
+        embedding_model: Model to use for embeddings
+        openai_client: OpenAI client for embeddings (a caller-supplied client
+            gets its own manager; None shares one using the default client)
+
+    Returns:
+        ArxivTaxonomyManager shared by all callers with the same arguments
+    """
+    return ArxivTaxonomyManager(
+        cache_dir=cache_dir,
+        ttl_days=ttl_days,
+        openai_client=openai_client,
+        embedding_model=embedding_model,
+    )
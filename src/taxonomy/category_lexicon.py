@@ -1,8 +1,12 @@
 """Category lexicon generator for news-friendly search phrases."""
 
+import io
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from operator import attrgetter, itemgetter
 from pathlib import Path
 from typing import Optional
 
@@ -11,10 +15,26 @@ from openai import OpenAI
 
 from ..config import settings
 from ..utils import get_logger, openai_retry
-from .arxiv_taxonomy import ArxivCategory, ArxivTaxonomyManager
+from .arxiv_taxonomy import (
+    ArxivCategory,
+    ArxivTaxonomyManager,
+    _decode_embedding,
+    _write_atomic,
+    get_taxonomy_manager,
+)
 
 logger = get_logger(__name__)
 
+# Shared sort keys (no per-call closure allocation)
+_BY_CONFIDENCE = attrgetter("confidence")
+_BY_INDEX = itemgetter("index")
+
+# Max inputs per embeddings request (API limit)
+EMBEDDING_BATCH_SIZE = 2048
+
+# Batch API job states after which polling stops
+_BATCH_TERMINAL_STATES = frozenset({"completed", "failed", "expired", "cancelled"})
+
 
 LEXICON_SYSTEM_PROMPT = """You are an expert at creating search phrases that find NEWS about STRUCTURAL/TECHNICAL changes in a field.
 
@@ -68,7 +88,7 @@ OUTPUT FORMAT (JSON):
 """
 
 
-@dataclass
+@dataclass(slots=True)
 class LexiconPhrase:
     """A news-friendly phrase derived from an arXiv category."""
 
@@ -87,14 +107,10 @@ class LexiconPhrase:
     @classmethod
     def from_dict(cls, data: dict) -> "LexiconPhrase":
         """Deserialize from cache."""
-        return cls(
-            phrase=data["phrase"],
-            confidence=data["confidence"],
-            category_code=data["category_code"],
-        )
+        return cls(data["phrase"], data["confidence"], data["category_code"])
 
 
-@dataclass
+@dataclass(slots=True)
 class CategoryLexicon:
     """News-friendly lexicon for an arXiv category."""
 
@@ -102,23 +118,35 @@ class CategoryLexicon:
     category_name: str
     phrases: list[LexiconPhrase]
     generated_at: datetime
+    # get_top_phrases results by top_k (refresh_category builds a new lexicon)
+    _top_phrases: dict[int, list[str]] = field(default_factory=dict, init=False, repr=False, compare=False)
 
     def to_dict(self) -> dict:
-        """Serialize for caching."""
+        """Serialize for caching.
+
+        Phrases are stored as compact [phrase, confidence] pairs; their
+        category code is this lexicon's.
+        """
         return {
             "category_code": self.category_code,
             "category_name": self.category_name,
-            "phrases": [p.to_dict() for p in self.phrases],
+            "phrases": [[p.phrase, p.confidence] for p in self.phrases],
             "generated_at": self.generated_at.isoformat(),
         }
 
     @classmethod
     def from_dict(cls, data: dict) -> "CategoryLexicon":
-        """Deserialize from cache."""
+        """Deserialize from cache (pair or legacy per-phrase dict format)."""
+        code = data["category_code"]
+        phrase_cls = LexiconPhrase
+        # Positional construction: this runs once per cached phrase on every load
         return cls(
-            category_code=data["category_code"],
+            category_code=code,
             category_name=data["category_name"],
-            phrases=[LexiconPhrase.from_dict(p) for p in data["phrases"]],
+            phrases=[
+                phrase_cls.from_dict(p) if isinstance(p, dict) else phrase_cls(p[0], p[1], code)
+                for p in data["phrases"]
+            ],
             generated_at=datetime.fromisoformat(data["generated_at"]),
         )
 
@@ -128,11 +156,14 @@ class CategoryLexicon:
 
     def get_top_phrases(self, top_k: int = 10) -> list[str]:
         """Get top K phrases by confidence."""
-        sorted_phrases = sorted(self.phrases, key=lambda p: p.confidence, reverse=True)
-        return [p.phrase for p in sorted_phrases[:top_k]]
+        top = self._top_phrases.get(top_k)
+        if top is None:
+            sorted_phrases = sorted(self.phrases, key=_BY_CONFIDENCE, reverse=True)
+            top = self._top_phrases[top_k] = [p.phrase for p in sorted_phrases[:top_k]]
+        return list(top)
 
 
-@dataclass
+@dataclass(slots=True)
 class LexiconCache:
     """Cache container for all category lexicons."""
 
@@ -156,9 +187,10 @@ class LexiconCache:
     @classmethod
     def from_dict(cls, data: dict) -> "LexiconCache":
         """Deserialize from cache."""
+        lexicon_from_dict = CategoryLexicon.from_dict
         return cls(
             lexicons={
-                code: CategoryLexicon.from_dict(lex_data)
+                code: lexicon_from_dict(lex_data)
                 for code, lex_data in data["lexicons"].items()
             },
             created_at=datetime.fromisoformat(data["created_at"]),
@@ -185,12 +217,15 @@ class CategoryLexiconGenerator:
             ttl_days: Cache time-to-live in days
             openai_client: OpenAI client for LLM calls
         """
-        self.taxonomy_manager = taxonomy_manager or ArxivTaxonomyManager()
+        self.taxonomy_manager = taxonomy_manager or get_taxonomy_manager()
         self.cache_dir = cache_dir or settings.temp_dir
         self.ttl_days = ttl_days
         self.openai_client = openai_client or OpenAI(api_key=settings.openai_api_key)
         self._cache_path = self.cache_dir / "category_lexicons.json"
+        # Phrase embeddings live in a float16 sidecar; the JSON holds text and scores
+        self._embeddings_path = self._cache_path.with_suffix(".npz")
         self._lexicons: Optional[dict[str, CategoryLexicon]] = None
+        self._phrase_embeddings: Optional[dict[str, np.ndarray]] = None
 
     def get_lexicon(self, category_code: str) -> Optional[CategoryLexicon]:
         """Get lexicon for a specific category (generates if needed)."""
@@ -203,28 +238,52 @@ class CategoryLexiconGenerator:
         return self._lexicons
 
     def _ensure_loaded(self) -> None:
-        """Load from cache or generate all lexicons."""
+        """Load from cache, generating only missing or stale lexicons."""
         if self._lexicons is not None:
             return
 
-        # Try loading from cache
+        # Reuse every cached lexicon that is individually still fresh; each one
+        # expires on its own generated_at, whatever the age of the cache file
         cached = self._load_cache()
-        if cached and cached.is_valid():
-            logger.info(f"Loaded lexicon cache: {len(cached.lexicons)} categories")
-            self._lexicons = cached.lexicons
+        kept: dict[str, CategoryLexicon] = {}
+        if cached:
+            cutoff = datetime.now() - timedelta(days=self.ttl_days)
+            kept = {code: lex for code, lex in cached.lexicons.items() if lex.generated_at > cutoff}
+
+        taxonomy = self.taxonomy_manager.load_taxonomy()
+        categories = [cat for cat in taxonomy if cat.code not in kept]
+
+        if not categories:
+            logger.info(f"Loaded lexicon cache: {len(kept)} categories")
+            self._lexicons = {cat.code: kept[cat.code] for cat in taxonomy}
             return
 
-        # Generate all lexicons
-        logger.info("Generating category lexicons (this may take a minute)...")
-        self._lexicons = self._generate_all_lexicons()
+        # Generate only missing or stale lexicons
+        if settings.lexicon_batch_api:
+            logger.info(f"Generating {len(categories)} category lexicons via the Batch API (may take hours)...")
+            try:
+                generated = self._generate_all_lexicons_batch(categories)
+            except Exception as e:
+                logger.error(f"Batch lexicon generation failed, using direct requests: {e}")
+                generated = self._generate_all_lexicons(categories)
+        else:
+            logger.info(
+                f"Generating {len(categories)} category lexicons "
+                f"({len(kept)} reused from cache, this may take a minute)..."
+            )
+            generated = self._generate_all_lexicons(categories)
+
+        merged = {**kept, **generated}
+        self._lexicons = {cat.code: merged[cat.code] for cat in taxonomy if cat.code in merged}
         self._save_cache()
 
-    @openai_retry
-    def _generate_lexicon_for_category(
-        self,
-        category: ArxivCategory,
-    ) -> CategoryLexicon:
-        """Generate lexicon for a single category using LLM."""
+    def _lexicon_request(self, category: ArxivCategory) -> dict:
+        """Chat completion parameters for one category's lexicon.
+
+        The system prompt is identical across categories and comes first, so
+        OpenAI's prompt caching can reuse it; per-category data goes only in
+        the user message.
+        """
         user_prompt = f"""Generate news-friendly search phrases for this arXiv category:
 
 Category Code: {category.code}
@@ -235,28 +294,86 @@ Generate 15-25 phrases that would appear in mainstream tech/business/finance new
 Focus on current terminology, product names, company types, and event types.
 """
 
-        response = self.openai_client.chat.completions.create(
-            model=settings.llm_model,
-            messages=[
+        return {
+            "model": settings.llm_model,
+            "messages": [
                 {"role": "system", "content": LEXICON_SYSTEM_PROMPT},
                 {"role": "user", "content": user_prompt},
             ],
-            temperature=0.7,
-            max_tokens=1000,
-            response_format={"type": "json_object"},
-        )
+            "temperature": 0.7,
+            # 15-25 short phrases fit in well under 400 tokens
+            "max_tokens": 500,
+            "response_format": {"type": "json_object"},
+        }
+
+    def _generate_lexicon_for_category(
+        self,
+        category: ArxivCategory,
+    ) -> CategoryLexicon:
+        """Generate lexicon for a single category using LLM."""
+        phrases = self._generate_phrases(category)
+
+        # Score each phrase by semantic similarity to category
+        return self._new_lexicon(category, self._score_phrases(category, phrases))
+
+    @openai_retry
+    def _generate_phrases(self, category: ArxivCategory) -> list[str]:
+        """Ask the LLM for a category's news-friendly phrases (unscored)."""
+        response = self.openai_client.chat.completions.create(**self._lexicon_request(category))
+
+        details = getattr(response.usage, "prompt_tokens_details", None)
+        if details is not None:
+            logger.debug(
+                f"Lexicon prompt for {category.code}: {response.usage.prompt_tokens} tokens, "
+                f"{details.cached_tokens or 0} cached"
+            )
 
         content = response.choices[0].message.content
         data = json.loads(content)
-        phrases = data.get("phrases", [])
+        return data.get("phrases", [])
 
-        # Score each phrase by semantic similarity to category
-        scored_phrases = self._score_phrases(category, phrases)
+    @openai_retry
+    def _embed_phrases(self, phrases: list[str]) -> list[np.ndarray]:
+        """
+        Embed phrases as float32 vectors, up to EMBEDDING_BATCH_SIZE per request.
 
+        Phrases embedded by an earlier build (or an earlier chunk of this
+        one) are reused, so a refresh only pays for phrases that are new.
+        """
+        known = self._known_phrase_embeddings()
+        missing = list(dict.fromkeys(p for p in phrases if p not in known))
+        for start in range(0, len(missing), EMBEDDING_BATCH_SIZE):
+            chunk = missing[start:start + EMBEDDING_BATCH_SIZE]
+            response = self.openai_client.embeddings.create(
+                model=settings.embedding_model,
+                input=chunk,
+                encoding_format="base64",
+            )
+            known.update(zip(chunk, (_decode_embedding(d.embedding) for d in response.data)))
+        return [known[p] for p in phrases]
+
+    def _known_phrase_embeddings(self) -> dict[str, np.ndarray]:
+        """Phrase -> embedding from previous builds (sidecar loaded on first use)."""
+        if self._phrase_embeddings is None:
+            self._phrase_embeddings = {}
+            if self._embeddings_path.exists():
+                try:
+                    with np.load(self._embeddings_path, allow_pickle=False) as stored:
+                        if str(stored["model"]) == settings.embedding_model:
+                            self._phrase_embeddings = dict(
+                                zip(stored["phrases"].tolist(), stored["embeddings"].astype(np.float32))
+                            )
+                except (KeyError, ValueError, OSError) as e:
+                    logger.warning(f"Failed to load phrase embeddings: {e}")
+        return self._phrase_embeddings
+
+    @staticmethod
+    def _new_lexicon(category: ArxivCategory, phrases: list[LexiconPhrase]) -> CategoryLexicon:
+        """Wrap scored phrases in a freshly generated lexicon."""
         return CategoryLexicon(
             category_code=category.code,
             category_name=category.name,
-            phrases=scored_phrases,
+            phrases=phrases,
             generated_at=datetime.now(),
         )
 
@@ -269,77 +386,234 @@ Focus on current terminology, product names, company types, and event types.
         if not phrases:
             return []
 
-        if category.embedding is None:
+        if self.taxonomy_manager.category_embedding(category.code) is None:
             logger.warning(f"No embedding for {category.code}, using default scores")
-            return [
-                LexiconPhrase(phrase=p, confidence=0.5, category_code=category.code)
-                for p in phrases
-            ]
+            return self._default_scores(category, phrases)
 
         try:
-            # Get embeddings for all phrases in batch
-            response = self.openai_client.embeddings.create(
-                model=settings.embedding_model,
-                input=phrases,
-            )
-
-            phrase_embeddings = [d.embedding for d in response.data]
-            category_embedding = np.array(category.embedding)
-
-            scored = []
-            for phrase, emb in zip(phrases, phrase_embeddings):
-                similarity = self._cosine_similarity(
-                    np.array(emb),
-                    category_embedding
-                )
-                scored.append(LexiconPhrase(
-                    phrase=phrase,
-                    confidence=float(similarity),
-                    category_code=category.code,
-                ))
-
-            # Sort by confidence descending
-            scored.sort(key=lambda x: x.confidence, reverse=True)
-            return scored
+            return self._rank_phrases(category, phrases, self._embed_phrases(phrases))
 
         except Exception as e:
             logger.warning(f"Failed to score phrases: {e}")
-            return [
-                LexiconPhrase(phrase=p, confidence=0.5, category_code=category.code)
-                for p in phrases
-            ]
+            return self._default_scores(category, phrases)
 
-    def _generate_all_lexicons(self) -> dict[str, CategoryLexicon]:
-        """Generate lexicons for all taxonomy categories."""
-        categories = self.taxonomy_manager.load_taxonomy()
-        lexicons = {}
+    def _rank_phrases(
+        self,
+        category: ArxivCategory,
+        phrases: list[str],
+        phrase_embeddings: list,
+    ) -> list[LexiconPhrase]:
+        """Score phrases against the category embedding, highest confidence first.
+
+        The category vector is the manager's pre-normalized float32 row, so
+        only the phrase matrix is normalized here.
+        """
+        if not phrases:
+            return []
+
+        category_embedding = self.taxonomy_manager.category_embedding(category.code)
+        if category_embedding is None:
+            return self._default_scores(category, phrases)
+
+        # Cosine similarity of every phrase in one matrix-vector product; the
+        # category row is already L2-normalized
+        matrix = np.asarray(phrase_embeddings, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        matrix /= norms
+        similarities = (matrix @ category_embedding).tolist()
+
+        scored = [
+            LexiconPhrase(phrase=phrase, confidence=similarity, category_code=category.code)
+            for phrase, similarity in zip(phrases, similarities)
+        ]
+
+        # Sort by confidence descending
+        scored.sort(key=_BY_CONFIDENCE, reverse=True)
+        return scored
+
+    @staticmethod
+    def _default_scores(category: ArxivCategory, phrases: list[str]) -> list[LexiconPhrase]:
+        """Unscored phrases, used when embeddings are unavailable."""
+        return [
+            LexiconPhrase(phrase=p, confidence=0.5, category_code=category.code)
+            for p in phrases
+        ]
+
+    def _generate_all_lexicons(
+        self,
+        categories: Optional[list[ArxivCategory]] = None,
+        max_workers: int = 8,
+    ) -> dict[str, CategoryLexicon]:
+        """
+        Generate lexicons for all taxonomy categories.
+
+        Phrase generation is one independent, network-bound chat request per
+        category, so those run on a thread pool sharing this generator's
+        client, each with its own retry. The phrases of every category are
+        then embedded together in as few requests as the API allows.
+
+        Args:
+            categories: Categories to generate (defaults to the whole taxonomy)
+            max_workers: Maximum concurrent categories (rate-limit guard)
+
+        Returns:
+            Lexicons by category code, in taxonomy order
+        """
+        if categories is None:
+            categories = self.taxonomy_manager.load_taxonomy()
+        generated: dict[str, list[str]] = {}
 
         total = len(categories)
-        for i, cat in enumerate(categories, 1):
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, total))) as pool:
+            futures = {pool.submit(self._generate_phrases, cat): cat for cat in categories}
+            for i, future in enumerate(as_completed(futures), 1):
+                cat = futures[future]
+                try:
+                    generated[cat.code] = future.result()
+                    logger.info(f"[{i}/{total}] Generated {len(generated[cat.code])} phrases for {cat.code}: {cat.name}")
+                except Exception as e:
+                    logger.error(f"Failed to generate lexicon for {cat.code}: {e}")
+
+        done = [cat for cat in categories if cat.code in generated]
+        flat_phrases = [phrase for cat in done for phrase in generated[cat.code]]
+        embeddings = None
+        if flat_phrases:
             try:
-                logger.info(f"[{i}/{total}] Generating lexicon for {cat.code}: {cat.name}")
-                lexicon = self._generate_lexicon_for_category(cat)
-                lexicons[cat.code] = lexicon
-                logger.debug(f"Generated {len(lexicon.phrases)} phrases for {cat.code}")
+                embeddings = self._embed_phrases(flat_phrases)
             except Exception as e:
-                logger.error(f"Failed to generate lexicon for {cat.code}: {e}")
+                logger.warning(f"Failed to score phrases: {e}")
+
+        lexicons = {}
+        offset = 0
+        for cat in done:
+            phrases = generated[cat.code]
+            if embeddings is None:
+                scored = self._default_scores(cat, phrases)
+            else:
+                scored = self._rank_phrases(cat, phrases, embeddings[offset:offset + len(phrases)])
+            offset += len(phrases)
+            lexicons[cat.code] = self._new_lexicon(cat, scored)
+        return lexicons
+
+    def _generate_all_lexicons_batch(
+        self,
+        categories: Optional[list[ArxivCategory]] = None,
+    ) -> dict[str, CategoryLexicon]:
+        """
+        Generate lexicons for all categories through the OpenAI Batch API.
+
+        Phrase generation runs as one batch job and phrase embeddings as a
+        second; batch jobs cost about half as much as direct requests but
+        may take up to 24h. Categories whose completion failed are skipped.
+
+        Args:
+            categories: Categories to generate (defaults to the whole taxonomy)
+
+        Returns:
+            Lexicons by category code, in taxonomy order
+        """
+        if categories is None:
+            categories = self.taxonomy_manager.load_taxonomy()
 
+        completions = self._run_batch(
+            "/v1/chat/completions",
+            {cat.code: self._lexicon_request(cat) for cat in categories},
+        )
+        phrases: dict[str, list[str]] = {}
+        for code, body in completions.items():
+            try:
+                phrases[code] = json.loads(body["choices"][0]["message"]["content"]).get("phrases", [])
+            except (KeyError, IndexError, TypeError, json.JSONDecodeError) as e:
+                logger.error(f"Invalid batch completion for {code}: {e}")
+
+        embeddings = self._run_batch(
+            "/v1/embeddings",
+            {
+                code: {"model": settings.embedding_model, "input": code_phrases}
+                for code, code_phrases in phrases.items()
+                if code_phrases
+            },
+        )
+
+        lexicons = {}
+        for cat in categories:
+            if cat.code not in phrases:
+                continue
+            cat_phrases = phrases[cat.code]
+            body = embeddings.get(cat.code)
+            if body is None:
+                scored = self._default_scores(cat, cat_phrases)
+            else:
+                data = sorted(body["data"], key=_BY_INDEX)
+                vectors = [np.asarray(d["embedding"], dtype=np.float32) for d in data]
+                self._known_phrase_embeddings().update(zip(cat_phrases, vectors))
+                scored = self._rank_phrases(cat, cat_phrases, vectors)
+            lexicons[cat.code] = self._new_lexicon(cat, scored)
+
+        logger.info(f"Generated {len(lexicons)}/{len(categories)} lexicons via the Batch API")
         return lexicons
 
-    def _cosine_similarity(self, a: np.ndarray, b: np.ndarray) -> float:
-        """Calculate cosine similarity."""
-        norm_a = np.linalg.norm(a)
-        norm_b = np.linalg.norm(b)
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
-        return float(np.dot(a, b) / (norm_a * norm_b))
+    def _run_batch(self, endpoint: str, bodies: dict[str, dict]) -> dict[str, dict]:
+        """
+        Run requests as one Batch API job and wait for it to finish.
+
+        Args:
+            endpoint: API path every request targets
+            bodies: Request body per custom_id
+
+        Returns:
+            Response body per custom_id, for requests that succeeded
+
+        Raises:
+            RuntimeError: If the job ends in any state other than completed
+        """
+        if not bodies:
+            return {}
+
+        lines = (
+            json.dumps({"custom_id": custom_id, "method": "POST", "url": endpoint, "body": body})
+            for custom_id, body in bodies.items()
+        )
+        input_file = self.openai_client.files.create(
+            file=("lexicon_batch.jsonl", "\n".join(lines).encode()),
+            purpose="batch",
+        )
+        batch = self.openai_client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=endpoint,
+            completion_window="24h",
+        )
+        logger.info(f"Submitted batch {batch.id}: {len(bodies)} requests to {endpoint}")
+
+        while batch.status not in _BATCH_TERMINAL_STATES:
+            time.sleep(settings.lexicon_batch_poll_seconds)
+            batch = self.openai_client.batches.retrieve(batch.id)
+            logger.debug(f"Batch {batch.id} status: {batch.status}")
+
+        if batch.status != "completed":
+            raise RuntimeError(f"Batch {batch.id} ended with status {batch.status}")
+        if not batch.output_file_id:
+            return {}
+
+        results = {}
+        for line in self.openai_client.files.content(batch.output_file_id).text.splitlines():
+            if not line:
+                continue
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") == 200:
+                results[record["custom_id"]] = response["body"]
+            else:
+                logger.warning(f"Batch request {record['custom_id']} failed: {record.get('error')}")
+        return results
 
     def _load_cache(self) -> Optional[LexiconCache]:
         """Load lexicon cache from disk."""
         if not self._cache_path.exists():
             return None
         try:
-            data = json.loads(self._cache_path.read_text())
+            data = json.loads(self._cache_path.read_bytes())
             return LexiconCache.from_dict(data)
         except Exception as e:
             logger.warning(f"Failed to load lexicon cache: {e}")
@@ -348,14 +622,40 @@ Focus on current terminology, product names, company types, and event types.
     def _save_cache(self) -> None:
         """Save lexicons to cache."""
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Freshness is tracked per lexicon (generated_at); reused lexicons keep
+        # their original timestamps, newly generated ones carry their own
         cache = LexiconCache(
             lexicons=self._lexicons,
             created_at=datetime.now(),
             ttl_days=self.ttl_days,
         )
-        self._cache_path.write_text(json.dumps(cache.to_dict(), indent=2))
+        self._save_phrase_embeddings()
+        self._cache_path.write_bytes(json.dumps(cache.to_dict(), separators=(",", ":")).encode())
         logger.info(f"Saved lexicon cache to: {self._cache_path}")
 
+    def _save_phrase_embeddings(self) -> None:
+        """Write embeddings of the current lexicons' phrases to the .npz sidecar."""
+        known = self._phrase_embeddings or {}
+        phrases = [
+            phrase
+            for phrase in dict.fromkeys(p.phrase for lex in self._lexicons.values() for p in lex.phrases)
+            if phrase in known
+        ]
+        if not phrases:
+            return
+
+        buf = io.BytesIO()
+        np.savez(
+            buf,
+            model=np.array(settings.embedding_model),
+            phrases=np.array(phrases),
+            embeddings=np.asarray([known[p] for p in phrases], dtype=np.float16),
+        )
+        try:
+            _write_atomic(self._embeddings_path, buf.getvalue())
+        except OSError as e:
+            logger.warning(f"Failed to save phrase embeddings: {e}")
+
     def export_for_google_alerts(
         self,
         category_code: str,
@@ -384,12 +684,7 @@ Focus on current terminology, product names, company types, and event types.
             return ""
 
         # Deduplicate while preserving order
-        seen = set()
-        unique = []
-        for p in all_phrases:
-            if p not in seen:
-                seen.add(p)
-                unique.append(p)
+        unique = list(dict.fromkeys(all_phrases))
 
         return " OR ".join(unique[:15])
 
@@ -1,6 +1,24 @@
 """Utility modules for The Morning Byte."""
 
 from .logging_config import get_logger, setup_logging
-from .retry import openai_retry
 
-__all__ = ["get_logger", "setup_logging", "openai_retry"]
+__all__ = ["get_logger", "setup_logging", "get_openai_client", "openai_retry"]
+
+# Resolved on first access (PEP 562) so importing the package for logging
+# alone doesn't pull in openai, httpx and tenacity
+_LAZY_ATTRS = {
+    "get_openai_client": ".openai_client",
+    "openai_retry": ".retry",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -4,6 +4,19 @@ import logging
 import sys
 from typing import Optional
 
+# Base format for local logging
+_FORMATTER = logging.Formatter(
+    fmt="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+# Console handler, created once so repeated setup_logging calls reuse it
+_CONSOLE_HANDLER = logging.StreamHandler(sys.stdout)
+_CONSOLE_HANDLER.setFormatter(_FORMATTER)
+
+# GCP Cloud Logging clients by project ID (each attaches its handler once)
+_GCP_CLIENTS: dict[str, object] = {}
+
 
 def setup_logging(
     level: str = "INFO",
@@ -12,36 +25,31 @@ def setup_logging(
     """
     Configure application logging.
 
+    Safe to call repeatedly: the console handler is attached once and only
+    levels are updated on later calls; other handlers are left in place.
+
     Args:
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         gcp_project_id: Optional GCP project ID for Cloud Logging integration
     """
     log_level = getattr(logging, level.upper(), logging.INFO)
 
-    # Base format for local logging
-    formatter = logging.Formatter(
-        fmt="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
-
-    # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(formatter)
-    console_handler.setLevel(log_level)
+    _CONSOLE_HANDLER.setLevel(log_level)
 
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
-    root_logger.handlers.clear()
-    root_logger.addHandler(console_handler)
+    if _CONSOLE_HANDLER not in root_logger.handlers:
+        root_logger.addHandler(_CONSOLE_HANDLER)
 
     # GCP Cloud Logging integration
-    if gcp_project_id:
+    if gcp_project_id and gcp_project_id not in _GCP_CLIENTS:
         try:
             import google.cloud.logging
 
             client = google.cloud.logging.Client(project=gcp_project_id)
             client.setup_logging(log_level=log_level)
+            _GCP_CLIENTS[gcp_project_id] = client
             logging.info(f"GCP Cloud Logging enabled for project: {gcp_project_id}")
         except ImportError:
             logging.warning(
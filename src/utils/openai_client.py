@@ -0,0 +1,37 @@
+"""Shared OpenAI client with a pooled keep-alive HTTP connection."""
+
+import threading
+from typing import Optional
+
+import httpx
+from openai import DefaultHttpxClient, OpenAI
+
+from ..config import settings
+
+_shared_client: Optional[OpenAI] = None
+_shared_client_lock = threading.Lock()
+
+
+def get_openai_client() -> OpenAI:
+    """Return the process-wide OpenAI client, creating it on first use.
+
+    Components that aren't handed an explicit client share this one, so its
+    TLS connections stay warm across instances and calls. The keep-alive pool
+    holds at least RANKER_CONCURRENCY connections so concurrent ranking
+    workers never queue for one.
+    """
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            keepalive = max(20, settings.ranker_concurrency)
+            _shared_client = OpenAI(
+                api_key=settings.openai_api_key,
+                http_client=DefaultHttpxClient(
+                    limits=httpx.Limits(
+                        max_connections=keepalive * 2,
+                        max_keepalive_connections=keepalive,
+                        keepalive_expiry=300,
+                    ),
+                ),
+            )
+        return _shared_client
@@ -1,10 +1,11 @@
 """Retry decorators for external API calls."""
 
 from tenacity import (
+    RetryCallState,
     retry,
     retry_if_exception_type,
     stop_after_attempt,
-    wait_exponential,
+    wait_random_exponential,
     before_sleep_log,
 )
 import logging
@@ -18,12 +19,33 @@ from openai import (
 
 logger = logging.getLogger(__name__)
 
+MAX_RETRY_WAIT_SECONDS = 60
+
+# Full-jitter exponential backoff: concurrent callers hitting the same rate
+# limit retry at spread-out times instead of in lockstep
+_jittered_backoff = wait_random_exponential(multiplier=1, min=2, max=MAX_RETRY_WAIT_SECONDS)
+
+
+def _wait_backoff_or_retry_after(retry_state: RetryCallState) -> float:
+    """Jittered backoff, but never shorter than the server's Retry-After (capped)."""
+    delay = _jittered_backoff(retry_state)
+    exception = retry_state.outcome.exception() if retry_state.outcome else None
+    response = getattr(exception, "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    if retry_after:
+        try:
+            delay = max(delay, min(float(retry_after), MAX_RETRY_WAIT_SECONDS))
+        except ValueError:
+            pass  # HTTP-date form; keep the backoff delay
+    return delay
+
+
 # OpenAI API retry decorator
 openai_retry = retry(
     retry=retry_if_exception_type(
         (APIConnectionError, APITimeoutError, RateLimitError, InternalServerError)
     ),
-    wait=wait_exponential(multiplier=1, min=2, max=60),
+    wait=_wait_backoff_or_retry_after,
     stop=stop_after_attempt(5),
     before_sleep=before_sleep_log(logger, logging.WARNING),
     reraise=True,
@@ -2,7 +2,15 @@
 
 from __future__ import annotations
 
+import json
+import os
 import subprocess
+import tempfile
+import threading
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
@@ -15,6 +23,76 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Hardware H.264 encoders in order of preference, with their quality settings
+# (roughly matching libx264 at CRF 23)
+HW_ENCODER_ARGS = {
+    "h264_nvenc": ["-preset", "p4", "-tune", "hq", "-rc", "vbr", "-cq", "23", "-b:v", "0"],
+    "h264_videotoolbox": ["-q:v", "55"],
+    "h264_qsv": ["-preset", "faster", "-global_quality", "23"],
+}
+
+# Scene cards pre-encoded concurrently before the crossfade pass
+SCENE_CLIP_WORKERS = 4
+
+# Transition between consecutive scene cards
+SCENE_XFADE = "xfade=transition=fade"
+
+# libx264 threading: frame threads sized to the CPU, no sliced threads
+X264_THREAD_PARAMS = "threads=auto:sliced-threads=0"
+
+# libx264 for a single looped still image (scene-card clips only): fixed GOP,
+# no scenecut/B-frames, cheapest motion search, since no frame ever changes
+X264_STILL_PARAMS = "keyint=250:min-keyint=250:scenecut=0:ref=1:bframes=0:me=dia:subme=1"
+
+# Audio output: AAC input (by file extension) is stream-copied instead of re-encoded
+AAC_ENCODE_ARGS = ("-c:a", "aac", "-b:a", "192k")
+AAC_SUFFIXES = frozenset({".aac", ".m4a"})
+
+# FFmpeg stderr lines kept for error reports
+FFMPEG_STDERR_TAIL_LINES = 500
+
+
+@lru_cache(maxsize=1)
+def _available_encoders() -> frozenset[str]:
+    """Names of the video encoders this ffmpeg build provides (probed once)."""
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+    except Exception as e:
+        logger.debug(f"Could not list ffmpeg encoders: {e}")
+        return frozenset()
+    # Lines look like " V....D h264_nvenc   NVIDIA NVENC H.264 encoder"
+    return frozenset(
+        parts[1] for parts in (line.split() for line in result.stdout.splitlines())
+        if len(parts) > 1 and parts[0].startswith("V")
+    )
+
+
+@lru_cache(maxsize=None)
+def _encoder_works(name: str) -> bool:
+    """
+    Whether a one-frame test encode with this encoder succeeds (probed once).
+
+    ffmpeg -encoders lists what the binary was built with, not what this
+    machine can run (e.g. nvenc compiled in but no GPU), so hardware
+    encoders are only used after an actual encode works.
+    """
+    cmd = [
+        "ffmpeg", "-hide_banner", "-loglevel", "error",
+        "-f", "lavfi", "-i", "color=s=256x256:d=0.1",
+        "-frames:v", "1", "-pix_fmt", "yuv420p", "-c:v", name,
+        "-f", "null", "-",
+    ]
+    try:
+        return subprocess.run(cmd, capture_output=True, timeout=30).returncode == 0
+    except Exception as e:
+        logger.debug(f"Test encode with {name} failed: {e}")
+        return False
+
 
 class VideoRenderer:
     """Renders 16:9 landscape videos with audio and subtitles using FFmpeg."""
@@ -25,6 +103,8 @@ class VideoRenderer:
         self.height = settings.video_height
         self.max_duration = settings.max_duration_seconds
         self.bg_color = settings.background_color
+        self.preset = settings.x264_preset
+        self._encoder: Optional[str] = None
 
     def render(
         self,
@@ -53,13 +133,16 @@ class VideoRenderer:
         """
         output_path = output_path or settings.output_dir / "output.mp4"
         output_path.parent.mkdir(parents=True, exist_ok=True)
+        encoder = self.encoder
 
         # Priority 1: Scene cards (visual storyboard)
         if scene_cards and len(scene_cards) >= 2:
             try:
                 logger.info("Using scene card storyboard")
-                return self._render_with_scene_cards(
-                    scene_cards, audio_path, subtitle_path, output_path
+                return self._with_encoder_fallback(
+                    self._render_with_scene_cards,
+                    scene_cards, audio_path, subtitle_path, output_path,
+                    encoder=encoder,
                 )
             except Exception as e:
                 logger.warning(f"Scene card rendering failed: {e}, falling back")
@@ -67,8 +150,10 @@ class VideoRenderer:
         # Priority 2: Screenshots
         if screenshot_pair and (screenshot_pair.news_screenshot or screenshot_pair.paper_screenshot):
             logger.info("Using screenshot background")
-            return self._render_with_screenshot_background(
-                audio_path, subtitle_path, screenshot_pair, output_path
+            return self._with_encoder_fallback(
+                self._render_with_screenshot_background,
+                audio_path, subtitle_path, screenshot_pair, output_path,
+                encoder=encoder,
             )
 
         # Priority 3: Background video
@@ -77,87 +162,124 @@ class VideoRenderer:
 
         if background_video_path.exists():
             logger.info("Using video background")
-            return self._render_with_video_background(
-                audio_path, subtitle_path, background_video_path, output_path
+            return self._with_encoder_fallback(
+                self._render_with_video_background,
+                audio_path, subtitle_path, background_video_path, output_path,
+                encoder=encoder,
             )
 
         # Priority 4: Solid color
         logger.info("Using solid color background")
-        return self._render_with_solid_background(
-            audio_path, subtitle_path, output_path
+        return self._with_encoder_fallback(
+            self._render_with_solid_background,
+            audio_path, subtitle_path, output_path,
+            encoder=encoder,
         )
 
+    def _with_encoder_fallback(self, render_path: Callable[..., Path], *args, encoder: str) -> Path:
+        """
+        Run one render path, re-running it with libx264 if a hardware encode fails.
+
+        A hardware encoder that passed the test encode can still fail on a
+        full render (e.g. out of encoder sessions). The retry rebuilds the
+        command for libx264 and leaves self.encoder unchanged.
+        """
+        try:
+            return render_path(*args, encoder=encoder)
+        except RuntimeError as e:
+            if encoder == "libx264":
+                raise
+            logger.warning(f"{encoder} encode failed ({e}), retrying with libx264")
+        return render_path(*args, encoder="libx264")
+
     def _render_with_scene_cards(
         self,
         rendered_cards: list[RenderedCard],
         audio_path: Path,
         subtitle_path: Path,
         output_path: Path,
+        encoder: str,
     ) -> Path:
-        """Render with scene card PNGs using FFmpeg xfade chain."""
+        """
+        Render with scene card PNGs using FFmpeg xfade chain.
+
+        Each card is first encoded on its own, already scaled, to a short
+        near-lossless clip (in parallel), so the final pass only crossfades
+        and burns subtitles instead of rescaling every card on every frame.
+        """
         xf_dur = 0.5  # crossfade duration
         n = len(rendered_cards)
 
-        # Build input arguments: each card looped for its duration + xfade padding
-        inputs = []
-        for card in rendered_cards:
-            dur = card.duration_s + xf_dur
-            inputs.extend(["-loop", "1", "-t", str(dur), "-i", str(card.image_path)])
-        inputs.extend(["-i", str(audio_path)])
-
-        audio_idx = n  # index of the audio input
-
-        # Build xfade filter chain
-        if n == 1:
-            # Single card, no xfade needed
-            filter_str = (
-                f"[0:v]scale={self.width}:{self.height},"
-                f"subtitles={self._escape_path(subtitle_path)}[outv]"
-            )
-        else:
-            # Scale all inputs
-            scale_parts = []
-            for i in range(n):
-                scale_parts.append(
-                    f"[{i}:v]scale={self.width}:{self.height}[v{i}]"
-                )
+        settings.temp_dir.mkdir(parents=True, exist_ok=True)
+        with tempfile.TemporaryDirectory(dir=settings.temp_dir, prefix="scene_clips_") as clip_dir:
+            # Pass 1: each card looped for its duration + xfade padding, pre-scaled
+            clip_paths = [Path(clip_dir) / f"card_{i:03d}.mp4" for i in range(n)]
+            with ThreadPoolExecutor(max_workers=min(n, SCENE_CLIP_WORKERS)) as pool:
+                list(pool.map(
+                    lambda args: self._render_card_clip(*args, xf_dur),
+                    zip(rendered_cards, clip_paths),
+                ))
+
+            inputs = []
+            for clip_path in clip_paths:
+                inputs.extend(["-i", str(clip_path)])
+            inputs.extend(["-i", str(audio_path)])
+
+            audio_idx = n  # index of the audio input
+
+            # Pass 2: xfade chain over the pre-scaled clips
+            if n == 1:
+                # Single card, no xfade needed
+                filter_str = f"[0:v]{self._subtitle_filter(subtitle_path)}[outv]"
+            else:
+                # Chain xfades
+                xfade_parts = []
+                # offset[0] = card[0].duration - xf_dur
+                offset = rendered_cards[0].duration_s - xf_dur
+                prev_label = "0:v"
+
+                for i in range(1, n):
+                    out_label = f"xf{i - 1}" if i < n - 1 else "xfout"
+                    xfade_parts.append(
+                        f"[{prev_label}][{i}:v]{SCENE_XFADE}:duration={xf_dur}:offset={offset:.3f}[{out_label}]"
+                    )
+                    offset += rendered_cards[i].duration_s - xf_dur
+                    prev_label = out_label
 
-            # Chain xfades
-            xfade_parts = []
-            # offset[0] = card[0].duration - xf_dur
-            offset = rendered_cards[0].duration_s - xf_dur
-            prev_label = "v0"
+                # Subtitle overlay on final output
+                subtitle_part = f"[xfout]{self._subtitle_filter(subtitle_path)}[outv]"
 
-            for i in range(1, n):
-                out_label = f"xf{i - 1}" if i < n - 1 else "xfout"
-                xfade_parts.append(
-                    f"[{prev_label}][v{i}]xfade=transition=fade:duration={xf_dur}:offset={offset:.3f}[{out_label}]"
-                )
-                if i < n - 1:
-                    offset += rendered_cards[i].duration_s - xf_dur
-                prev_label = out_label
+                filter_str = ";".join(xfade_parts + [subtitle_part])
 
-            # Subtitle overlay on final output
-            subtitle_part = f"[xfout]subtitles={self._escape_path(subtitle_path)}[outv]"
+            cmd = [
+                "ffmpeg", "-y",
+                *inputs,
+                "-filter_complex", filter_str,
+                "-map", "[outv]",
+                "-map", f"{audio_idx}:a",
+                *self._video_encoder_args(encoder),
+                "-pix_fmt", "yuv420p",
+                "-profile:v", "main", "-level", "4.0",
+                "-movflags", "+faststart",
+                *self._audio_codec_args(audio_path),
+                "-shortest", "-t", str(self.max_duration),
+                str(output_path),
+            ]
 
-            filter_str = ";".join(scale_parts + xfade_parts + [subtitle_part])
+            return self._run_ffmpeg(cmd, output_path)
 
+    def _render_card_clip(self, card: RenderedCard, clip_path: Path, xf_dur: float) -> Path:
+        """Encode one scene card, scaled to the output size, as a near-lossless clip."""
         cmd = [
             "ffmpeg", "-y",
-            *inputs,
-            "-filter_complex", filter_str,
-            "-map", "[outv]",
-            "-map", f"{audio_idx}:a",
-            "-c:v", "libx264", "-preset", "medium", "-crf", "23",
+            "-loop", "1", "-t", str(card.duration_s + xf_dur), "-i", str(card.image_path),
+            "-vf", f"scale={self.width}:{self.height}",
+            "-c:v", "libx264", "-preset", "ultrafast", "-crf", "18",
+            "-tune", "stillimage", "-x264-params", X264_STILL_PARAMS,
             "-pix_fmt", "yuv420p",
-            "-profile:v", "main", "-level", "4.0",
-            "-movflags", "+faststart",
-            "-c:a", "aac", "-b:a", "192k",
-            "-shortest", "-t", str(self.max_duration),
-            str(output_path),
+            str(clip_path),
         ]
-
-        return self._run_ffmpeg(cmd, output_path)
+        return self._run_ffmpeg(cmd, clip_path)
 
     def _render_with_screenshot_background(
         self,
@@ -165,6 +287,7 @@ class VideoRenderer:
         subtitle_path: Path,
         screenshot_pair: ScreenshotPair,
         output_path: Path,
+        encoder: str,
     ) -> Path:
         """Render with screenshot images as background (news first half, paper second half)."""
         duration = self._get_audio_duration(audio_path)
@@ -188,13 +311,13 @@ class VideoRenderer:
                 f"[1:v]scale={self.width}:{self.height}:force_original_aspect_ratio=increase,"
                 f"crop={self.width}:{self.height}[v1];"
                 f"[v0][v1]xfade=transition=fade:duration={xfade_dur}:offset={midpoint},"
-                f"subtitles={self._escape_path(subtitle_path)}[outv]",
+                f"{self._subtitle_filter(subtitle_path)}[outv]",
                 "-map", "[outv]", "-map", "2:a",
-                "-c:v", "libx264", "-preset", "medium", "-crf", "23",
+                *self._video_encoder_args(encoder),
                 "-pix_fmt", "yuv420p",
                 "-profile:v", "main", "-level", "4.0",
                 "-movflags", "+faststart",
-                "-c:a", "aac", "-b:a", "192k",
+                *self._audio_codec_args(audio_path),
                 "-shortest", "-t", str(self.max_duration),
                 str(output_path),
             ]
@@ -208,13 +331,13 @@ class VideoRenderer:
                 "-filter_complex",
                 f"[0:v]scale={self.width}:{self.height}:force_original_aspect_ratio=increase,"
                 f"crop={self.width}:{self.height},"
-                f"subtitles={self._escape_path(subtitle_path)}[outv]",
+                f"{self._subtitle_filter(subtitle_path)}[outv]",
                 "-map", "[outv]", "-map", "1:a",
-                "-c:v", "libx264", "-preset", "medium", "-crf", "23",
+                *self._video_encoder_args(encoder),
                 "-pix_fmt", "yuv420p",
                 "-profile:v", "main", "-level", "4.0",
                 "-movflags", "+faststart",
-                "-c:a", "aac", "-b:a", "192k",
+                *self._audio_codec_args(audio_path),
                 "-shortest", "-t", str(self.max_duration),
                 str(output_path),
             ]
@@ -227,12 +350,13 @@ class VideoRenderer:
         subtitle_path: Path,
         background_path: Path,
         output_path: Path,
+        encoder: str,
     ) -> Path:
         """Render with looping video background."""
         # FFmpeg command for video background
         # -stream_loop -1: loop the background video indefinitely
         # -shortest: stop when the shortest input (audio) ends
-        # -vf "subtitles=...": burn in ASS subtitles using libass
+        # "ass=...": burn in ASS subtitles using libass
         cmd = [
             "ffmpeg",
             "-y",  # Overwrite output
@@ -242,17 +366,14 @@ class VideoRenderer:
             "-filter_complex",
             f"[0:v]scale={self.width}:{self.height}:force_original_aspect_ratio=increase,"
             f"crop={self.width}:{self.height},"
-            f"subtitles={self._escape_path(subtitle_path)}[outv]",
+            f"{self._subtitle_filter(subtitle_path)}[outv]",
             "-map", "[outv]",  # Use filtered video
             "-map", "1:a",  # Use audio from second input
-            "-c:v", "libx264",
-            "-preset", "medium",
-            "-crf", "23",
+            *self._video_encoder_args(encoder),
             "-pix_fmt", "yuv420p",
             "-profile:v", "main", "-level", "4.0",
             "-movflags", "+faststart",
-            "-c:a", "aac",
-            "-b:a", "192k",
+            *self._audio_codec_args(audio_path),
             "-shortest",  # End when audio ends
             "-t", str(self.max_duration),  # Max duration limit
             str(output_path),
@@ -265,38 +386,58 @@ class VideoRenderer:
         audio_path: Path,
         subtitle_path: Path,
         output_path: Path,
+        encoder: str,
     ) -> Path:
         """Render with solid color background."""
-        # Get audio duration first
-        duration = self._get_audio_duration(audio_path)
-        duration = min(duration, self.max_duration)
-
         # FFmpeg command for solid background
-        # Use color source for background
+        # Use an unbounded color source; -shortest and -t cut it to the audio
         cmd = [
             "ffmpeg",
             "-y",  # Overwrite output
             "-f", "lavfi",
-            "-i", f"color=c={self.bg_color.replace('#', '0x')}:s={self.width}x{self.height}:d={duration}",
+            "-i", f"color=c={self.bg_color.replace('#', '0x')}:s={self.width}x{self.height}:r=30",
             "-i", str(audio_path),  # Audio input
             "-filter_complex",
-            f"[0:v]subtitles={self._escape_path(subtitle_path)}[outv]",
+            f"[0:v]{self._subtitle_filter(subtitle_path)}[outv]",
             "-map", "[outv]",
             "-map", "1:a",
-            "-c:v", "libx264",
-            "-preset", "medium",
-            "-crf", "23",
+            *self._video_encoder_args(encoder),
             "-pix_fmt", "yuv420p",
             "-profile:v", "main", "-level", "4.0",
             "-movflags", "+faststart",
-            "-c:a", "aac",
-            "-b:a", "192k",
-            "-shortest",
+            *self._audio_codec_args(audio_path),
+            "-shortest", "-t", str(self.max_duration),
             str(output_path),
         ]
 
         return self._run_ffmpeg(cmd, output_path)
 
+    @property
+    def encoder(self) -> str:
+        """H.264 encoder for renders (settings.video_encoder, with "auto" resolved)."""
+        if self._encoder is None:
+            self._encoder = self._detect_hw_encoder() if settings.video_encoder == "auto" else settings.video_encoder
+            logger.info(f"Video encoder: {self._encoder}")
+        return self._encoder
+
+    def _detect_hw_encoder(self) -> str:
+        """Pick the first hardware H.264 encoder that passes a test encode, else libx264."""
+        available = _available_encoders()
+        return next(
+            (name for name in HW_ENCODER_ARGS if name in available and _encoder_works(name)),
+            "libx264",
+        )
+
+    def _video_encoder_args(self, encoder: str) -> list[str]:
+        """Video codec arguments shared by every render path."""
+        if encoder == "libx264":
+            return [
+                "-c:v", "libx264", "-preset", self.preset, "-crf", "23",
+                "-threads", "0",
+                "-x264-params", X264_THREAD_PARAMS,
+            ]
+        return ["-c:v", encoder, *HW_ENCODER_ARGS.get(encoder, [])]
+
     def _run_ffmpeg(self, cmd: list[str], output_path: Path) -> Path:
         """
         Execute FFmpeg command.
@@ -315,16 +456,30 @@ class VideoRenderer:
         logger.debug(f"Full command: {' '.join(cmd)}")
 
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
+            # No progress stats; stderr drained into a bounded tail instead of held in full
+            proc = subprocess.Popen(
+                [cmd[0], "-nostats", "-loglevel", "error", *cmd[1:]],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
-                timeout=300,  # 5 minute timeout
+                errors="replace",
             )
-
-            if result.returncode != 0:
-                logger.error(f"FFmpeg stderr: {result.stderr}")
-                raise RuntimeError(f"FFmpeg failed with code {result.returncode}")
+            stderr_tail: deque[str] = deque(maxlen=FFMPEG_STDERR_TAIL_LINES)
+            reader = threading.Thread(target=stderr_tail.extend, args=(proc.stderr,), daemon=True)
+            reader.start()
+            try:
+                returncode = proc.wait(timeout=300)  # 5 minute timeout
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+                raise
+            finally:
+                reader.join()
+                proc.stderr.close()
+
+            if returncode != 0:
+                logger.error(f"FFmpeg stderr: {''.join(stderr_tail)}")
+                raise RuntimeError(f"FFmpeg failed with code {returncode}")
 
             if not output_path.exists():
                 raise RuntimeError(f"FFmpeg completed but output file not found: {output_path}")
@@ -338,7 +493,11 @@ class VideoRenderer:
             raise RuntimeError("FFmpeg not found. Is it installed?")
 
     def _get_audio_duration(self, audio_path: Path) -> float:
-        """Get duration of audio file in seconds."""
+        """Get duration of audio file in seconds (cached in a sidecar next to the audio)."""
+        meta = self._read_audio_meta(audio_path)
+        if "duration" in meta:
+            return meta["duration"]
+
         cmd = [
             "ffprobe",
             "-v", "error",
@@ -349,11 +508,65 @@ class VideoRenderer:
 
         try:
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-            return float(result.stdout.strip())
+            duration = float(result.stdout.strip())
         except Exception as e:
             logger.warning(f"Could not get audio duration: {e}")
             return self.max_duration
 
+        self._write_audio_meta(audio_path, {**meta, "duration": duration})
+        return duration
+
+    def _audio_codec_args(self, audio_path: Path) -> list[str]:
+        """
+        Audio codec arguments: stream-copy AAC input, otherwise encode AAC 192k.
+
+        Decided from the file extension, without probing: the pipeline's own
+        MP3 mix always needs transcoding, since MP4 players expect AAC.
+        """
+        if audio_path.suffix.lower() in AAC_SUFFIXES:
+            return ["-c:a", "copy"]
+        return list(AAC_ENCODE_ARGS)
+
+    @staticmethod
+    def _audio_meta_path(audio_path: Path) -> Path:
+        return audio_path.with_name(audio_path.name + ".meta.json")
+
+    def _read_audio_meta(self, audio_path: Path) -> dict:
+        """Cached ffprobe results for audio_path, or {} if missing or stale."""
+        try:
+            stat = audio_path.stat()
+            stored = json.loads(self._audio_meta_path(audio_path).read_bytes())
+        except (OSError, ValueError):
+            return {}
+        # Keyed on size + mtime, so a re-rendered file at the same path is re-probed
+        if stored.get("size") != stat.st_size or stored.get("mtime_ns") != stat.st_mtime_ns:
+            return {}
+        return stored.get("probe", {})
+
+    def _write_audio_meta(self, audio_path: Path, probe: dict) -> None:
+        """Store ffprobe results for audio_path in its sidecar (best effort)."""
+        meta_path = self._audio_meta_path(audio_path)
+        tmp_path = meta_path.with_name(meta_path.name + ".tmp")
+        try:
+            stat = audio_path.stat()
+            tmp_path.write_text(json.dumps({"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "probe": probe}))
+            os.replace(tmp_path, meta_path)
+        except OSError as e:
+            logger.debug(f"Could not cache audio metadata for {audio_path}: {e}")
+
+    def _subtitle_filter(self, subtitle_path: Path) -> str:
+        """
+        libass filter burning in the ASS subtitles.
+
+        Uses the lighter ass filter rather than subtitles (no subtitle
+        demuxer/decoder), and points libass at the bundled fonts so the
+        subtitle font resolves without a system-wide fontconfig lookup.
+        """
+        filter_str = f"ass={self._escape_path(subtitle_path)}"
+        if settings.fonts_dir.is_dir():
+            filter_str += f":fontsdir={self._escape_path(settings.fonts_dir)}"
+        return filter_str
+
     def _escape_path(self, path: Path) -> str:
         """
         Escape path for FFmpeg filter syntax.
@@ -392,7 +605,6 @@ class VideoRenderer:
         ]
 
         try:
-            import json
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
             return json.loads(result.stdout)
         except Exception as e:
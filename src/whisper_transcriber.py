@@ -1,7 +1,14 @@
 """Whisper-based word-level transcription for karaoke subtitles."""
 
+import hashlib
+import json
+import os
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
 
 from openai import OpenAI
 
@@ -10,8 +17,10 @@ from .utils import get_logger, openai_retry
 
 logger = get_logger(__name__)
 
+WHISPER_MODEL = "whisper-1"
 
-@dataclass
+
+@dataclass(slots=True)
 class WordTimestamp:
     """A single word with timing relative to segment start."""
 
@@ -25,7 +34,7 @@ class WordTimestamp:
         return max(1, round((self.end_s - self.start_s) * 100))
 
 
-@dataclass
+@dataclass(slots=True)
 class SegmentTranscription:
     """Whisper transcription result for one audio segment."""
 
@@ -41,8 +50,9 @@ class SegmentTranscription:
 class WhisperTranscriber:
     """Transcribes audio segments via OpenAI Whisper for word-level timestamps."""
 
-    def __init__(self, client: OpenAI | None = None):
+    def __init__(self, client: OpenAI | None = None, cache_dir: Optional[Path] = None):
         self.client = client or OpenAI(api_key=settings.openai_api_key)
+        self.cache_dir = cache_dir or settings.temp_dir / "whisper"
 
     def transcribe_all(self, segment_infos) -> list[SegmentTranscription]:
         """
@@ -54,42 +64,102 @@ class WhisperTranscriber:
         Returns:
             List of SegmentTranscription with word timestamps
         """
-        results = []
+        return list(self.iter_transcriptions(segment_infos))
+
+    def iter_transcriptions(self, segment_infos) -> Iterator[SegmentTranscription]:
+        """
+        Yield segment transcriptions in order as each one completes.
+
+        Segments are transcribed concurrently (up to settings.whisper_concurrency
+        requests in flight) but yielded in input order, so a consumer (e.g.
+        the subtitle writer) can process early segments while later ones are
+        still being transcribed. Segments whose file is missing or whose
+        transcription fails are skipped.
+
+        Args:
+            segment_infos: List of AudioSegmentInfo from audio engine
+
+        Yields:
+            SegmentTranscription with word timestamps
+        """
+        present = []
         for seg in segment_infos:
             if not seg.file_path.exists():
                 logger.warning(f"Segment file missing: {seg.file_path}, skipping")
                 continue
+            present.append(seg)
+
+        transcribed = 0
+        workers = max(1, min(settings.whisper_concurrency, len(present)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(self._transcribe_segment, seg) for seg in present]
             try:
-                transcription = self._transcribe_segment(seg)
-                results.append(transcription)
-            except Exception as e:
-                logger.warning(f"Whisper failed for segment '{seg.text[:30]}...': {e}")
-                continue
+                for seg, future in zip(present, futures):
+                    try:
+                        transcription = future.result()
+                    except Exception as e:
+                        logger.warning(f"Whisper failed for segment '{seg.text[:30]}...': {e}")
+                        continue
+                    transcribed += 1
+                    yield transcription
+            finally:
+                # Consumer stopped early: don't start the remaining requests
+                for future in futures:
+                    future.cancel()
+
+        logger.info(f"Whisper transcribed {transcribed}/{len(segment_infos)} segments")
+
+    def _transcribe_segment(self, seg) -> SegmentTranscription:
+        """Transcribe a single audio segment, reusing a cached result for identical audio."""
+        cache_path = self._cache_path(seg.file_path)
+        words = self._load_cached(cache_path)
+        if words is None:
+            words = self._request_words(seg.file_path)
+            self._store_cached(cache_path, words)
 
-        logger.info(f"Whisper transcribed {len(results)}/{len(segment_infos)} segments")
-        return results
+        return SegmentTranscription(
+            speaker=seg.speaker,
+            segment_start_ms=seg.start_ms,
+            words=words,
+        )
+
+    def _cache_path(self, file_path: Path) -> Path:
+        """Content-address a segment's transcription by its audio bytes."""
+        with open(file_path, "rb") as f:
+            digest = hashlib.file_digest(f, "blake2b").hexdigest()[:16]
+        return self.cache_dir / f"{WHISPER_MODEL}_{digest}.json"
+
+    def _load_cached(self, cache_path: Path) -> Optional[list[WordTimestamp]]:
+        """Load cached word timestamps, or None on miss/corruption."""
+        try:
+            data = json.loads(cache_path.read_bytes())
+            return [WordTimestamp(word, start_s, end_s) for word, start_s, end_s in data["words"]]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable Whisper cache {cache_path.name}: {e}")
+            return None
+
+    def _store_cached(self, cache_path: Path, words: list[WordTimestamp]) -> None:
+        """Write word timestamps to the cache (temp file + rename)."""
+        payload = {"words": [[w.word, w.start_s, w.end_s] for w in words]}
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(payload, separators=(",", ":")))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Failed to cache Whisper transcription: {e}")
 
     @openai_retry
-    def _transcribe_segment(self, seg) -> SegmentTranscription:
-        """Transcribe a single audio segment via Whisper API."""
-        with open(seg.file_path, "rb") as audio_file:
+    def _request_words(self, file_path: Path) -> list[WordTimestamp]:
+        """Transcribe one audio file via Whisper API."""
+        with open(file_path, "rb") as audio_file:
             response = self.client.audio.transcriptions.create(
-                model="whisper-1",
+                model=WHISPER_MODEL,
                 file=audio_file,
                 response_format="verbose_json",
                 timestamp_granularities=["word"],
             )
 
-        words = []
-        for w in getattr(response, "words", []) or []:
-            words.append(WordTimestamp(
-                word=w.word.strip(),
-                start_s=w.start,
-                end_s=w.end,
-            ))
-
-        return SegmentTranscription(
-            speaker=seg.speaker,
-            segment_start_ms=seg.start_ms,
-            words=words,
-        )
+        return [WordTimestamp(w.word.strip(), w.start, w.end) for w in getattr(response, "words", None) or ()]
@@ -0,0 +1,6 @@
+"""Shared test setup."""
+
+import os
+
+# Settings requires an API key at import time; tests never call the real API
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
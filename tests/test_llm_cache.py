@@ -0,0 +1,40 @@
+"""Tests for the SQLite-backed LLMCache."""
+
+from src.llm_cache import LLMCache
+
+
+def test_get_set_round_trip(tmp_path):
+    cache = LLMCache(tmp_path / "llm.db", ttl_days=1)
+    key = LLMCache.make_key(model="m", prompt="p")
+
+    assert cache.get(key) is None
+    cache.set(key, "completion")
+    assert cache.get(key) == "completion"
+
+
+def test_zero_ttl_disables_cache(tmp_path):
+    cache = LLMCache(tmp_path / "llm.db", ttl_days=0)
+    cache.set("k", "completion")
+
+    assert cache.get("k") is None
+    assert not (tmp_path / "llm.db").exists()
+
+
+def test_make_key_is_stable_and_order_independent():
+    key = LLMCache.make_key(model="m", prompt="p", temperature=0.2)
+
+    assert key == LLMCache.make_key(temperature=0.2, prompt="p", model="m")
+    assert key != LLMCache.make_key(model="m", prompt="p", temperature=0.3)
+
+
+def test_get_similar_respects_threshold_and_namespace(tmp_path):
+    cache = LLMCache(tmp_path / "llm.db", ttl_days=1)
+    cache.set("k", "completion")
+    cache.set_embedding("k", [1.0, 0.0], namespace="ns")
+
+    # cos = 0.8 against the stored [1, 0]
+    near = [0.8, 0.6]
+    assert cache.get_similar(near, namespace="ns", threshold=0.75) == "completion"
+    assert cache.get_similar(near, namespace="ns", threshold=0.85) is None
+    assert cache.get_similar(near, namespace="other", threshold=0.0) is None
+    assert cache.get_similar([1.0, 0.0, 0.0], namespace="ns", threshold=0.0) is None
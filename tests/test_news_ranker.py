@@ -0,0 +1,67 @@
+"""Tests for NewsRanker's candidate-set cache."""
+
+import json
+from types import SimpleNamespace
+
+from src.llm_cache import LLMCache
+from src.news_ranker import NewsRanker
+from src.scraper import NewsItem
+
+
+def _items():
+    return [
+        NewsItem(title="A", source="s", url="https://example.com/a"),
+        NewsItem(title="B", source="s", url="https://example.com/b"),
+        NewsItem(title="C", source="s"),
+    ]
+
+
+class _FakeCompletions:
+    def __init__(self, content: str):
+        self.content = content
+        self.calls = 0
+
+    def create(self, **kwargs):
+        self.calls += 1
+        message = SimpleNamespace(content=self.content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def _ranker(tmp_path, content: str = '{"score": 7, "reasoning": "structural"}') -> NewsRanker:
+    client = SimpleNamespace(chat=SimpleNamespace(completions=_FakeCompletions(content)))
+    return NewsRanker(client=client, llm_cache=LLMCache(path=tmp_path / "cache.db", ttl_days=1))
+
+
+def test_cache_key_is_order_independent(tmp_path):
+    ranker = _ranker(tmp_path)
+    items = _items()
+    assert ranker._cache_key(items) == ranker._cache_key(list(reversed(items)))
+    assert ranker._cache_key(items) != ranker._cache_key(items[:2])
+
+
+def test_partial_cached_set_is_a_miss(tmp_path):
+    ranker = _ranker(tmp_path)
+    items = _items()
+    key = ranker._cache_key(items)
+    partial = {ranker._item_key(item): [6.0, "cached"] for item in items[:2]}
+    ranker.llm_cache.set(key, json.dumps(partial))
+    assert ranker._rankings_from_cache(items, key) is None
+
+
+def test_complete_ranking_is_served_from_cache(tmp_path):
+    ranker = _ranker(tmp_path)
+    items = _items()
+    first = ranker.rank_by_financial_impact(items, top_n=3)
+    assert ranker.client.chat.completions.calls == 3
+
+    second = ranker.rank_by_financial_impact(list(reversed(items)), top_n=3)
+    assert ranker.client.chat.completions.calls == 3
+    assert sorted(r.item.title for r in second) == sorted(r.item.title for r in first)
+
+
+def test_unparsed_scores_are_not_cached(tmp_path):
+    ranker = _ranker(tmp_path, content='{"reasoning": "no score given"}')
+    items = _items()
+    rankings = ranker.rank_by_financial_impact(items, top_n=3)
+    assert all(r.score == 5.0 for r in rankings)
+    assert ranker.llm_cache.get(ranker._cache_key(items)) is None
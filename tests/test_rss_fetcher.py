@@ -0,0 +1,51 @@
+"""Tests for the RSS fetcher's SQLite feed cache."""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+from src.rss.rss_fetcher import FeedCache, RSSFetcher
+
+
+def _fetcher(cache_dir) -> RSSFetcher:
+    bundles = SimpleNamespace(get_all_feed_urls=lambda: ["https://example.com/feed"])
+    return RSSFetcher(bundles, cache_dir=cache_dir)
+
+
+def _entry(url: str = "https://example.com/feed") -> FeedCache:
+    return FeedCache(
+        url=url,
+        etag='"abc"',
+        last_modified="Mon, 01 Jan 2024 00:00:00 GMT",
+        items=[{"title": "Story", "link": "https://example.com/story"}],
+        fetched_at=datetime(2024, 1, 1, 12, 0, 0),
+    )
+
+
+def test_cache_round_trip_survives_reopen(tmp_path):
+    with _fetcher(tmp_path) as fetcher:
+        assert fetcher._load_cache("https://example.com/feed") is None
+        fetcher._save_cache(_entry())
+
+    with _fetcher(tmp_path) as fetcher:
+        cached = fetcher._load_cache("https://example.com/feed")
+
+    assert cached == _entry()
+
+
+def test_batched_writes_land_on_flush(tmp_path):
+    with _fetcher(tmp_path) as fetcher:
+        fetcher._pending_writes = []
+        fetcher._save_cache(_entry("https://example.com/a"))
+        fetcher._save_cache(_entry("https://example.com/b"))
+        assert fetcher._load_cache("https://example.com/a") is None
+
+        fetcher._flush_cache_writes()
+        assert fetcher._load_cache("https://example.com/a") == _entry("https://example.com/a")
+        assert fetcher._load_cache("https://example.com/b") == _entry("https://example.com/b")
+
+
+def test_clear_cache(tmp_path):
+    with _fetcher(tmp_path) as fetcher:
+        fetcher._save_cache(_entry())
+        fetcher.clear_cache()
+        assert fetcher._load_cache("https://example.com/feed") is None
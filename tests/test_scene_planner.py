@@ -0,0 +1,21 @@
+"""Tests for the scene planner's fallback sentence splitting."""
+
+from src.scene_planner import _first_sentences
+
+
+def test_decimals_are_not_split():
+    text = "Model throughput rose 3.2x over baseline. GPT-4.5 was the strongest model tested."
+    assert _first_sentences(text, 3) == [
+        "Model throughput rose 3.2x over baseline",
+        "GPT-4.5 was the strongest model tested",
+    ]
+
+
+def test_at_most_n_sentences():
+    text = "One. Two! Three? Four. Five."
+    assert _first_sentences(text, 3) == ["One", "Two!", "Three?"]
+
+
+def test_line_breaks_and_blank_text():
+    assert _first_sentences("First line\nSecond line.\n\nThird", 3) == ["First line", "Second line", "Third"]
+    assert _first_sentences("", 3) == []
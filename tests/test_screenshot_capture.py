@@ -0,0 +1,39 @@
+"""Tests for the screenshot SSRF guard."""
+
+import ipaddress
+
+from src.screenshot_capture import _build_ranges, _in_ranges, _is_blocked_ip
+
+
+def _blocked(networks, address: str) -> bool:
+    ip = ipaddress.ip_address(address)
+    return _in_ranges(_build_ranges(networks, ip.version), int(ip))
+
+
+def test_nested_range_does_not_hide_outer_range():
+    networks = [ipaddress.ip_network("10.0.0.0/8"), ipaddress.ip_network("10.1.0.0/16")]
+    # Past the end of the nested /16 but still inside the outer /8
+    assert _blocked(networks, "10.2.0.1")
+    assert _blocked(networks, "10.1.2.3")
+    assert _blocked(networks, "10.255.255.255")
+    assert not _blocked(networks, "11.0.0.0")
+
+
+def test_overlapping_and_adjacent_ranges_are_merged():
+    networks = [
+        ipaddress.ip_network("192.168.0.0/24"),
+        ipaddress.ip_network("192.168.1.0/24"),
+        ipaddress.ip_network("192.168.0.128/25"),
+    ]
+    assert _build_ranges(networks, 4) == (
+        [int(ipaddress.ip_address("192.168.0.0"))],
+        [int(ipaddress.ip_address("192.168.1.255"))],
+    )
+
+
+def test_default_blocklist():
+    assert _is_blocked_ip(ipaddress.ip_address("169.254.169.254"))
+    assert _is_blocked_ip(ipaddress.ip_address("::ffff:127.0.0.1"))
+    assert _is_blocked_ip(ipaddress.ip_address("fd00::1"))
+    assert not _is_blocked_ip(ipaddress.ip_address("8.8.8.8"))
+    assert not _is_blocked_ip(ipaddress.ip_address("2001:4860:4860::8888"))
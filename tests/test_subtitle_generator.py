@@ -0,0 +1,14 @@
+"""Tests for ASS timestamp formatting."""
+
+from src.subtitle_generator import ms_to_ass_time
+
+
+def test_ms_to_ass_time_formats_centiseconds():
+    assert ms_to_ass_time(0) == "0:00:00.00"
+    assert ms_to_ass_time(61234) == "0:01:01.23"
+    assert ms_to_ass_time(61236) == "0:01:01.24"
+
+
+def test_ms_to_ass_time_rounds_into_next_minute_and_hour():
+    assert ms_to_ass_time(59995) == "0:01:00.00"
+    assert ms_to_ass_time(3599995) == "1:00:00.00"
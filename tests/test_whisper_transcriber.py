@@ -0,0 +1,47 @@
+"""Tests for the Whisper transcription cache."""
+
+from types import SimpleNamespace
+
+from src.whisper_transcriber import WhisperTranscriber, WordTimestamp
+
+
+def _transcriber(tmp_path) -> WhisperTranscriber:
+    return WhisperTranscriber(client=SimpleNamespace(), cache_dir=tmp_path / "whisper")
+
+
+def test_cache_key_follows_audio_bytes(tmp_path):
+    transcriber = _transcriber(tmp_path)
+    a = tmp_path / "a.mp3"
+    b = tmp_path / "b.mp3"
+    c = tmp_path / "c.mp3"
+    a.write_bytes(b"audio")
+    b.write_bytes(b"audio")
+    c.write_bytes(b"other audio")
+
+    assert transcriber._cache_path(a) == transcriber._cache_path(b)
+    assert transcriber._cache_path(a) != transcriber._cache_path(c)
+
+
+def test_cache_round_trip(tmp_path):
+    transcriber = _transcriber(tmp_path)
+    audio = tmp_path / "a.mp3"
+    audio.write_bytes(b"audio")
+    cache_path = transcriber._cache_path(audio)
+    words = [WordTimestamp("hello", 0.0, 0.4), WordTimestamp("world", 0.4, 0.9)]
+
+    assert transcriber._load_cached(cache_path) is None
+    transcriber._store_cached(cache_path, words)
+    assert transcriber._load_cached(cache_path) == words
+    assert list(transcriber.cache_dir.glob("*.tmp")) == []
+
+
+def test_corrupt_cache_is_a_miss(tmp_path):
+    transcriber = _transcriber(tmp_path)
+    transcriber.cache_dir.mkdir()
+    cache_path = transcriber.cache_dir / "corrupt.json"
+
+    cache_path.write_text("{not json")
+    assert transcriber._load_cached(cache_path) is None
+
+    cache_path.write_text('{"words": [["hello", 0.0]]}')
+    assert transcriber._load_cached(cache_path) is None